@@ -1,13 +1,13 @@
 """Suppoort for Ariston."""
-import copy
+import asyncio
+import hashlib
 import json
 import logging
-import threading
+import os
 import time
 from datetime import timedelta
 
 import homeassistant.helpers.config_validation as cv
-import requests
 import voluptuous as vol
 from homeassistant.components.binary_sensor import DOMAIN as BINARY_SENSOR
 from homeassistant.components.climate import DOMAIN as CLIMATE
@@ -22,11 +22,22 @@ from homeassistant.const import (
     CONF_SENSORS,
     CONF_SWITCHES,
     CONF_USERNAME,
+    EVENT_HOMEASSISTANT_CLOSE,
+    EVENT_HOMEASSISTANT_STOP,
 )
+from homeassistant.core import callback
 from homeassistant.helpers import discovery
+from homeassistant.helpers.aiohttp_client import SERVER_SOFTWARE
 from homeassistant.helpers.dispatcher import dispatcher_send
-from homeassistant.helpers.event import track_point_in_time
+from homeassistant.helpers.event import async_track_point_in_time, track_point_in_time
 from homeassistant.util import dt as dt_util
+from homeassistant.util.async_ import run_callback_threadsafe
+
+try:
+    # TLS settings of Home Assistant are used when available, otherwise default context of aiohttp
+    from homeassistant.util.ssl import client_context
+except ImportError:
+    client_context = None
 
 from .binary_sensor import BINARY_SENSORS
 from .const import (
@@ -55,6 +66,31 @@ from .const import (
     CONF_INIT_AT_START,
     CONF_DHW_FLAME_UNKNOWN_ON,
     CONF_DHW_AND_CH,
+    CONF_PARALLEL_CYCLE,
+    CONF_PARALLEL_REQUESTS,
+    CONF_ADAPTIVE_POLLING,
+    CONF_ADAPTIVE_POLLING_MIN,
+    CONF_ADAPTIVE_POLLING_MAX,
+    CONF_PUSH_UPDATES,
+    CONF_STATE_CACHE,
+    CONF_HTTP_POOL_SIZE,
+    CONF_HTTP_KEEP_ALIVE,
+    CONF_RATE_LIMIT,
+    CONF_RATE_LIMIT_BURST,
+    CONF_HTTP_RETRIES,
+    CONF_SERVER_URL,
+    REQUEST_GET_MAIN,
+    REQUEST_GET_CH,
+    REQUEST_GET_DHW,
+    REQUEST_GET_ERROR,
+    REQUEST_GET_GAS,
+    REQUEST_GET_OTHER,
+    REQUEST_GET_UNITS,
+    REQUEST_GET_CURRENCY,
+    REQUEST_DIAGNOSTICS,
+    REQUEST_GET_VERSION,
+    RATE_LIMITERS,
+    SESSIONS,
     DATA_ARISTON,
     DAYS_OF_WEEK,
     DEVICES,
@@ -100,28 +136,50 @@ from .const import (
     WATER_HEATERS,
     LANG_EN,
     LANG_LIST,
-    GET_REQUEST_CH_PROGRAM,
-    GET_REQUEST_CURRENCY,
-    GET_REQUEST_DHW_PROGRAM,
-    GET_REQUEST_ERRORS,
-    GET_REQUEST_GAS,
-    GET_REQUEST_MAIN,
-    GET_REQUEST_PARAM,
-    GET_REQUEST_UNITS,
-    GET_REQUEST_VERSION,
-    SET_REQUEST_MAIN,
-    SET_REQUEST_PARAM,
-    SET_REQUEST_UNITS,
 )
 from .exceptions import CommError, LoginError, AristonError
-from .helpers import service_signal
+from .helpers import get_request_for_parameter, service_signal
 from .sensor import SENSORS
 from .switch import SWITCHES
+from .transport import (
+    AristonSession,
+    RateLimiter,
+    RequestMetrics,
+    OUTCOME_ERROR,
+    OUTCOME_HTTP_ERROR,
+    OUTCOME_INVALID_JSON,
+    OUTCOME_OK,
+    OUTCOME_TIMEOUT,
+    OUTCOME_ZERO_TEMPERATURE,
+    CircuitBreaker,
+    PRIORITY_LOW,
+    PRIORITY_MAIN,
+    PRIORITY_PARAM,
+    PRIORITY_SET,
+)
 
 """HTTP_RETRY_INTERVAL is time between 2 GET requests. Note that it often takes more than 10 seconds to properly fetch data, also potential login"""
-"""MAX_ERRORS is number of errors for device to become not available"""
+"""HTTP_BREAKER_THRESHOLD is number of consecutive errors after which only single probe request is sent every
+HTTP_BREAKER_OPEN_TIME seconds, the time doubles after each failed probe until HTTP_BREAKER_OPEN_MAX. Device becomes not
+available when probe fails"""
+"""HTTP_GROUP_BREAKER_THRESHOLD is number of consecutive errors of request group, other than main data and parameters,
+after which the group is fetched only once in HTTP_GROUP_BREAKER_OPEN_TIME seconds, the time doubles after each failure
+until HTTP_GROUP_BREAKER_OPEN_MAX"""
 """HTTP_TIMEOUT_LOGIN is timeout for login procedure"""
 """HTTP_TIMEOUT_GET is timeout to get data (can increase restart time in some cases). For tested environment often around 10 seconds, rarely above 15"""
+"""HTTP_PARALLEL_CYCLE_MULTIPLY is number of request delays between parallel cycles"""
+"""HTTP_SET_COALESCE_WINDOW is time in seconds during which changes are collected to be set within one attempt"""
+"""HTTP_SET_CONFIRM_DELAY is time in seconds after set request to read changed data, it grows HTTP_SET_CONFIRM_BACKOFF
+times until HTTP_SET_CONFIRM_MAX while changes are not confirmed"""
+"""STATE_CACHE_DELAY is time in seconds after fetching of data during which other fetched data is collected to be stored
+on disk with one write"""
+"""HTTP_SESSION_REFRESH is age of account login in seconds after which login is renewed in the background, age is
+checked every HTTP_SESSION_CHECK seconds"""
+"""HTTP_INIT_DEADLINE is time in seconds Home Assistant start waits for initial data of all devices, which are fetched
+concurrently"""
+"""HTTP_ADAPTIVE_BACKOFF is factor to change polling interval of request group in adaptive polling"""
+"""HTTP_RATE_LIMIT_WINDOW is time in seconds in which number of requests of one account is limited by rate_limit, lower
+priority requests waiting longer than polling delay are postponed"""
 
 ARISTON_URL = "https://www.ariston-net.remotethermo.com"
 GITHUB_LATEST_RELEASE = 'https://api.github.com/repos/chomupashchuk/ariston-remotethermo-home-assistant/releases/latest'
@@ -130,13 +188,18 @@ DEFAULT_HVAC = VAL_SUMMER
 DEFAULT_POWER_ON = VAL_SUMMER
 DEFAULT_NAME = "Ariston"
 DEFAULT_MAX_RETRIES = 1
+DEFAULT_PARALLEL_REQUESTS = 3
+DEFAULT_ADAPTIVE_POLLING_MIN = 120
+DEFAULT_ADAPTIVE_POLLING_MAX = 1200
+DEFAULT_HTTP_POOL_SIZE = 4
+DEFAULT_HTTP_KEEP_ALIVE = 60
+DEFAULT_RATE_LIMIT = 12
+DEFAULT_RATE_LIMIT_BURST = 4
+DEFAULT_HTTP_RETRIES = 1
 DEFAULT_TIME = "00:00"
 DEFAULT_MODES = [0, 1, 5]
 DEFAULT_CH_MODES = [2, 3]
-MAX_ERRORS = 10
-MAX_ERRORS_TIMER_EXTEND = 5
 MAX_ZERO_TOLERANCE = 10
-HTTP_DELAY_MULTIPLY = 3
 HTTP_TIMER_SET_LOCK = 25
 HTTP_TIMER_SET_WAIT = 30
 HTTP_TIMEOUT_LOGIN = 5.0
@@ -144,22 +207,89 @@ HTTP_TIMEOUT_GET_LONG = 16.0
 HTTP_TIMEOUT_GET_MEDIUM = 10.0
 HTTP_TIMEOUT_GET_SHORT = 6.0
 HTTP_PARAM_DELAY = 30.0
+HTTP_PARALLEL_CYCLE_MULTIPLY = 2
+HTTP_RATE_LIMIT_WINDOW = 60.0
+HTTP_ADAPTIVE_BACKOFF = 2.0
+HTTP_BREAKER_THRESHOLD = 5
+HTTP_BREAKER_OPEN_TIME = 60.0
+HTTP_BREAKER_OPEN_MAX = 600.0
+HTTP_GROUP_BREAKER_THRESHOLD = 2
+HTTP_GROUP_BREAKER_OPEN_TIME = 120.0
+HTTP_GROUP_BREAKER_OPEN_MAX = 1800.0
+HTTP_INIT_DEADLINE = 35.0
+HTTP_SESSION_REFRESH = 1200
+HTTP_SESSION_CHECK = 60
+HTTP_SET_COALESCE_WINDOW = 1.0
+HTTP_SET_CONFIRM_DELAY = 2.0
+HTTP_SET_CONFIRM_BACKOFF = 2.0
+HTTP_SET_CONFIRM_MAX = 16.0
+
+STATE_CACHE_DELAY = 60
 
 UNKNOWN_TEMP = 0.0
 UNKNOWN_UNITS = 3276
-REQUEST_GET_MAIN = "_get_main"
-REQUEST_GET_CH = "_get_ch"
-REQUEST_GET_DHW = "_get_dhw"
-REQUEST_GET_ERROR = "_get_error"
-REQUEST_GET_GAS = "_get_gas"
-REQUEST_GET_OTHER = "_get_param"
-REQUEST_GET_UNITS = "_get_units"
-REQUEST_GET_CURRENCY = "_get_currency"
-REQUEST_GET_VERSION = "_get_version"
 
 REQUEST_SET_MAIN = "_set_main"
 REQUEST_SET_OTHER = "_set_param"
 REQUEST_SET_UNITS = "_set_units"
+REQUEST_LOGIN = "_login"
+# order of request groups within parallel cycle, main data is always fetched first
+REQUEST_GET_HIGH_PRIO = [REQUEST_GET_MAIN, REQUEST_GET_OTHER, REQUEST_GET_ERROR]
+REQUEST_GET_LOW_PRIO = [REQUEST_GET_UNITS, REQUEST_GET_CH, REQUEST_GET_DHW, REQUEST_GET_GAS, REQUEST_GET_CURRENCY,
+                        REQUEST_GET_VERSION]
+# request groups which are always polled with usual rate even if adaptive polling is used
+REQUEST_GET_NOT_ADAPTIVE = [REQUEST_GET_MAIN, REQUEST_GET_OTHER]
+# request groups which define availability of the plant, errors of other groups only slow down their own polling
+REQUEST_GET_PLANT_HEALTH = [REQUEST_GET_MAIN, REQUEST_GET_OTHER]
+# priority of requests within account rate limit, other request groups have the lowest one
+REQUEST_PRIORITY = {
+    REQUEST_LOGIN: PRIORITY_SET,
+    REQUEST_SET_MAIN: PRIORITY_SET,
+    REQUEST_SET_OTHER: PRIORITY_SET,
+    REQUEST_SET_UNITS: PRIORITY_SET,
+    REQUEST_GET_MAIN: PRIORITY_MAIN,
+    REQUEST_GET_OTHER: PRIORITY_PARAM,
+}
+# declarative mapping of set parameters: request group and path of keys within fetched data (parameters are keyed
+# by id), set request and id of parameter within set request of parameters
+SET_PARAM_MAPPING = {
+    PARAM_MODE: (REQUEST_GET_MAIN, ["mode"], REQUEST_SET_MAIN, None),
+    PARAM_CH_MODE: (REQUEST_GET_MAIN, ["zone", "mode", "value"], REQUEST_SET_MAIN, None),
+    PARAM_CH_SET_TEMPERATURE: (REQUEST_GET_MAIN, ["zone", "comfortTemp", "value"], REQUEST_SET_MAIN, None),
+    PARAM_DHW_SET_TEMPERATURE: (REQUEST_GET_MAIN, ["dhwTemp", "value"], REQUEST_SET_MAIN, None),
+    PARAM_DHW_COMFORT_TEMPERATURE: (REQUEST_GET_MAIN, ["dhwTimeProgComfortTemp", "value"], REQUEST_SET_OTHER,
+                                    ARISTON_DHW_TIME_PROG_COMFORT),
+    PARAM_DHW_ECONOMY_TEMPERATURE: (REQUEST_GET_MAIN, ["dhwTimeProgEconomyTemp", "value"], REQUEST_SET_OTHER,
+                                    ARISTON_DHW_TIME_PROG_ECONOMY),
+    PARAM_DHW_MODE: (REQUEST_GET_MAIN, ["dhwMode"], REQUEST_SET_MAIN, None),
+    PARAM_CH_COMFORT_TEMPERATURE: (REQUEST_GET_OTHER, [ARISTON_CH_COMFORT_TEMP, "value"], REQUEST_SET_OTHER,
+                                   ARISTON_CH_COMFORT_TEMP),
+    PARAM_CH_ECONOMY_TEMPERATURE: (REQUEST_GET_OTHER, [ARISTON_CH_ECONOMY_TEMP, "value"], REQUEST_SET_OTHER,
+                                   ARISTON_CH_ECONOMY_TEMP),
+    PARAM_DHW_COMFORT_FUNCTION: (REQUEST_GET_OTHER, [ARISTON_DHW_COMFORT_FUNCTION, "value"], REQUEST_SET_OTHER,
+                                 ARISTON_DHW_COMFORT_FUNCTION),
+    PARAM_INTERNET_TIME: (REQUEST_GET_OTHER, [ARISTON_INTERNET_TIME, "value"], REQUEST_SET_OTHER,
+                          ARISTON_INTERNET_TIME),
+    PARAM_INTERNET_WEATHER: (REQUEST_GET_OTHER, [ARISTON_INTERNET_WEATHER, "value"], REQUEST_SET_OTHER,
+                             ARISTON_INTERNET_WEATHER),
+    PARAM_CH_AUTO_FUNCTION: (REQUEST_GET_OTHER, [ARISTON_CH_AUTO_FUNCTION, "value"], REQUEST_SET_OTHER,
+                             ARISTON_CH_AUTO_FUNCTION),
+    PARAM_THERMAL_CLEANSE_CYCLE: (REQUEST_GET_OTHER, [ARISTON_THERMAL_CLEANSE_CYCLE, "value"], REQUEST_SET_OTHER,
+                                  ARISTON_THERMAL_CLEANSE_CYCLE),
+    PARAM_THERMAL_CLEANSE_FUNCTION: (REQUEST_GET_OTHER, [ARISTON_THERMAL_CLEANSE_FUNCTION, "value"], REQUEST_SET_OTHER,
+                                     ARISTON_THERMAL_CLEANSE_FUNCTION),
+    PARAM_UNITS: (REQUEST_GET_UNITS, ["measurementSystem"], REQUEST_SET_UNITS, None),
+}
+# fetched data of request groups kept in state cache, errors are not kept as only current ones matter
+REQUEST_GET_CACHED = {
+    REQUEST_GET_MAIN: "_ariston_data_actual",
+    REQUEST_GET_OTHER: "_ariston_other_data_actual",
+    REQUEST_GET_UNITS: "_ariston_units_actual",
+    REQUEST_GET_CH: "_ariston_ch_data_actual",
+    REQUEST_GET_DHW: "_ariston_dhw_data_actual",
+    REQUEST_GET_GAS: "_ariston_gas_data_actual",
+    REQUEST_GET_CURRENCY: "_ariston_currency_actual",
+}
 
 POLLING_RATE_TO_VALUE = {VAL_NORMAL: 1, VAL_LONG: 1.3}
 
@@ -185,6 +315,21 @@ ARISTON_SCHEMA = vol.Schema(
         vol.Optional(CONF_INIT_AT_START, default=True): cv.boolean,
         vol.Optional(CONF_DHW_FLAME_UNKNOWN_ON, default=False): cv.boolean,
         vol.Optional(CONF_DHW_AND_CH, default=False): cv.boolean,
+        vol.Optional(CONF_PARALLEL_CYCLE, default=False): cv.boolean,
+        vol.Optional(CONF_PARALLEL_REQUESTS, default=DEFAULT_PARALLEL_REQUESTS): vol.All(int, vol.Range(min=1, max=8)),
+        vol.Optional(CONF_ADAPTIVE_POLLING, default=False): cv.boolean,
+        vol.Optional(CONF_ADAPTIVE_POLLING_MIN, default=DEFAULT_ADAPTIVE_POLLING_MIN): vol.All(int, vol.Range(
+            min=30, max=86400)),
+        vol.Optional(CONF_ADAPTIVE_POLLING_MAX, default=DEFAULT_ADAPTIVE_POLLING_MAX): vol.All(int, vol.Range(
+            min=30, max=86400)),
+        vol.Optional(CONF_PUSH_UPDATES, default=False): cv.boolean,
+        vol.Optional(CONF_STATE_CACHE, default=False): cv.boolean,
+        vol.Optional(CONF_HTTP_POOL_SIZE, default=DEFAULT_HTTP_POOL_SIZE): vol.All(int, vol.Range(min=1, max=32)),
+        vol.Optional(CONF_HTTP_KEEP_ALIVE, default=DEFAULT_HTTP_KEEP_ALIVE): vol.All(int, vol.Range(min=0, max=300)),
+        vol.Optional(CONF_HTTP_RETRIES, default=DEFAULT_HTTP_RETRIES): vol.All(int, vol.Range(min=0, max=3)),
+        vol.Optional(CONF_RATE_LIMIT, default=DEFAULT_RATE_LIMIT): vol.All(int, vol.Range(min=1, max=60)),
+        vol.Optional(CONF_RATE_LIMIT_BURST, default=DEFAULT_RATE_LIMIT_BURST): vol.All(int, vol.Range(min=1, max=20)),
+        vol.Optional(CONF_SERVER_URL, default=ARISTON_URL): cv.url,
     }
 )
 
@@ -250,31 +395,42 @@ def _json_validator(data):
         return False
 
 
-def _get_request_for_parameter(data):
-    if data in GET_REQUEST_CH_PROGRAM:
-        return REQUEST_GET_CH
-    elif data in GET_REQUEST_CURRENCY:
-        return REQUEST_GET_CURRENCY
-    elif data in GET_REQUEST_DHW_PROGRAM:
-        return REQUEST_GET_DHW
-    elif data in GET_REQUEST_ERRORS:
-        return REQUEST_GET_ERROR
-    elif data in GET_REQUEST_GAS:
-        return REQUEST_GET_GAS
-    elif data in GET_REQUEST_PARAM:
-        return REQUEST_GET_OTHER
-    elif data in GET_REQUEST_UNITS:
-        return REQUEST_GET_UNITS
-    elif data in GET_REQUEST_VERSION:
-        return REQUEST_GET_VERSION
-    return REQUEST_GET_MAIN
+def _copy_on_write(data, path, value):
+    """Return copy of data with value replaced at path, only dictionaries and lists along the path are copied"""
+    if not path:
+        return value
+    if isinstance(data, list):
+        new_data = list(data)
+    else:
+        new_data = dict(data)
+    new_data[path[0]] = _copy_on_write(data[path[0]], path[1:], value)
+    return new_data
+
+
+def _index_param_data(data):
+    """Return parameters keyed by their id, order of parameters is kept"""
+    param_index = {}
+    try:
+        for param_item in data:
+            param_index[param_item["id"]] = param_item
+    except:
+        return {}
+    return param_index
+
+
+def _write_files(files):
+    """Write files for debugging, must be called from worker thread"""
+    for file_name, content in files.items():
+        try:
+            with open(file_name, 'wb' if isinstance(content, bytes) else 'w') as ariston_fetched:
+                ariston_fetched.write(content)
+        except:
+            pass
 
 
 def _set_request_for_parameter(data):
-    if data in SET_REQUEST_PARAM:
-        return REQUEST_SET_OTHER
-    elif data in SET_REQUEST_UNITS:
-        return REQUEST_SET_UNITS
+    if data in SET_PARAM_MAPPING:
+        return SET_PARAM_MAPPING[data][2]
     return REQUEST_SET_MAIN
 
 
@@ -292,8 +448,10 @@ class AristonChecker():
         self._ariston_dhw_data = {}
         self._ariston_currency = {}
         self._ariston_other_data = {}
+        self._ariston_other_param = {}
         self._ariston_units = {}
         # clear actual configuration data fetched from the server
+        # fetched data is not modified once visible, visible data shares it with pending set values copied on top
         self._ariston_data_actual = {}
         self._ariston_gas_data_actual = {}
         self._ariston_error_data_actual = {}
@@ -301,13 +459,19 @@ class AristonChecker():
         self._ariston_dhw_data_actual = {}
         self._ariston_currency_actual = {}
         self._ariston_other_data_actual = {}
+        self._ariston_other_param_actual = {}
         self._ariston_units_actual = {}
         # initiate all other data
-        self._data_lock = threading.Lock()
         self._device = device
         self._dhw_history = [UNKNOWN_TEMP, UNKNOWN_TEMP, UNKNOWN_TEMP, UNKNOWN_TEMP]
         self._dhw_trend_up = False
-        self._errors = 0
+        self._breaker = CircuitBreaker(HTTP_BREAKER_THRESHOLD, HTTP_BREAKER_OPEN_TIME, HTTP_BREAKER_OPEN_MAX)
+        self._group_breakers = {
+            request_type: CircuitBreaker(
+                HTTP_GROUP_BREAKER_THRESHOLD, HTTP_GROUP_BREAKER_OPEN_TIME, HTTP_GROUP_BREAKER_OPEN_MAX)
+            for request_type in REQUEST_GET_HIGH_PRIO + REQUEST_GET_LOW_PRIO
+            if request_type not in REQUEST_GET_PLANT_HEALTH
+        }
         self._get_request_number_low_prio = 0
         self._get_request_number_high_prio = 0
         self._get_time_start = {
@@ -343,13 +507,41 @@ class AristonChecker():
             PARAM_DHW_STORAGE_TEMPERATURE: UNKNOWN_TEMP
         }
         self._hass = hass
-        self._lock = threading.Lock()
         self._login = False
         self._name = name
         self._password = password
         self._plant_id = ""
-        self._plant_id_lock = threading.Lock()
-        self._session = requests.Session()
+        # http session and asyncio locks are created within event loop on first use
+        self._account = None
+        self._session = None
+        self._login_lock = None
+        self._request_semaphore = None
+        self._limiter = None
+        self._request_metrics = RequestMetrics()
+        self._cycle_running = False
+        # requests in progress per request group with flag if they may confirm set values
+        self._in_flight = {}
+        self._parallel_cycle = device[CONF_PARALLEL_CYCLE]
+        self._parallel_requests = device[CONF_PARALLEL_REQUESTS] if self._parallel_cycle else 1
+        # polling interval of each request group is adapted to observed change rate of its data
+        self._adaptive_polling = device[CONF_ADAPTIVE_POLLING]
+        self._adaptive_polling_min = min(device[CONF_ADAPTIVE_POLLING_MIN], device[CONF_ADAPTIVE_POLLING_MAX])
+        self._adaptive_polling_max = max(device[CONF_ADAPTIVE_POLLING_MIN], device[CONF_ADAPTIVE_POLLING_MAX])
+        self._get_interval = {}
+        for request_type in self._get_time_end:
+            self._get_interval[request_type] = self._adaptive_polling_min
+        # hash of last processed reply per request group to skip identical replies
+        self._get_content_hash = {}
+        self._get_reprocess = set()
+        self._get_replies_processed = {}
+        self._get_replies_skipped = {}
+        # version of visible data per request group, changes whenever its entities are signaled
+        self._data_version = {}
+        for request_type in self._get_time_end:
+            self._get_replies_processed[request_type] = 0
+            self._get_replies_skipped[request_type] = 0
+            self._data_version[request_type] = 0
+        self._data_version[REQUEST_DIAGNOSTICS] = 0
         self._set_param = {}
         self._set_param_group = {
             REQUEST_GET_MAIN: False,
@@ -363,7 +555,10 @@ class AristonChecker():
         }
         self._set_max_retries = retries
         self._set_new_data_pending = False
+        self._set_coalescing = False
         self._set_scheduled = False
+        # delay of next confirmation read after set, None if confirmation is not ongoing
+        self._set_confirm_delay = None
         self._set_time_start = {
             REQUEST_SET_MAIN: 0,
             REQUEST_SET_OTHER: 0,
@@ -375,10 +570,17 @@ class AristonChecker():
             REQUEST_SET_UNITS: 0
         }
         self._store_file = store_file
-        self._token_lock = threading.Lock()
-        self._token = None
+        # last fetched data is stored on disk and shown as stale after restart until fetched again
+        self._state_cache = device[CONF_STATE_CACHE]
+        self._state_cache_file = '/config/data_' + self._name + '_state_cache.json'
+        # disk is written by one scheduled job at a time, data fetched in between is stored by next write
+        self._state_cache_changed = False
+        self._state_cache_scheduled = None
+        self._state_cache_writing = False
+        self._stale_groups = set()
         self._units = units
-        self._url = ARISTON_URL
+        # other server, e.g. local stand-in server of tools/mock_server.py, can be used for offline testing
+        self._url = device[CONF_SERVER_URL].rstrip("/")
         self._user = username
         self._verify = True
         self._version = ""
@@ -393,42 +595,43 @@ class AristonChecker():
             REQUEST_GET_OTHER: True,
             REQUEST_GET_UNITS: False,
             REQUEST_GET_CURRENCY: False,
-            REQUEST_GET_VERSION: False
+            REQUEST_GET_VERSION: False,
+            # diagnostics are collected locally, nothing is fetched for them, flag tells if their sensors are used
+            REQUEST_DIAGNOSTICS: False
         }
         if binary_sensors != [] and binary_sensors != None:
             for item in binary_sensors:
-                self._valid_requests[_get_request_for_parameter(item)] = True
+                self._valid_requests[get_request_for_parameter(item)] = True
         if sensors != [] and sensors != None:
             for item in sensors:
-                self._valid_requests[_get_request_for_parameter(item)] = True
+                self._valid_requests[get_request_for_parameter(item)] = True
         if switches != [] and switches != None:
             for item in switches:
-                self._valid_requests[_get_request_for_parameter(item)] = True
+                self._valid_requests[get_request_for_parameter(item)] = True
         if self._units == VAL_AUTO:
             self._valid_requests[REQUEST_GET_UNITS] = True
         # prepare lists of requests
+        self._request_functions = {
+            REQUEST_GET_MAIN: self._async_get_main_data,
+            REQUEST_GET_CH: self._async_get_ch_data,
+            REQUEST_GET_DHW: self._async_get_dhw_data,
+            REQUEST_GET_ERROR: self._async_get_error_data,
+            REQUEST_GET_GAS: self._async_get_gas_water_data,
+            REQUEST_GET_OTHER: self._async_get_other_data,
+            REQUEST_GET_UNITS: self._async_get_unit_data,
+            REQUEST_GET_CURRENCY: self._async_get_currency_data,
+            REQUEST_GET_VERSION: self._async_get_version_data
+        }
         # prepare list of higher priority
         self._request_list_high_prio = []
-        if self._valid_requests[REQUEST_GET_MAIN]:
-            self._request_list_high_prio.append(self._get_main_data)
-        if self._valid_requests[REQUEST_GET_OTHER]:
-            self._request_list_high_prio.append(self._get_other_data)
-        if self._valid_requests[REQUEST_GET_ERROR]:
-            self._request_list_high_prio.append(self._get_error_data)
+        for request_type in REQUEST_GET_HIGH_PRIO:
+            if self._valid_requests[request_type]:
+                self._request_list_high_prio.append(request_type)
         # prepare list of lower priority
         self._request_list_low_prio = []
-        if self._valid_requests[REQUEST_GET_UNITS]:
-            self._request_list_low_prio.append(self._get_unit_data)
-        if self._valid_requests[REQUEST_GET_CH]:
-            self._request_list_low_prio.append(self._get_ch_data)
-        if self._valid_requests[REQUEST_GET_DHW]:
-            self._request_list_low_prio.append(self._get_dhw_data)
-        if self._valid_requests[REQUEST_GET_GAS]:
-            self._request_list_low_prio.append(self._get_gas_water_data)
-        if self._valid_requests[REQUEST_GET_CURRENCY]:
-            self._request_list_low_prio.append(self._get_currency_data)
-        if self._valid_requests[REQUEST_GET_VERSION]:
-            self._request_list_low_prio.append(self._get_version_data)
+        for request_type in REQUEST_GET_LOW_PRIO:
+            if self._valid_requests[request_type]:
+                self._request_list_low_prio.append(request_type)
 
         # initiate timer between requests within one loop
         self._timer_between_param_delay = HTTP_PARAM_DELAY * POLLING_RATE_TO_VALUE[polling]
@@ -438,32 +641,215 @@ class AristonChecker():
         self._timeout_medium = HTTP_TIMEOUT_GET_MEDIUM * POLLING_RATE_TO_VALUE[polling]
         self._timeout_short = HTTP_TIMEOUT_GET_SHORT * POLLING_RATE_TO_VALUE[polling]
 
-        # initiate timer between set request attempts
-        self._timer_between_set = VAL_NORMAL
-
         if self._store_file:
             with open('/config/data_' + self._name + '_valid_requests.json', 'w') as ariston_fetched:
                 json.dump(self._valid_requests, ariston_fetched)
 
+        if self._state_cache:
+            self._load_state_cache()
+            hass.bus.listen_once(EVENT_HOMEASSISTANT_STOP, self._async_stop_state_cache)
+
     @property
     def available(self):
-        """Return if Aristons's API is responding."""
-        return self._errors <= MAX_ERRORS and self._login and self._plant_id != "" and self._ariston_data_actual != {}
+        """Return if Aristons's API is responding or last known data is shown."""
+        return not self._breaker.tripped and self._ariston_data_actual != {} and (
+                self._login and self._plant_id != "" or REQUEST_GET_MAIN in self._stale_groups)
+
+    def diagnostics(self):
+        """Return metrics of requests, tolerated zero temperatures and age of data of used request groups"""
+        now = time.time()
+        data_age = {}
+        for request_type, time_end in self._get_time_end.items():
+            if self._valid_requests[request_type]:
+                data_age[request_type] = round(now - time_end, 1) if time_end else None
+        return {
+            "requests": self._request_metrics.as_dict(),
+            "zero_temperature": dict(self._get_zero_temperature),
+            "data_age": data_age,
+            "breaker": self._breaker.as_dict(),
+            "group_breakers": {
+                request_type: breaker.as_dict() for request_type, breaker in self._group_breakers.items()
+                if self._valid_requests[request_type]
+            },
+            "transport": self._account.metrics.as_dict() if self._account is not None else {},
+            "rate_limiter": self._limiter.as_dict() if self._limiter is not None else {},
+        }
 
-    def _login_session(self):
+    def _load_state_cache(self):
+        """Restore last fetched data from disk, must be called before any data is fetched"""
+        try:
+            with open(self._state_cache_file) as state_cache:
+                cached_data = json.load(state_cache)
+        except:
+            return
+        for request_type, attribute in REQUEST_GET_CACHED.items():
+            try:
+                if self._valid_requests[request_type] and cached_data[request_type]:
+                    setattr(self, attribute, cached_data[request_type])
+                    self._stale_groups.add(request_type)
+            except:
+                continue
+        self._ariston_other_param_actual = _index_param_data(self._ariston_other_data_actual)
+        self._ariston_ch_data = self._ariston_ch_data_actual
+        self._ariston_dhw_data = self._ariston_dhw_data_actual
+        self._ariston_gas_data = self._ariston_gas_data_actual
+        self._ariston_currency = self._ariston_currency_actual
+        self._set_visible_data()
+        _LOGGER.info('%s Last known data restored for %s', self, sorted(self._stale_groups))
+
+    def _save_state_cache(self, cached_data):
+        """Write last fetched data to disk, must be called from worker thread"""
+        # previous data is replaced only by completely written file
+        temp_file = self._state_cache_file + '.tmp'
+        try:
+            with open(temp_file, 'w') as state_cache:
+                json.dump(cached_data, state_cache, separators=(',', ':'))
+            os.replace(temp_file, self._state_cache_file)
+        except:
+            _LOGGER.warning('%s Could not store last known data', self)
+
+    @callback
+    def _schedule_state_cache(self):
+        """Mark last fetched data as changed and schedule its writing unless it is already scheduled"""
+        self._state_cache_changed = True
+        if self._state_cache_scheduled is None and not self._state_cache_writing:
+            self._state_cache_scheduled = async_track_point_in_time(
+                self._hass, self._async_write_state_cache, dt_util.now() + timedelta(seconds=STATE_CACHE_DELAY))
+
+    async def _async_write_state_cache(self, dummy=None):
+        """Write last fetched data to disk in executor"""
+        self._state_cache_scheduled = None
+        if self._state_cache_writing or not self._state_cache_changed:
+            return
+        self._state_cache_writing = True
+        self._state_cache_changed = False
+        # fetched data is never modified in place, so it is safe to write it in executor
+        cached_data = {request: getattr(self, attribute) for request, attribute in REQUEST_GET_CACHED.items()}
+        try:
+            await self._hass.async_add_executor_job(self._save_state_cache, cached_data)
+        finally:
+            self._state_cache_writing = False
+        if self._state_cache_changed:
+            self._schedule_state_cache()
+
+    async def _async_stop_state_cache(self, event=None):
+        """Write data which is waiting for scheduled write before Home Assistant stops"""
+        if self._state_cache_scheduled is not None:
+            self._state_cache_scheduled()
+            self._state_cache_scheduled = None
+        await self._async_write_state_cache()
+
+    def _async_init_transport(self):
+        """Create http session and locks, must be called from event loop"""
+        if self._session is None:
+            # devices of one account share connection pool, cookies and login, first device defines the pool
+            sessions = self._hass.data[DATA_ARISTON].setdefault(SESSIONS, {})
+            if self._user.lower() not in sessions:
+                # TLS settings and user agent are the same as of http sessions of Home Assistant
+                sessions[self._user.lower()] = AristonSession(
+                    self._device[CONF_HTTP_POOL_SIZE], self._device[CONF_HTTP_KEEP_ALIVE],
+                    self._device[CONF_HTTP_RETRIES], ssl_context=client_context() if client_context else None,
+                    user_agent=SERVER_SOFTWARE)
+                self._hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, sessions[self._user.lower()].async_close)
+                # keep login of account alive by first device so that reads do not wait for login
+                async_track_point_in_time(self._hass, self._async_keep_alive,
+                                          dt_util.now() + timedelta(seconds=HTTP_SESSION_CHECK))
+            self._account = sessions[self._user.lower()]
+            self._session = self._account.session
+            self._login_lock = self._account.login_lock
+            # one request at a time unless parallel cycle is used
+            self._request_semaphore = asyncio.Semaphore(self._parallel_requests)
+            # requests of all devices of one account are limited together, first device defines the limit
+            limiters = self._hass.data[DATA_ARISTON].setdefault(RATE_LIMITERS, {})
+            if self._user.lower() not in limiters:
+                limiters[self._user.lower()] = RateLimiter(
+                    self._device[CONF_RATE_LIMIT], HTTP_RATE_LIMIT_WINDOW, self._device[CONF_RATE_LIMIT_BURST])
+            self._limiter = limiters[self._user.lower()]
+
+    async def _async_login_session(self):
         """Login to fetch Ariston Plant ID and confirm login"""
-        if not self._login:
+        self._async_init_transport()
+        if self._login:
+            return
+        async with self._login_lock:
+            await self._async_login_session_locked()
+
+    async def _async_keep_alive(self, dummy=None):
+        """Renew login of account in the background before session expires"""
+        async_track_point_in_time(self._hass, self._async_keep_alive,
+                                  dt_util.now() + timedelta(seconds=HTTP_SESSION_CHECK))
+        if self._account.plant_id == "" or time.monotonic() - self._account.login_time < HTTP_SESSION_REFRESH:
+            # not logged in or login was renewed recently
+            return
+        async with self._login_lock:
+            # other devices keep using current cookies until new login is made
+            self._account.plant_id = ""
+            self._login = False
+            try:
+                await self._async_login_session_locked()
+                _LOGGER.debug('%s Login of account renewed, transport %s', self, self._account.metrics.as_dict())
+            except:
+                _LOGGER.warning('%s Login of account could not be renewed', self)
+
+    def _session_expired(self, resp):
+        """Return if reply indicates that login session is no longer valid"""
+        return resp.url.startswith(self._url) and (
+                resp.status_code == 401 or resp.url.startswith(self._url + '/Account/Login'))
+
+    async def _async_request(self, method, url, http_timeout, json_data=None, request_type="", priority=None):
+        """Send request within login session, login is made again and request repeated once if session expired"""
+        login_count = self._account.login_count
+        resp = await self._async_measured_request(method, url, http_timeout, json_data, request_type, priority)
+        if not self._session_expired(resp):
+            return resp
+        _LOGGER.info('%s Login session expired, logging in again', self)
+        async with self._login_lock:
+            if self._account.login_count == login_count:
+                # nobody has logged in since request was sent
+                self._account.plant_id = ""
+            self._login = False
+            await self._async_login_session_locked()
+        if priority is not None:
+            # repeated request is limited the same way as the original one
+            await self._limiter.async_acquire(priority)
+        return await self._async_measured_request(method, url, http_timeout, json_data, request_type, priority)
+
+    async def _async_measured_request(self, method, url, http_timeout, json_data=None, request_type="",
+                                      priority=None):
+        """Send request of account session and record its latency and failure"""
+        request_start = time.monotonic()
+        # requests without priority, e.g. to GitHub, are not part of Ariston rate limit
+        limiter = self._limiter if priority is not None else None
+        try:
+            resp = await self._account.async_request(
+                method, url, http_timeout, json_data, request_type, limiter=limiter, priority=priority)
+        except asyncio.TimeoutError:
+            self._request_metrics.count_outcome(request_type, OUTCOME_TIMEOUT)
+            raise
+        except:
+            self._request_metrics.count_outcome(request_type, OUTCOME_ERROR)
+            raise
+        self._request_metrics.observe_latency(request_type, time.monotonic() - request_start)
+        if resp.status_code != 200 and not self._session_expired(resp):
+            self._request_metrics.count_outcome(request_type, OUTCOME_HTTP_ERROR)
+        if self._valid_requests[REQUEST_DIAGNOSTICS]:
+            self._send_update_signal([REQUEST_DIAGNOSTICS])
+        return resp
+
+    async def _async_login_session_locked(self):
+        """Login to fetch Ariston Plant ID and confirm login while login lock is held"""
+        if not self._login and self._account.plant_id != "":
+            # other device of the same account has already logged in
+            self._plant_id = self._account.plant_id
+            self._login = True
+            _LOGGER.info('%s Login of account is reused, plant ID is %s', self, self._plant_id)
+            dispatcher_send(self._hass, service_signal(SERVICE_UPDATE, self._name))
+        elif not self._login:
             url = self._url + '/Account/Login'
             login_data = {"Email": self._user, "Password": self._password}
+            await self._limiter.async_acquire(REQUEST_PRIORITY[REQUEST_LOGIN])
             try:
-                with self._token_lock:
-                    self._token = requests.auth.HTTPDigestAuth(self._user, self._password)
-                resp = self._session.post(
-                    url,
-                    auth=self._token,
-                    timeout=HTTP_TIMEOUT_LOGIN,
-                    json=login_data,
-                    verify=True)
+                resp = await self._async_measured_request("post", url, HTTP_TIMEOUT_LOGIN, login_data, REQUEST_LOGIN)
             except:
                 _LOGGER.warning('%s Authentication login error', self)
                 raise LoginError
@@ -476,35 +862,93 @@ class AristonChecker():
                 self._url + "/Error/Active/") or resp.url.startswith(
                 self._url + "/PlantGuest/Index/") or resp.url.startswith(
                 self._url + "/TimeProg/Index/"):
-                with self._plant_id_lock:
-                    self._plant_id = resp.url.split("/")[5]
-                    self._login = True
-                    _LOGGER.info('%s Plant ID is %s', self, self._plant_id)
+                self._plant_id = resp.url.split("/")[5]
+                self._login = True
+                _LOGGER.info('%s Plant ID is %s', self, self._plant_id)
             elif resp.url.startswith(self._url + "/PlantData/Index/") or resp.url.startswith(
                     self._url + "/UserData/Index/"):
-                with self._plant_id_lock:
-                    plant_id_attribute = resp.url.split("/")[5]
-                    self._plant_id = plant_id_attribute.split("?")[0]
-                    self._login = True
-                    _LOGGER.info('%s Plant ID is %s', self, self._plant_id)
+                plant_id_attribute = resp.url.split("/")[5]
+                self._plant_id = plant_id_attribute.split("?")[0]
+                self._login = True
+                _LOGGER.info('%s Plant ID is %s', self, self._plant_id)
             elif resp.url.startswith(self._url + "/Menu/User/Index/"):
-                with self._plant_id_lock:
-                    self._plant_id = resp.url.split("/")[6]
-                    self._login = True
-                    _LOGGER.info('%s Plant ID is %s', self, self._plant_id)
+                self._plant_id = resp.url.split("/")[6]
+                self._login = True
+                _LOGGER.info('%s Plant ID is %s', self, self._plant_id)
             else:
                 _LOGGER.warning('%s Authentication login error', self)
                 raise LoginError
+            self._account.plant_id = self._plant_id
+            self._account.login_count += 1
+            self._account.login_time = time.monotonic()
             dispatcher_send(self._hass, service_signal(SERVICE_UPDATE, self._name))
         return
 
+    def _send_update_signal(self, request_groups):
+        """Update only entities which use data of request groups, all entities are updated on availability change"""
+        for request_group in request_groups:
+            self._data_version[request_group] += 1
+            dispatcher_send(self._hass, service_signal(SERVICE_UPDATE, self._name, request_group))
+
+    def _store_files(self, files):
+        """Write files for debugging in executor, data is serialized at once as it may change before writing"""
+        contents = {}
+        for file_suffix, data in files.items():
+            contents['/config/data_' + self._name + file_suffix] = \
+                data if isinstance(data, (bytes, str)) else json.dumps(data)
+        self._hass.async_add_executor_job(_write_files, contents)
+
+    def _update_dhw_trend(self):
+        """Add DHW storage temperature of each main reply to history, return if trend changed"""
+        trend_up = self._dhw_trend_up
+        try:
+            self._dhw_trend_up = False
+            if len(self._dhw_history) > 3:
+                del self._dhw_history[0]
+            if self._ariston_data["dhwStorageTemp"] != UNKNOWN_TEMP:
+                for dhw_value in reversed(self._dhw_history):
+                    if dhw_value != UNKNOWN_TEMP:
+                        if self._ariston_data["dhwStorageTemp"] < dhw_value:
+                            # down trend
+                            break
+                        elif self._ariston_data["dhwStorageTemp"] > dhw_value:
+                            # up trend
+                            self._dhw_trend_up = True
+                            break
+            self._dhw_history.append(self._ariston_data["dhwStorageTemp"])
+        except:
+            pass
+        return self._dhw_trend_up != trend_up
+
     def _store_data(self, resp, request_type=""):
-        """Store received dictionary"""
+        """Store received dictionary, return if reply differs from previous one"""
         if resp.status_code != 200:
             _LOGGER.warning('%s %s invalid reply code %s', self, request_type, resp.status_code)
             raise CommError
-        if not _json_validator(resp.json()):
+        content_hash = hashlib.sha1(resp.content).digest()
+        if request_type in self._get_content_hash and self._get_content_hash[request_type] == content_hash \
+                and request_type not in self._get_reprocess:
+            # same reply was already processed, nothing to parse, copy or update
+            self._get_time_end[request_type] = time.time()
+            self._get_replies_skipped[request_type] += 1
+            _LOGGER.debug('%s %s Reply unchanged, processing skipped', self, request_type)
+            self._request_metrics.count_outcome(request_type, OUTCOME_OK)
+            if request_type == REQUEST_GET_MAIN and self._update_dhw_trend():
+                # trend depends on time of replies, not only on their content
+                self._send_update_signal([REQUEST_GET_MAIN])
+            return False
+        changed = self._get_content_hash.get(request_type) != content_hash
+        # store hash only after successful processing
+        self._get_content_hash.pop(request_type, None)
+        self._get_reprocess.discard(request_type)
+        # reply is decoded only once, decoded data is then owned by the stored data
+        try:
+            reply_data = resp.json()
+        except ValueError:
+            reply_data = None
+        if not _json_validator(reply_data):
             _LOGGER.warning('%s %s No json detected', self, request_type)
+            self._request_metrics.count_outcome(request_type, OUTCOME_INVALID_JSON)
             raise CommError
         store_none_zero = False
         last_temp = {}
@@ -551,14 +995,7 @@ class AristonChecker():
                 last_temp_max[PARAM_DHW_SET_TEMPERATURE] = UNKNOWN_TEMP
                 last_temp_max[PARAM_CH_SET_TEMPERATURE] = UNKNOWN_TEMP
                 pass
-            try:
-                self._ariston_data_actual = copy.deepcopy(resp.json())
-                dispatcher_send(self._hass, service_signal(SERVICE_UPDATE, self._name))
-            except:
-                self._ariston_data_actual = {}
-                dispatcher_send(self._hass, service_signal(SERVICE_UPDATE, self._name))
-                _LOGGER.warning("%s Invalid data received for Main, not JSON", self)
-                raise CommError
+            self._ariston_data_actual = reply_data
             try:
                 # force default modes if received none
                 if self._ariston_data_actual["allowedModes"] == []:
@@ -643,25 +1080,9 @@ class AristonChecker():
                 _LOGGER.warning("%s Invalid data received for Main", self)
                 raise CommError
 
-            self._ariston_data = copy.deepcopy(self._ariston_data_actual)
+            self._set_visible_data()
 
-            try:
-                self._dhw_trend_up = False
-                if len(self._dhw_history) > 3:
-                    del self._dhw_history[0]
-                if self._ariston_data["dhwStorageTemp"] != UNKNOWN_TEMP:
-                    for dhw_value in reversed(self._dhw_history):
-                        if dhw_value != UNKNOWN_TEMP:
-                            if self._ariston_data["dhwStorageTemp"] < dhw_value:
-                                # down trend
-                                break
-                            elif self._ariston_data["dhwStorageTemp"] > dhw_value:
-                                # up trend
-                                self._dhw_trend_up = True
-                                break
-                self._dhw_history.append(self._ariston_data["dhwStorageTemp"])
-            except:
-                pass
+            self._update_dhw_trend()
 
         elif request_type == REQUEST_GET_CH:
 
@@ -680,12 +1101,7 @@ class AristonChecker():
                 last_temp_max[PARAM_CH_COMFORT_TEMPERATURE] = UNKNOWN_TEMP
                 last_temp_max[PARAM_CH_ECONOMY_TEMPERATURE] = UNKNOWN_TEMP
                 pass
-            try:
-                self._ariston_ch_data_actual = copy.deepcopy(resp.json())
-            except:
-                self._ariston_ch_data_actual = {}
-                _LOGGER.warning("%s Invalid data received for CH, not JSON", self)
-                raise CommError
+            self._ariston_ch_data_actual = reply_data
             try:
                 # keep latest CH comfort temperature if received invalid
                 if self._ariston_ch_data_actual["comfortTemp"]["value"] == UNKNOWN_TEMP:
@@ -711,29 +1127,19 @@ class AristonChecker():
                 _LOGGER.warning("%s Invalid data received for CH", self)
                 raise CommError
 
-            self._ariston_ch_data = copy.deepcopy(self._ariston_ch_data_actual)
+            self._ariston_ch_data = self._ariston_ch_data_actual
 
         elif request_type == REQUEST_GET_ERROR:
 
-            try:
-                self._ariston_error_data_actual = copy.deepcopy(resp.json())
-            except:
-                self._ariston_error_data_actual = {}
-                _LOGGER.warning("%s Invalid data received for error, not JSON", self)
-                raise CommError
+            self._ariston_error_data_actual = reply_data
 
-            self._ariston_error_data = copy.deepcopy(self._ariston_error_data_actual)
+            self._ariston_error_data = self._ariston_error_data_actual
 
         elif request_type == REQUEST_GET_GAS:
 
-            try:
-                self._ariston_gas_data_actual = copy.deepcopy(resp.json())
-            except:
-                self._ariston_gas_data_actual = {}
-                _LOGGER.warning("%s Invalid data received for energy use, not JSON", self)
-                raise CommError
+            self._ariston_gas_data_actual = reply_data
 
-            self._ariston_gas_data = copy.deepcopy(self._ariston_gas_data_actual)
+            self._ariston_gas_data = self._ariston_gas_data_actual
 
         elif request_type == REQUEST_GET_OTHER:
 
@@ -744,15 +1150,13 @@ class AristonChecker():
                 last_temp_min[PARAM_CH_ECONOMY_TEMPERATURE] = UNKNOWN_TEMP
                 last_temp_max[PARAM_CH_COMFORT_TEMPERATURE] = UNKNOWN_TEMP
                 last_temp_max[PARAM_CH_ECONOMY_TEMPERATURE] = UNKNOWN_TEMP
-                for param_item in self._ariston_other_data_actual:
-                    try:
-                        # Copy latest DHW temperatures
-                        if param_item["id"] == ARISTON_CH_COMFORT_TEMP:
-                            last_temp[PARAM_CH_COMFORT_TEMPERATURE] = param_item["value"]
-                        elif param_item["id"] == ARISTON_CH_ECONOMY_TEMP:
-                            last_temp[PARAM_CH_ECONOMY_TEMPERATURE] = param_item["value"]
-                    except:
-                        continue
+                # Copy latest CH temperatures
+                if ARISTON_CH_COMFORT_TEMP in self._ariston_other_param_actual:
+                    last_temp[PARAM_CH_COMFORT_TEMPERATURE] = self._ariston_other_param_actual[
+                        ARISTON_CH_COMFORT_TEMP]["value"]
+                if ARISTON_CH_ECONOMY_TEMP in self._ariston_other_param_actual:
+                    last_temp[PARAM_CH_ECONOMY_TEMPERATURE] = self._ariston_other_param_actual[
+                        ARISTON_CH_ECONOMY_TEMP]["value"]
             except:
                 last_temp[PARAM_CH_COMFORT_TEMPERATURE] = UNKNOWN_TEMP
                 last_temp[PARAM_CH_ECONOMY_TEMPERATURE] = UNKNOWN_TEMP
@@ -761,12 +1165,7 @@ class AristonChecker():
                 last_temp_max[PARAM_CH_COMFORT_TEMPERATURE] = UNKNOWN_TEMP
                 last_temp_max[PARAM_CH_ECONOMY_TEMPERATURE] = UNKNOWN_TEMP
                 pass
-            try:
-                self._ariston_other_data_actual = copy.deepcopy(resp.json())
-            except:
-                self._ariston_other_data_actual = {}
-                _LOGGER.warning("%s Invalid data received for parameters, not JSON", self)
-                raise CommError
+            self._ariston_other_data_actual = reply_data
 
             for item, param_item in enumerate(self._ariston_other_data_actual):
                 try:
@@ -774,13 +1173,13 @@ class AristonChecker():
                     if param_item["id"] == ARISTON_DHW_TIME_PROG_COMFORT and param_item["value"] != UNKNOWN_TEMP:
                         if "dhwTimeProgComfortTemp" in self._ariston_data_actual and "value" in \
                                 self._ariston_data_actual["dhwTimeProgComfortTemp"]:
-                            self._ariston_data_actual["dhwTimeProgComfortTemp"]["value"] = param_item["value"]
-                            self._ariston_data["dhwTimeProgComfortTemp"]["value"] = param_item["value"]
+                            self._ariston_data_actual = _copy_on_write(
+                                self._ariston_data_actual, ["dhwTimeProgComfortTemp", "value"], param_item["value"])
                     elif param_item["id"] == ARISTON_DHW_TIME_PROG_ECONOMY and param_item["value"] != UNKNOWN_TEMP:
                         if "dhwTimeProgEconomyTemp" in self._ariston_data_actual and "value" in \
                                 self._ariston_data_actual["dhwTimeProgEconomyTemp"]:
-                            self._ariston_data_actual["dhwTimeProgEconomyTemp"]["value"] = param_item["value"]
-                            self._ariston_data["dhwTimeProgEconomyTemp"]["value"] = param_item["value"]
+                            self._ariston_data_actual = _copy_on_write(
+                                self._ariston_data_actual, ["dhwTimeProgEconomyTemp", "value"], param_item["value"])
                     elif param_item["id"] == ARISTON_CH_COMFORT_TEMP:
                         # keep latest CH comfort temperature if received invalid
                         if param_item["value"] == UNKNOWN_TEMP:
@@ -805,101 +1204,92 @@ class AristonChecker():
                                 self._get_zero_temperature[PARAM_CH_ECONOMY_TEMPERATURE] = 0
                 except:
                     continue
+            self._ariston_other_param_actual = _index_param_data(self._ariston_other_data_actual)
 
-            self._ariston_other_data = copy.deepcopy(self._ariston_other_data_actual)
+            self._set_visible_data()
 
         elif request_type == REQUEST_GET_UNITS:
-            try:
-                self._ariston_units_actual = copy.deepcopy(resp.json())
-            except:
-                self._ariston_units_actual = {}
-                _LOGGER.warning("%s Invalid data received for units, not JSON", self)
-                raise CommError
+            self._ariston_units_actual = reply_data
 
-            self._ariston_units = copy.deepcopy(self._ariston_units_actual)
+            self._set_visible_data()
 
         elif request_type == REQUEST_GET_CURRENCY:
-            try:
-                self._ariston_currency_actual = copy.deepcopy(resp.json())
-            except:
-                self._ariston_currency_actual = {}
-                _LOGGER.warning("%s Invalid data received for currency, not JSON", self)
-                raise CommError
+            self._ariston_currency_actual = reply_data
 
-            self._ariston_currency = copy.deepcopy(self._ariston_currency_actual)
+            self._ariston_currency = self._ariston_currency_actual
 
         elif request_type == REQUEST_GET_DHW:
-            try:
-                self._ariston_dhw_data_actual = copy.deepcopy(resp.json())
-            except:
-                self._ariston_dhw_data_actual = {}
-                _LOGGER.warning("%s Invalid data received for DHW, not JSON", self)
-                raise CommError
+            self._ariston_dhw_data_actual = reply_data
 
-            self._ariston_dhw_data = copy.deepcopy(self._ariston_dhw_data_actual)
+            self._ariston_dhw_data = self._ariston_dhw_data_actual
 
         elif request_type == REQUEST_GET_VERSION:
             try:
-                self._version = resp.json()["tag_name"]
+                self._version = reply_data["tag_name"]
             except:
                 self._version = ""
                 _LOGGER.warning("%s Invalid version fetched", self)
 
         self._get_time_end[request_type] = time.time()
+        self._get_replies_processed[request_type] += 1
+        self._stale_groups.discard(request_type)
+        self._request_metrics.count_outcome(request_type, OUTCOME_OK)
+        if store_none_zero:
+            self._request_metrics.count_outcome(request_type, OUTCOME_ZERO_TEMPERATURE)
+        if self._state_cache and request_type in REQUEST_GET_CACHED:
+            self._schedule_state_cache()
+        self._get_content_hash[request_type] = content_hash
+        if store_none_zero:
+            # replies with invalid temperatures must be processed again to count tolerated zero values,
+            # identical reply is still not treated as changed data
+            self._get_reprocess.add(request_type)
+        if request_type == REQUEST_GET_MAIN:
+            # parameters update part of main data, so they must be applied again
+            self._get_reprocess.add(REQUEST_GET_OTHER)
+        # entities are updated only when processed data could have changed
+        if request_type == REQUEST_GET_OTHER:
+            # parameters also update part of main data
+            self._send_update_signal([REQUEST_GET_OTHER, REQUEST_GET_MAIN])
+        else:
+            self._send_update_signal([request_type])
 
-        try:
-            if self._store_file:
-                with open('/config/data_' + self._name + request_type + '.json', 'w') as ariston_fetched:
-                    if request_type in [REQUEST_GET_MAIN, REQUEST_SET_MAIN]:
-                        json.dump(self._ariston_data_actual, ariston_fetched)
-                    elif request_type == REQUEST_GET_CH:
-                        json.dump(self._ariston_ch_data_actual, ariston_fetched)
-                    elif request_type == REQUEST_GET_DHW:
-                        json.dump(self._ariston_dhw_data_actual, ariston_fetched)
-                    elif request_type == REQUEST_GET_ERROR:
-                        json.dump(self._ariston_error_data_actual, ariston_fetched)
-                    elif request_type == REQUEST_GET_GAS:
-                        json.dump(self._ariston_gas_data_actual, ariston_fetched)
-                    elif request_type == REQUEST_GET_OTHER:
-                        json.dump(self._ariston_other_data_actual, ariston_fetched)
-                    elif request_type == REQUEST_GET_UNITS:
-                        json.dump(self._ariston_units_actual, ariston_fetched)
-                    elif request_type == REQUEST_GET_CURRENCY:
-                        json.dump(self._ariston_currency_actual, ariston_fetched)
-                    elif request_type == REQUEST_GET_VERSION:
-                        ariston_fetched.write(self._version)
-                with open('/config/data_' + self._name + '_timers.json', 'w') as ariston_fetched:
-                    json.dump([self._set_time_start, self._set_time_end, self._get_time_start, self._get_time_end],
-                              ariston_fetched)
-                with open('/config/data_' + self._name + '_temp_main.json', 'w') as ariston_fetched:
-                    json.dump(self._ariston_data, ariston_fetched)
-                with open('/config/data_' + self._name + '_temp_param.json', 'w') as ariston_fetched:
-                    json.dump(self._ariston_other_data, ariston_fetched)
-                with open('/config/data_' + self._name + '_temp_units.json', 'w') as ariston_fetched:
-                    json.dump(self._ariston_units, ariston_fetched)
-                with open('/config/data_' + self._name + '_dhw_history.json', 'w') as ariston_fetched:
-                    json.dump(self._dhw_history, ariston_fetched)
-                if store_none_zero:
-                    with open('/config/data_' + self._name + request_type + '_last_temp.json', 'w') as ariston_fetched:
-                        json.dump([last_temp, last_temp_min, last_temp_max], ariston_fetched)
-                    with open('/config/data_' + self._name + request_type + '_reply_zero.json', 'w') as ariston_fetched:
-                        json.dump(resp.json(), ariston_fetched)
-                    with open('/config/data_' + self._name + '_zero_count.json', 'w') as ariston_fetched:
-                        json.dump(self._get_zero_temperature, ariston_fetched)
-        except:
-            raise
-
-    def _get_http_data(self, request_type=""):
+        if self._store_file:
+            if request_type == REQUEST_GET_VERSION:
+                fetched_data = self._version
+            elif request_type == REQUEST_GET_ERROR:
+                fetched_data = self._ariston_error_data_actual
+            else:
+                fetched_data = getattr(self, REQUEST_GET_CACHED[request_type])
+            files = {
+                request_type + '.json': fetched_data,
+                '_timers.json': [self._set_time_start, self._set_time_end, self._get_time_start, self._get_time_end],
+                '_temp_main.json': self._ariston_data,
+                '_temp_param.json': self._ariston_other_data,
+                '_temp_units.json': self._ariston_units,
+                '_dhw_history.json': self._dhw_history,
+                '_replies.json': [self._get_replies_processed, self._get_replies_skipped],
+                '_transport.json': self._account.metrics.as_dict(),
+                '_diagnostics.json': self.diagnostics(),
+            }
+            if store_none_zero:
+                files[request_type + '_last_temp.json'] = [last_temp, last_temp_min, last_temp_max]
+                # decoded reply was already modified, raw reply is stored instead
+                files[request_type + '_reply_zero.json'] = resp.content
+                files['_zero_count.json'] = self._get_zero_temperature
+            self._store_files(files)
+        return changed
+
+    async def _async_get_http_data(self, request_type="", confirm=False):
         """Common fetching of http data"""
-        self._login_session()
+        await self._async_login_session()
         if self._login and self._plant_id != "":
             try:
-                last_set_of_data = _set_time_start[max(_set_time_start.keys(), key=(lambda k: _set_time_start[k]))]
+                last_set_of_data = max(self._set_time_start.values())
             except:
                 last_set_of_data = 0
                 pass
-            if time.time() - last_set_of_data > HTTP_TIMER_SET_LOCK:
-                # do not read immediately during set attempt
+            if confirm or time.time() - last_set_of_data > HTTP_TIMER_SET_LOCK:
+                # do not read immediately during set attempt unless set values are being confirmed
                 if request_type == REQUEST_GET_CH:
                     url = self._url + '/TimeProg/GetWeeklyPlan/' + self._plant_id + '?progId=ChZn1&umsys=si'
                     http_timeout = self._timeout_medium
@@ -941,169 +1331,300 @@ class AristonChecker():
                     else:
                         # for not available give a bit more time
                         http_timeout = self._timeout_long + 4
-                with self._data_lock:
+                priority = None
+                if request_type != REQUEST_GET_VERSION:
+                    # GitHub is not part of Ariston rate limit, confirmation and probe of the server are urgent
+                    priority = PRIORITY_MAIN if confirm else REQUEST_PRIORITY.get(request_type, PRIORITY_LOW)
+                    max_wait = None if priority < PRIORITY_LOW else self._timer_between_param_delay
+                    if not await self._limiter.async_acquire(priority, max_wait):
+                        _LOGGER.debug("%s %s Postponed due to account rate limit", self, request_type)
+                        return False
+                queue_start = time.monotonic()
+                async with self._request_semaphore:
+                    self._request_metrics.observe_queue_wait(request_type, time.monotonic() - queue_start)
                     try:
                         self._get_time_start[request_type] = time.time()
-                        resp = self._session.get(
-                            url,
-                            auth=self._token,
-                            timeout=http_timeout,
-                            verify=True)
+                        resp = await self._async_request("get", url, http_timeout, request_type=request_type,
+                                                         priority=priority)
                     except:
                         _LOGGER.warning("%s %s Problem reading data", self, request_type)
                         raise CommError
-                    self._store_data(resp, request_type)
+                    changed = self._store_data(resp, request_type)
+                    self._adapt_polling_interval(request_type, changed)
             else:
                 _LOGGER.debug("%s %s Still setting data, read restricted", self, request_type)
+                return False
         else:
             _LOGGER.warning("%s %s Not properly logged in to get the data", self, request_type)
             raise LoginError
         _LOGGER.info('Data fetched')
         return True
 
-    def _queue_get_data(self, dummy=None):
+    def _adapt_polling_interval(self, request_type, changed):
+        """Shorten polling interval of request group if its data changed, otherwise extend it"""
+        if changed:
+            self._get_interval[request_type] = max(
+                self._get_interval[request_type] / HTTP_ADAPTIVE_BACKOFF, self._adaptive_polling_min)
+        else:
+            self._get_interval[request_type] = min(
+                self._get_interval[request_type] * HTTP_ADAPTIVE_BACKOFF, self._adaptive_polling_max)
+        _LOGGER.debug('%s %s Polling interval is %s seconds', self, request_type, self._get_interval[request_type])
+
+    def _request_is_due(self, request_type):
+        """Check if data of request group is old enough to be fetched again"""
+        if request_type in self._group_breakers and not self._group_breakers[request_type].closed:
+            # group keeps failing, it is fetched only once its pause is over
+            return self._group_breakers[request_type].try_probe()
+        if not self._adaptive_polling or request_type in REQUEST_GET_NOT_ADAPTIVE:
+            return True
+        return time.time() - self._get_time_end[request_type] >= self._get_interval[request_type]
+
+    def _next_low_prio_request(self):
+        """Select next lower priority request which data is old enough"""
+        for _ in range(len(self._request_list_low_prio)):
+            request_type = self._request_list_low_prio[self._get_request_number_low_prio]
+            self._get_request_number_low_prio += 1
+            if self._get_request_number_low_prio >= len(self._request_list_low_prio):
+                self._get_request_number_low_prio = 0
+            if self._request_is_due(request_type):
+                return request_type
+        return None
+
+    @callback
+    def _async_queue_get_data(self, dummy=None):
         """Queue all request items"""
-        with self._data_lock:
-            # schedule next get request
-            if self._errors >= MAX_ERRORS_TIMER_EXTEND:
-                # give a little rest to the system if too many errors
-                retry_in = self._timer_between_param_delay * HTTP_DELAY_MULTIPLY
-                self._timer_between_set = VAL_LONG
-                _LOGGER.warning('%s Retrying in %s seconds', self, retry_in)
-            else:
-                # work as usual
-                retry_in = self._timer_between_param_delay
-                self._timer_between_set = VAL_NORMAL
-                _LOGGER.debug('%s Fetching data in %s seconds', self, retry_in)
-            track_point_in_time(self._hass, self._queue_get_data, dt_util.now() + timedelta(seconds=retry_in))
-
-            if not self.available:
-                # first always initiate main data
-                track_point_in_time(self._hass, self._get_main_data, dt_util.now() + timedelta(seconds=1))
-                # force skip after fetching data
-                self._get_request_number_high_prio = 1
-            # next trigger fetching parameters that are being changed
-            elif self._set_param_group[REQUEST_GET_MAIN]:
-                # setting of main data is ongoing, prioritize it
-                track_point_in_time(self._hass, self._get_main_data, dt_util.now() + timedelta(seconds=1))
-                if not self._set_scheduled:
-                    self._set_param_group[REQUEST_GET_MAIN] = False
-            elif self._set_param_group[REQUEST_GET_OTHER]:
-                # setting of parameter data is ongoing, prioritize it
-                track_point_in_time(self._hass, self._get_other_data, dt_util.now() + timedelta(seconds=1))
-                if not self._set_scheduled:
-                    self._set_param_group[REQUEST_GET_OTHER] = False
-            elif self._set_param_group[REQUEST_GET_UNITS]:
-                # setting of parameter units is ongoing, prioritize it
-                track_point_in_time(self._hass, self._get_unit_data, dt_util.now() + timedelta(seconds=1))
-                if not self._set_scheduled:
-                    self._set_param_group[REQUEST_GET_UNITS] = False
+        # schedule next get request
+        retry_in = self._timer_between_param_delay
+        _LOGGER.debug('%s Fetching data in %s seconds', self, retry_in)
+        if self._parallel_cycle:
+            # whole data set is fetched within one cycle, so cycles are less frequent
+            retry_in *= HTTP_PARALLEL_CYCLE_MULTIPLY
+        async_track_point_in_time(self._hass, self._async_queue_get_data,
+                                  dt_util.now() + timedelta(seconds=retry_in))
+
+        if not self._breaker.closed:
+            # server keeps failing, no data is requested until single probe succeeds
+            if self._breaker.try_probe():
+                async_track_point_in_time(self._hass, self._async_probe, dt_util.now() + timedelta(seconds=1))
+        elif self._parallel_cycle:
+            # fetch all request groups at once
+            async_track_point_in_time(self._hass, self._async_get_data_cycle, dt_util.now() + timedelta(seconds=1))
+        elif not self.available or REQUEST_GET_MAIN in self._stale_groups:
+            # first always initiate main data
+            async_track_point_in_time(self._hass, self._async_get_main_data, dt_util.now() + timedelta(seconds=1))
+            # force skip after fetching data
+            self._get_request_number_high_prio = 1
+        # next trigger fetching parameters that are being changed
+        elif self._set_param_group[REQUEST_GET_MAIN]:
+            # setting of main data is ongoing, prioritize it
+            async_track_point_in_time(self._hass, self._async_get_main_data, dt_util.now() + timedelta(seconds=1))
+            if not self._set_scheduled:
+                self._set_param_group[REQUEST_GET_MAIN] = False
+        elif self._set_param_group[REQUEST_GET_OTHER]:
+            # setting of parameter data is ongoing, prioritize it
+            async_track_point_in_time(self._hass, self._async_get_other_data, dt_util.now() + timedelta(seconds=1))
+            if not self._set_scheduled:
+                self._set_param_group[REQUEST_GET_OTHER] = False
+        elif self._set_param_group[REQUEST_GET_UNITS]:
+            # setting of parameter units is ongoing, prioritize it
+            async_track_point_in_time(self._hass, self._async_get_unit_data, dt_util.now() + timedelta(seconds=1))
+            if not self._set_scheduled:
+                self._set_param_group[REQUEST_GET_UNITS] = False
+        else:
+            # last is fetch higher priority list items
+            # select next item from high priority list
+            if self._get_request_number_high_prio < len(self._request_list_high_prio):
+                # item is available in the list
+                request_type = self._request_list_high_prio[self._get_request_number_high_prio]
+                if not self._request_is_due(request_type):
+                    # data is still fresh, use the place to keep main data up to date
+                    request_type = REQUEST_GET_MAIN
+                async_track_point_in_time(self._hass, self._request_functions[request_type],
+                                          dt_util.now() + timedelta(seconds=1))
+                self._get_request_number_high_prio += 1
+            elif self._get_request_number_high_prio > len(self._request_list_high_prio):
+                # start from the beginning of the list
+                self._get_request_number_high_prio = 0
             else:
-                # last is fetch higher priority list items
-                # select next item from high priority list
-                if self._get_request_number_high_prio < len(self._request_list_high_prio):
-                    # item is available in the list
-                    track_point_in_time(self._hass,
-                                        self._request_list_high_prio[self._get_request_number_high_prio],
-                                        dt_util.now() + timedelta(seconds=1))
-                    self._get_request_number_high_prio += 1
-                elif self._get_request_number_high_prio > len(self._request_list_high_prio):
-                    # start from the beginning of the list
-                    self._get_request_number_high_prio = 0
-                else:
-                    # third we reserve one place for one of lower priority tasks among higher priority ones
-                    self._get_request_number_high_prio += 1
-                    if self._errors < MAX_ERRORS_TIMER_EXTEND:
-                        # skip lower priority requests if too many errors and give time to recover
-                        # other data is not that important, so just handle in queue
-                        if self._get_request_number_low_prio < len(self._request_list_low_prio):
-                            # item is available in the list
-                            track_point_in_time(self._hass,
-                                                self._request_list_low_prio[self._get_request_number_low_prio],
-                                                dt_util.now() + timedelta(seconds=1))
-                            self._get_request_number_low_prio += 1
-                        if self._get_request_number_low_prio >= len(self._request_list_low_prio):
-                            self._get_request_number_low_prio = 0
-
-            if self._store_file:
-                with open('/config/data_' + self._name + '_all_set_get.json', 'w') as ariston_fetched:
-                    json.dump(self._set_param_group, ariston_fetched)
+                # third we reserve one place for one of lower priority tasks among higher priority ones
+                self._get_request_number_high_prio += 1
+                # other data is not that important, so just handle in queue
+                request_type = self._next_low_prio_request()
+                if request_type is None and self._adaptive_polling:
+                    # all lower priority data is still fresh, use the place to keep main data up to date
+                    request_type = REQUEST_GET_MAIN
+                if request_type is not None:
+                    async_track_point_in_time(self._hass, self._request_functions[request_type],
+                                              dt_util.now() + timedelta(seconds=1))
 
-    def _control_availability_state(self, request_type):
-        """Control component availability"""
+        if self._store_file:
+            self._store_files({'_all_set_get.json': self._set_param_group})
+
+    async def _async_control_availability_state(self, request_type, confirm=False, probe=False):
+        """Control availability, requests of the same group share one request, return False if it was not sent"""
+        if request_type in self._in_flight and not probe:
+            in_flight, in_flight_confirm = self._in_flight[request_type]
+            # reading which can be skipped during setting of data cannot be used to confirm set values
+            if in_flight_confirm or not confirm:
+                _LOGGER.debug('%s %s Joined request in progress', self, request_type)
+                self._request_metrics.count_joined(request_type)
+                fetched = await asyncio.shield(in_flight)
+                if fetched is None:
+                    # shared request failed
+                    raise AristonError
+                return fetched
+        in_flight = asyncio.get_event_loop().create_future()
+        self._in_flight[request_type] = (in_flight, confirm)
+        try:
+            fetched = await self._async_update_availability_state(request_type, confirm, probe)
+            in_flight.set_result(fetched)
+            return fetched
+        finally:
+            if not in_flight.done():
+                in_flight.set_result(None)
+            if self._in_flight.get(request_type, (None,))[0] is in_flight:
+                del self._in_flight[request_type]
+
+    async def _async_update_availability_state(self, request_type, confirm=False, probe=False):
+        """Fetch data and count its success or failure in health of the plant or the request group"""
+        plant_health = probe or request_type in REQUEST_GET_PLANT_HEALTH
         try:
-            self._get_http_data(request_type)
+            if not await self._async_get_http_data(request_type, confirm):
+                # request was not sent, nothing to judge health by
+                return False
         except:
-            with self._lock:
-                was_online = self.available
-                self._errors += 1
-                _LOGGER.warning("%s errors: %i", self._name, self._errors)
-                offline = not self.available
+            if not plant_health:
+                # failing lower priority data only pauses its own requests
+                breaker = self._group_breakers[request_type]
+                opened = breaker.record_failure()
+                if opened:
+                    _LOGGER.warning("%s %s Requests paused for %s seconds", self, request_type,
+                                    round(breaker.time_to_probe()))
+                raise AristonError
+            was_online = self.available
+            opened = self._breaker.record_failure()
+            _LOGGER.warning("%s errors: %i", self._name, self._breaker.failures)
+            offline = not self.available
+            if opened:
+                _LOGGER.warning("%s Requests paused, probing in %s seconds", self._name,
+                                round(self._breaker.time_to_probe()))
             if offline and was_online:
-                with self._plant_id_lock:
-                    self._login = False
+                self._login = False
+                # login of the whole account is made again as session might be expired
+                self._account.plant_id = ""
                 _LOGGER.error("%s is offline: Too many errors", self._name)
                 dispatcher_send(self._hass, service_signal(SERVICE_UPDATE, self._name))
             raise AristonError
         _LOGGER.info("%s data fetched successfully, available %s", self._name, self.available)
-        with self._lock:
-            was_offline = not self.available
-            self._errors = 0
+        if request_type in self._group_breakers:
+            self._group_breakers[request_type].record_success()
+        if not plant_health:
+            return True
+        was_offline = not self.available
+        recovered = self._breaker.record_success()
+        if recovered:
+            _LOGGER.info("%s Requests resumed", self._name)
         if was_offline:
             _LOGGER.info("%s Ariston back online", self._name)
             dispatcher_send(self._hass, service_signal(SERVICE_UPDATE, self._name))
-        return
+        return True
+
+    async def _async_get_data_cycle(self, dummy=None):
+        """Fetch independent request groups concurrently within one polling cycle"""
+        if self._cycle_running:
+            _LOGGER.debug('%s Previous cycle is still ongoing', self)
+            return
+        self._cycle_running = True
+        try:
+            self._async_init_transport()
+            # main data is needed by other requests and defines availability
+            await self._async_fetch_data(REQUEST_GET_MAIN)
+            if not self.available or REQUEST_GET_MAIN in self._stale_groups:
+                return
+            if not self._breaker.closed:
+                # main data failed too many times, do not waste requests until probe succeeds
+                return
+            request_list = [request for request in REQUEST_GET_HIGH_PRIO if request != REQUEST_GET_MAIN]
+            request_list.extend(REQUEST_GET_LOW_PRIO)
+            requests_to_send = []
+            for request_type in request_list:
+                if not self._valid_requests[request_type] or not self._request_is_due(request_type):
+                    continue
+                requests_to_send.append(request_type)
+            await asyncio.gather(*[self._async_fetch_data(request_type) for request_type in requests_to_send])
+            if not self._set_scheduled:
+                for request_item in self._set_param_group:
+                    self._set_param_group[request_item] = False
+        finally:
+            self._cycle_running = False
+
+    async def _async_fetch_data(self, request_type, confirm=False):
+        """Fetch data on schedule, errors are already counted by availability control"""
+        try:
+            await self._async_control_availability_state(request_type, confirm)
+        except AristonError:
+            pass
 
-    def _get_main_data(self, dummy=None):
+    async def _async_probe(self, dummy=None):
+        """Test if server recovered with single short request, full polling is restored at once on success"""
+        _LOGGER.info('%s Probing the server', self)
+        # confirmation flag makes sure request is not skipped due to ongoing setting of data
+        try:
+            if not await self._async_control_availability_state(REQUEST_GET_UNITS, confirm=True, probe=True):
+                # probe was not sent, breaker allows another one later
+                return
+        except AristonError:
+            return
+        if self._parallel_cycle:
+            await self._async_get_data_cycle()
+        else:
+            await self._async_get_main_data()
+
+    async def _async_get_main_data(self, dummy=None):
         """Get Ariston main data from http"""
-        self._control_availability_state(REQUEST_GET_MAIN)
+        await self._async_fetch_data(REQUEST_GET_MAIN)
 
-    def _get_gas_water_data(self, dummy=None):
+    async def _async_get_gas_water_data(self, dummy=None):
         """Get Ariston gas and water use data from http"""
-        self._control_availability_state(REQUEST_GET_GAS)
+        await self._async_fetch_data(REQUEST_GET_GAS)
 
-    def _get_error_data(self, dummy=None):
+    async def _async_get_error_data(self, dummy=None):
         """Get Ariston error data from http"""
-        self._control_availability_state(REQUEST_GET_ERROR)
+        await self._async_fetch_data(REQUEST_GET_ERROR)
 
-    def _get_ch_data(self, dummy=None):
+    async def _async_get_ch_data(self, dummy=None):
         """Get Ariston CH data from http"""
-        self._control_availability_state(REQUEST_GET_CH)
+        await self._async_fetch_data(REQUEST_GET_CH)
 
-    def _get_dhw_data(self, dummy=None):
+    async def _async_get_dhw_data(self, dummy=None):
         """Get Ariston DHW data from http"""
-        self._control_availability_state(REQUEST_GET_DHW)
+        await self._async_fetch_data(REQUEST_GET_DHW)
 
-    def _get_other_data(self, dummy=None):
+    async def _async_get_other_data(self, dummy=None):
         """Get Ariston other data from http"""
-        self._control_availability_state(REQUEST_GET_OTHER)
+        await self._async_fetch_data(REQUEST_GET_OTHER)
 
-    def _get_unit_data(self, dummy=None):
+    async def _async_get_unit_data(self, dummy=None):
         """Get Ariston unit data from http"""
-        self._control_availability_state(REQUEST_GET_UNITS)
+        await self._async_fetch_data(REQUEST_GET_UNITS)
 
-    def _get_currency_data(self, dummy=None):
+    async def _async_get_currency_data(self, dummy=None):
         """Get Ariston currency data from http"""
-        self._control_availability_state(REQUEST_GET_CURRENCY)
+        await self._async_fetch_data(REQUEST_GET_CURRENCY)
 
-    def _get_version_data(self, dummy=None):
+    async def _async_get_version_data(self, dummy=None):
         """Get Ariston version from GitHub"""
-        self._control_availability_state(REQUEST_GET_VERSION)
+        await self._async_fetch_data(REQUEST_GET_VERSION)
 
-    def _setting_http_data(self, set_data, request_type=""):
+    async def _async_setting_http_data(self, set_data, request_type=""):
         """setting of data"""
         _LOGGER.info('setting http data')
-        try:
-            if self._store_file:
-                with open('/config/data_' + self._name + request_type + '.json', 'w') as ariston_fetched:
-                    json.dump(set_data, ariston_fetched)
-                with open('/config/data_' + self._name + '_all_set.json', 'w') as ariston_fetched:
-                    json.dump(self._set_param, ariston_fetched)
-                with open('/config/data_' + self._name + '_timers.json', 'w') as ariston_fetched:
-                    json.dump([self._set_time_start, self._set_time_end, self._get_time_start, self._get_time_end],
-                              ariston_fetched)
-        except:
-            pass
+        if self._store_file:
+            self._store_files({
+                request_type + '.json': set_data,
+                '_all_set.json': self._set_param,
+                '_timers.json': [self._set_time_start, self._set_time_end, self._get_time_start, self._get_time_end],
+            })
         if request_type == REQUEST_SET_OTHER:
             url = self._url + '/Menu/User/Submit/' + self._plant_id + '?umsys=si'
             http_timeout = self._timeout_medium
@@ -1115,12 +1636,8 @@ class AristonChecker():
             http_timeout = self._timeout_long
         try:
             self._set_time_start[request_type] = time.time()
-            resp = self._session.post(
-                url,
-                auth=self._token,
-                timeout=http_timeout,
-                json=set_data,
-                verify=True)
+            resp = await self._async_request("post", url, http_timeout, set_data, request_type,
+                                             REQUEST_PRIORITY[request_type])
         except:
             _LOGGER.warning('%s %s error', self, request_type)
             raise CommError
@@ -1128,6 +1645,7 @@ class AristonChecker():
             _LOGGER.warning("%s %s Command to set data failed with code: %s", self, request_type, resp.status_code)
             raise CommError
         self._set_time_end[request_type] = time.time()
+        self._request_metrics.count_outcome(request_type, OUTCOME_OK)
         if request_type == REQUEST_SET_MAIN:
             """
             data in reply cannot be fully trusted as occasionally we receive changed data but on next read turns out 
@@ -1135,1015 +1653,698 @@ class AristonChecker():
             """
             # self._store_data(resp, request_type)
             if self._store_file:
-                with open("/config/data_" + self._name + request_type + "_reply.txt", "w") as f:
-                    f.write(resp.text)
+                self._store_files({request_type + '_reply.txt': resp.content})
         _LOGGER.info('%s %s Data was presumably changed', self, request_type)
 
     def _set_visible_data(self):
+        """Show pending set values on top of last fetched data, fetched data itself is never modified"""
+        visible = {
+            REQUEST_GET_MAIN: self._ariston_data_actual,
+            REQUEST_GET_OTHER: self._ariston_other_param_actual,
+            REQUEST_GET_UNITS: self._ariston_units_actual
+        }
+        if self._set_param != {}:
+            # visible data differs from last replies, so identical replies must restore it
+            self._get_reprocess.update([REQUEST_GET_MAIN, REQUEST_GET_OTHER, REQUEST_GET_UNITS])
         try:
             # set visible values as if they have in fact changed
             for parameter, value in self._set_param.items():
                 try:
-                    if self._valid_requests[_get_request_for_parameter(parameter)]:
-                        if parameter == PARAM_MODE:
-                            self._ariston_data["mode"] = value
-                        elif parameter == PARAM_CH_MODE:
-                            self._ariston_data["zone"]["mode"]["value"] = value
-                        elif parameter == PARAM_CH_SET_TEMPERATURE:
-                            self._ariston_data["zone"]["comfortTemp"]["value"] = value
-                        elif parameter == PARAM_CH_COMFORT_TEMPERATURE:
-                            for iteration, item in enumerate(self._ariston_other_data):
-                                if item["id"] == ARISTON_CH_COMFORT_TEMP:
-                                    self._ariston_other_data[iteration]["value"] = value
-                                    break
-                        elif parameter == PARAM_CH_ECONOMY_TEMPERATURE:
-                            for iteration, item in enumerate(self._ariston_other_data):
-                                if item["id"] == ARISTON_CH_ECONOMY_TEMP:
-                                    self._ariston_other_data[iteration]["value"] = value
-                                    break
-                        elif parameter == PARAM_DHW_SET_TEMPERATURE:
-                            self._ariston_data["dhwTemp"]["value"] = value
-                        elif parameter == PARAM_DHW_COMFORT_TEMPERATURE:
-                            self._ariston_data["dhwTimeProgComfortTemp"]["value"] = value
-                            try:
-                                if VALUE_TO_DHW_MODE[self._ariston_data_actual["dhwMode"]] == VAL_PROGRAM:
-                                    if self._ariston_data_actual["dhwTimeProgComfortActive"] == True:
-                                        # economy temperature is being used
-                                        self._ariston_data["dhwTemp"]["value"] = value
-                                elif VALUE_TO_DHW_MODE[self._ariston_data_actual["dhwMode"]] == VAL_UNSUPPORTED:
-                                    self._ariston_data["dhwTemp"]["value"] = value
-                            except:
-                                pass
-                        elif parameter == PARAM_DHW_ECONOMY_TEMPERATURE:
-                            self._ariston_data["dhwTimeProgEconomyTemp"]["value"] = value
+                    if self._valid_requests[get_request_for_parameter(parameter)]:
+                        request_group, path, _, _ = SET_PARAM_MAPPING[parameter]
+                        visible[request_group] = _copy_on_write(visible[request_group], path, value)
+                        if parameter in [PARAM_DHW_COMFORT_TEMPERATURE, PARAM_DHW_ECONOMY_TEMPERATURE]:
                             try:
-                                if VALUE_TO_DHW_MODE[self._ariston_data_actual["dhwMode"]] == VAL_PROGRAM:
-                                    if self._ariston_data_actual["dhwTimeProgComfortActive"] == False:
-                                        # comfort temperature is being used
-                                        self._ariston_data["dhwTemp"]["value"] = value
+                                dhw_mode = VALUE_TO_DHW_MODE[self._ariston_data_actual["dhwMode"]]
+                                comfort_active = self._ariston_data_actual["dhwTimeProgComfortActive"]
+                                if parameter == PARAM_DHW_COMFORT_TEMPERATURE:
+                                    # economy temperature is being used
+                                    in_use = (dhw_mode == VAL_PROGRAM and comfort_active == True) or \
+                                             dhw_mode == VAL_UNSUPPORTED
+                                else:
+                                    # comfort temperature is being used
+                                    in_use = dhw_mode == VAL_PROGRAM and comfort_active == False
+                                if in_use:
+                                    visible[REQUEST_GET_MAIN] = _copy_on_write(visible[REQUEST_GET_MAIN],
+                                                                               ["dhwTemp", "value"], value)
                             except:
                                 pass
-                        elif parameter == PARAM_DHW_MODE:
-                            self._ariston_data["dhwMode"] = value
-                        elif parameter == PARAM_DHW_COMFORT_FUNCTION:
-                            for iteration, item in enumerate(self._ariston_other_data):
-                                if item["id"] == ARISTON_DHW_COMFORT_FUNCTION:
-                                    self._ariston_other_data[iteration]["value"] = value
-                                    break
-                        elif parameter == PARAM_INTERNET_TIME:
-                            for iteration, item in enumerate(self._ariston_other_data):
-                                if item["id"] == ARISTON_INTERNET_TIME:
-                                    self._ariston_other_data[iteration]["value"] = value
-                                    break
-                        elif parameter == PARAM_INTERNET_WEATHER:
-                            for iteration, item in enumerate(self._ariston_other_data):
-                                if item["id"] == ARISTON_INTERNET_WEATHER:
-                                    self._ariston_other_data[iteration]["value"] = value
-                                    break
-                        elif parameter == PARAM_CH_AUTO_FUNCTION:
-                            for iteration, item in enumerate(self._ariston_other_data):
-                                if item["id"] == ARISTON_CH_AUTO_FUNCTION:
-                                    self._ariston_other_data[iteration]["value"] = value
-                                    break
-                        elif parameter == PARAM_UNITS:
-                            self._ariston_units["measurementSystem"] = value
-                        elif parameter == PARAM_THERMAL_CLEANSE_CYCLE:
-                            for iteration, item in enumerate(self._ariston_other_data):
-                                if item["id"] == ARISTON_THERMAL_CLEANSE_CYCLE:
-                                    self._ariston_other_data[iteration]["value"] = value
-                                    break
-                        elif parameter == PARAM_THERMAL_CLEANSE_FUNCTION:
-                            for iteration, item in enumerate(self._ariston_other_data):
-                                if item["id"] == ARISTON_THERMAL_CLEANSE_FUNCTION:
-                                    self._ariston_other_data[iteration]["value"] = value
-                                    break
                 except:
                     continue
         except:
             pass
+        ariston_other_param = visible[REQUEST_GET_OTHER]
+        self._ariston_data = visible[REQUEST_GET_MAIN]
+        self._ariston_other_param = ariston_other_param
+        if ariston_other_param is self._ariston_other_param_actual:
+            self._ariston_other_data = self._ariston_other_data_actual
+        else:
+            # submit payload and stored files keep order of parameters as received
+            self._ariston_other_data = list(ariston_other_param.values())
+        self._ariston_units = visible[REQUEST_GET_UNITS]
+
+        if self._store_file:
+            self._store_files({
+                '_temp_main.json': self._ariston_data,
+                '_temp_param.json': self._ariston_other_data,
+                '_temp_units.json': self._ariston_units,
+            })
+
+    def _prepare_set_data(self):
+        """Compare set parameters with fetched data and prepare data of set requests"""
+        changed_parameter = {
+            REQUEST_SET_MAIN: {},
+            REQUEST_SET_OTHER: {},
+            REQUEST_SET_UNITS: {}
+        }
 
+        set_data = {}
+        # prepare setting of main data dictionary
+        # fetched data is never modified, so only changed parts of it are copied
+        # Format is received in 12H format but for some reason REST tools send it fine but python must send 24H format
         try:
-            if self._store_file:
-                with open('/config/data_' + self._name + '_temp_main.json', 'w') as ariston_fetched:
-                    json.dump(self._ariston_data, ariston_fetched)
-                with open('/config/data_' + self._name + '_temp_param.json', 'w') as ariston_fetched:
-                    json.dump(self._ariston_other_data, ariston_fetched)
-                with open('/config/data_' + self._name + '_temp_units.json', 'w') as ariston_fetched:
-                    json.dump(self._ariston_units, ariston_fetched)
+            deroga_until = _change_to_24h_format(self._ariston_data_actual["zone"]["derogaUntil"])
         except:
+            deroga_until = DEFAULT_TIME
             pass
+        set_data["NewValue"] = _copy_on_write(self._ariston_data_actual, ["zone", "derogaUntil"], deroga_until)
+        set_data["OldValue"] = set_data["NewValue"]
 
-    def _preparing_setting_http_data(self, dummy=None):
-        """Preparing and setting http data"""
-        self._login_session()
-        with self._data_lock:
-            if not self._set_new_data_pending:
-                # initiated from schedule, no longer scheduled
-                self._set_scheduled = False
-            else:
-                # initiated from set_http_data, no longer pending
-                self._set_new_data_pending = False
-                for request_item in self._set_retry:
-                    self._set_retry[request_item] = 0
-                if self._set_scheduled:
-                    # we wait for another attempt after timeout, data will be set then
-                    return
-            if self._login and self.available and self._plant_id != "":
-
-                changed_parameter = {
-                    REQUEST_SET_MAIN: {},
-                    REQUEST_SET_OTHER: {},
-                    REQUEST_SET_UNITS: {}
-                }
-
-                set_data = {}
-                # prepare setting of main data dictionary
-                set_data["NewValue"] = copy.deepcopy(self._ariston_data_actual)
-                set_data["OldValue"] = copy.deepcopy(self._ariston_data_actual)
-                # Format is received in 12H format but for some reason REST tools send it fine but python must send 24H format
-                try:
-                    set_data["NewValue"]["zone"]["derogaUntil"] = _change_to_24h_format(
-                        self._ariston_data_actual["zone"]["derogaUntil"])
-                    set_data["OldValue"]["zone"]["derogaUntil"] = _change_to_24h_format(
-                        self._ariston_data_actual["zone"]["derogaUntil"])
-                except:
-                    set_data["NewValue"]["zone"]["derogaUntil"] = DEFAULT_TIME
-                    set_data["OldValue"]["zone"]["derogaUntil"] = DEFAULT_TIME
-                    pass
-
-                set_units_data = {}
-                try:
-                    set_units_data["measurementSystem"] = self._ariston_units_actual["measurementSystem"]
-                except:
-                    set_units_data["measurementSystem"] = UNKNOWN_UNITS
-                    pass
-
-                dhw_temp = {}
-                dhw_temp_time = {}
-                try:
-                    dhw_temp[PARAM_DHW_COMFORT_TEMPERATURE] = UNKNOWN_TEMP
-                    dhw_temp[PARAM_DHW_ECONOMY_TEMPERATURE] = UNKNOWN_TEMP
-                    dhw_temp_time[PARAM_DHW_COMFORT_TEMPERATURE] = 0
-                    dhw_temp_time[PARAM_DHW_ECONOMY_TEMPERATURE] = 0
-                    if self._get_time_end[REQUEST_GET_MAIN] > self._get_time_end[REQUEST_GET_OTHER] and \
-                            self._get_zero_temperature[PARAM_DHW_COMFORT_TEMPERATURE] == 0:
-                        if set_data["NewValue"]["dhwTimeProgSupported"]:
-                            dhw_temp[PARAM_DHW_COMFORT_TEMPERATURE] = set_data["NewValue"]["dhwTimeProgComfortTemp"][
-                                "value"]
-                            dhw_temp_time[PARAM_DHW_COMFORT_TEMPERATURE] = self._get_time_end[REQUEST_GET_MAIN]
-                        else:
-                            dhw_temp[PARAM_DHW_COMFORT_TEMPERATURE] = set_data["NewValue"]["dhwTemp"]["value"]
-                            dhw_temp_time[PARAM_DHW_COMFORT_TEMPERATURE] = self._get_time_end[REQUEST_GET_MAIN]
-                    else:
-                        for param_item in self._ariston_other_data_actual:
-                            if param_item["id"] == ARISTON_DHW_TIME_PROG_COMFORT:
-                                dhw_temp[PARAM_DHW_COMFORT_TEMPERATURE] = param_item["value"]
-                                dhw_temp_time[PARAM_DHW_COMFORT_TEMPERATURE] = self._get_time_end[REQUEST_GET_OTHER]
-
-                    if self._get_time_end[REQUEST_GET_MAIN] > self._get_time_end[REQUEST_GET_OTHER] and \
-                            self._get_zero_temperature[PARAM_DHW_ECONOMY_TEMPERATURE] == 0 and set_data["NewValue"][
-                        "dhwTimeProgSupported"]:
-                        dhw_temp[PARAM_DHW_ECONOMY_TEMPERATURE] = set_data["NewValue"]["dhwTimeProgEconomyTemp"][
-                            "value"]
-                        dhw_temp_time[PARAM_DHW_ECONOMY_TEMPERATURE] = self._get_time_end[REQUEST_GET_MAIN]
-                    else:
-                        for param_item in self._ariston_other_data_actual:
-                            if param_item["id"] == ARISTON_DHW_TIME_PROG_ECONOMY:
-                                dhw_temp[PARAM_DHW_ECONOMY_TEMPERATURE] = param_item["value"]
-                                dhw_temp_time[PARAM_DHW_ECONOMY_TEMPERATURE] = self._get_time_end[REQUEST_GET_OTHER]
-
-                except:
-                    dhw_temp[PARAM_DHW_COMFORT_TEMPERATURE] = UNKNOWN_TEMP
-                    dhw_temp[PARAM_DHW_ECONOMY_TEMPERATURE] = UNKNOWN_TEMP
-                    dhw_temp_time[PARAM_DHW_COMFORT_TEMPERATURE] = 0
-                    dhw_temp_time[PARAM_DHW_ECONOMY_TEMPERATURE] = 0
-                    pass
-
-                # prepare setting of parameter data dictionary
-                set_param_data = []
-
-                if PARAM_MODE in self._set_param:
-                    if set_data["NewValue"]["mode"] == self._set_param[PARAM_MODE]:
-                        if self._set_time_start[_set_request_for_parameter(PARAM_MODE)] < self._get_time_end[
-                            _get_request_for_parameter(PARAM_MODE)]:
-                            # value should be up to date and match to remove from setting
-                            del self._set_param[PARAM_MODE]
-                        else:
-                            # assume data was not yet changed
-                            changed_parameter[_set_request_for_parameter(PARAM_MODE)][
-                                _get_request_for_parameter(PARAM_MODE)] = True
-                    else:
-                        set_data["NewValue"]["mode"] = self._set_param[PARAM_MODE]
-                        changed_parameter[_set_request_for_parameter(PARAM_MODE)][
-                            _get_request_for_parameter(PARAM_MODE)] = True
-
-                if PARAM_DHW_SET_TEMPERATURE in self._set_param:
-                    if set_data["NewValue"]["dhwTemp"]["value"] == self._set_param[PARAM_DHW_SET_TEMPERATURE]:
-                        if self._set_time_start[_set_request_for_parameter(PARAM_DHW_SET_TEMPERATURE)] < \
-                                self._get_time_end[_get_request_for_parameter(PARAM_DHW_SET_TEMPERATURE)] and \
-                                self._get_zero_temperature[PARAM_DHW_SET_TEMPERATURE] == 0:
-                            # value should be up to date and match to remove from setting
-                            del self._set_param[PARAM_DHW_SET_TEMPERATURE]
-                        else:
-                            # assume data was not yet changed
-                            changed_parameter[_set_request_for_parameter(PARAM_DHW_SET_TEMPERATURE)][
-                                _get_request_for_parameter(PARAM_DHW_SET_TEMPERATURE)] = True
-                    else:
-                        set_data["NewValue"]["dhwTemp"]["value"] = self._set_param[PARAM_DHW_SET_TEMPERATURE]
-                        changed_parameter[_set_request_for_parameter(PARAM_DHW_SET_TEMPERATURE)][
-                            _get_request_for_parameter(PARAM_DHW_SET_TEMPERATURE)] = True
-
-                if PARAM_DHW_COMFORT_TEMPERATURE in self._set_param:
-                    if dhw_temp[PARAM_DHW_COMFORT_TEMPERATURE] == self._set_param[PARAM_DHW_COMFORT_TEMPERATURE]:
-                        if self._set_time_start[_set_request_for_parameter(PARAM_DHW_COMFORT_TEMPERATURE)] < \
-                                dhw_temp_time[PARAM_DHW_COMFORT_TEMPERATURE]:
-                            # value should be up to date and match to remove from setting
-                            del self._set_param[PARAM_DHW_COMFORT_TEMPERATURE]
-                        else:
-                            # assume data was not yet changed
-                            param_data = {
-                                "id": ARISTON_DHW_TIME_PROG_COMFORT,
-                                "newValue": self._set_param[PARAM_DHW_COMFORT_TEMPERATURE],
-                                "oldValue": set_data["NewValue"]["dhwTimeProgComfortTemp"]["value"]}
-                            set_param_data.append(param_data)
-                            changed_parameter[_set_request_for_parameter(PARAM_DHW_COMFORT_TEMPERATURE)][
-                                _get_request_for_parameter(PARAM_DHW_COMFORT_TEMPERATURE)] = True
-                    else:
-                        param_data = {
-                            "id": ARISTON_DHW_TIME_PROG_COMFORT,
-                            "newValue": self._set_param[PARAM_DHW_COMFORT_TEMPERATURE],
-                            "oldValue": set_data["NewValue"]["dhwTimeProgComfortTemp"]["value"]}
-                        set_param_data.append(param_data)
-                        changed_parameter[_set_request_for_parameter(PARAM_DHW_COMFORT_TEMPERATURE)][
-                            _get_request_for_parameter(PARAM_DHW_COMFORT_TEMPERATURE)] = True
-
-                if PARAM_DHW_ECONOMY_TEMPERATURE in self._set_param:
-                    if dhw_temp[PARAM_DHW_ECONOMY_TEMPERATURE] == self._set_param[PARAM_DHW_ECONOMY_TEMPERATURE]:
-                        if self._set_time_start[_set_request_for_parameter(PARAM_DHW_ECONOMY_TEMPERATURE)] < \
-                                dhw_temp_time[PARAM_DHW_ECONOMY_TEMPERATURE]:
-                            # value should be up to date and match to remove from setting
-                            del self._set_param[PARAM_DHW_ECONOMY_TEMPERATURE]
-                        else:
-                            # assume data was not yet changed
-                            param_data = {
-                                "id": ARISTON_DHW_TIME_PROG_ECONOMY,
-                                "newValue": self._set_param[PARAM_DHW_ECONOMY_TEMPERATURE],
-                                "oldValue": set_data["NewValue"]["dhwTimeProgEconomyTemp"]["value"]}
-                            set_param_data.append(param_data)
-                            changed_parameter[_set_request_for_parameter(PARAM_DHW_ECONOMY_TEMPERATURE)][
-                                _get_request_for_parameter(PARAM_DHW_ECONOMY_TEMPERATURE)] = True
-                    else:
-                        param_data = {
-                            "id": ARISTON_DHW_TIME_PROG_ECONOMY,
-                            "newValue": self._set_param[PARAM_DHW_ECONOMY_TEMPERATURE],
-                            "oldValue": set_data["NewValue"]["dhwTimeProgEconomyTemp"]["value"]}
-                        set_param_data.append(param_data)
-                        changed_parameter[_set_request_for_parameter(PARAM_DHW_ECONOMY_TEMPERATURE)][
-                            _get_request_for_parameter(PARAM_DHW_ECONOMY_TEMPERATURE)] = True
-
-                if PARAM_DHW_COMFORT_FUNCTION in self._set_param:
-                    try:
-                        for param_item in self._ariston_other_data_actual:
-                            if param_item["id"] == ARISTON_DHW_COMFORT_FUNCTION:
-                                if param_item["value"] == self._set_param[PARAM_DHW_COMFORT_FUNCTION]:
-                                    if self._set_time_start[_set_request_for_parameter(PARAM_DHW_COMFORT_FUNCTION)] < \
-                                            self._get_time_end[_get_request_for_parameter(PARAM_DHW_COMFORT_FUNCTION)]:
-                                        # value should be up to date and match to remove from setting
-                                        del self._set_param[PARAM_DHW_COMFORT_FUNCTION]
-                                    else:
-                                        # assume data was not yet changed
-                                        param_data = {
-                                            "id": ARISTON_DHW_COMFORT_FUNCTION,
-                                            "newValue": self._set_param[PARAM_DHW_COMFORT_FUNCTION],
-                                            "oldValue": param_item["value"]}
-                                        set_param_data.append(param_data)
-                                        changed_parameter[_set_request_for_parameter(PARAM_DHW_COMFORT_FUNCTION)][
-                                            _get_request_for_parameter(PARAM_DHW_COMFORT_FUNCTION)] = True
-                                    break
-                                else:
-                                    param_data = {
-                                        "id": ARISTON_DHW_COMFORT_FUNCTION,
-                                        "newValue": self._set_param[PARAM_DHW_COMFORT_FUNCTION],
-                                        "oldValue": param_item["value"]}
-                                    set_param_data.append(param_data)
-                                    changed_parameter[_set_request_for_parameter(PARAM_DHW_COMFORT_FUNCTION)][
-                                        _get_request_for_parameter(PARAM_DHW_COMFORT_FUNCTION)] = True
-                                    break
-                    except:
-                        changed_parameter[_set_request_for_parameter(PARAM_DHW_COMFORT_FUNCTION)][
-                            _get_request_for_parameter(PARAM_DHW_COMFORT_FUNCTION)] = True
-                        pass
+        set_units_data = {}
+        try:
+            set_units_data["measurementSystem"] = self._ariston_units_actual["measurementSystem"]
+        except:
+            set_units_data["measurementSystem"] = UNKNOWN_UNITS
+            pass
 
-                if PARAM_INTERNET_TIME in self._set_param:
-                    try:
-                        for param_item in self._ariston_other_data_actual:
-                            if param_item["id"] == ARISTON_INTERNET_TIME:
-                                if param_item["value"] == self._set_param[PARAM_INTERNET_TIME]:
-                                    if self._set_time_start[_set_request_for_parameter(PARAM_INTERNET_TIME)] < \
-                                            self._get_time_end[_get_request_for_parameter(PARAM_INTERNET_TIME)]:
-                                        # value should be up to date and match to remove from setting
-                                        del self._set_param[PARAM_INTERNET_TIME]
-                                    else:
-                                        # assume data was not yet changed
-                                        param_data = {
-                                            "id": ARISTON_INTERNET_TIME,
-                                            "newValue": self._set_param[PARAM_INTERNET_TIME],
-                                            "oldValue": param_item["value"]}
-                                        set_param_data.append(param_data)
-                                        changed_parameter[_set_request_for_parameter(PARAM_INTERNET_TIME)][
-                                            _get_request_for_parameter(PARAM_INTERNET_TIME)] = True
-                                    break
-                                else:
-                                    param_data = {
-                                        "id": ARISTON_INTERNET_TIME,
-                                        "newValue": self._set_param[PARAM_INTERNET_TIME],
-                                        "oldValue": param_item["value"]}
-                                    set_param_data.append(param_data)
-                                    changed_parameter[_set_request_for_parameter(PARAM_INTERNET_TIME)][
-                                        _get_request_for_parameter(PARAM_INTERNET_TIME)] = True
-                                    break
-                    except:
-                        changed_parameter[_set_request_for_parameter(PARAM_INTERNET_TIME)][
-                            _get_request_for_parameter(PARAM_INTERNET_TIME)] = True
-                        pass
+        dhw_temp = {}
+        dhw_temp_time = {}
+        try:
+            dhw_temp[PARAM_DHW_COMFORT_TEMPERATURE] = UNKNOWN_TEMP
+            dhw_temp[PARAM_DHW_ECONOMY_TEMPERATURE] = UNKNOWN_TEMP
+            dhw_temp_time[PARAM_DHW_COMFORT_TEMPERATURE] = 0
+            dhw_temp_time[PARAM_DHW_ECONOMY_TEMPERATURE] = 0
+            if self._get_time_end[REQUEST_GET_MAIN] > self._get_time_end[REQUEST_GET_OTHER] and \
+                    self._get_zero_temperature[PARAM_DHW_COMFORT_TEMPERATURE] == 0:
+                if set_data["NewValue"]["dhwTimeProgSupported"]:
+                    dhw_temp[PARAM_DHW_COMFORT_TEMPERATURE] = set_data["NewValue"]["dhwTimeProgComfortTemp"][
+                        "value"]
+                    dhw_temp_time[PARAM_DHW_COMFORT_TEMPERATURE] = self._get_time_end[REQUEST_GET_MAIN]
+                else:
+                    dhw_temp[PARAM_DHW_COMFORT_TEMPERATURE] = set_data["NewValue"]["dhwTemp"]["value"]
+                    dhw_temp_time[PARAM_DHW_COMFORT_TEMPERATURE] = self._get_time_end[REQUEST_GET_MAIN]
+            else:
+                if ARISTON_DHW_TIME_PROG_COMFORT in self._ariston_other_param_actual:
+                    param_item = self._ariston_other_param_actual[ARISTON_DHW_TIME_PROG_COMFORT]
+                    dhw_temp[PARAM_DHW_COMFORT_TEMPERATURE] = param_item["value"]
+                    dhw_temp_time[PARAM_DHW_COMFORT_TEMPERATURE] = self._get_time_end[REQUEST_GET_OTHER]
+
+            if self._get_time_end[REQUEST_GET_MAIN] > self._get_time_end[REQUEST_GET_OTHER] and \
+                    self._get_zero_temperature[PARAM_DHW_ECONOMY_TEMPERATURE] == 0 and set_data["NewValue"][
+                "dhwTimeProgSupported"]:
+                dhw_temp[PARAM_DHW_ECONOMY_TEMPERATURE] = set_data["NewValue"]["dhwTimeProgEconomyTemp"][
+                    "value"]
+                dhw_temp_time[PARAM_DHW_ECONOMY_TEMPERATURE] = self._get_time_end[REQUEST_GET_MAIN]
+            else:
+                if ARISTON_DHW_TIME_PROG_ECONOMY in self._ariston_other_param_actual:
+                    param_item = self._ariston_other_param_actual[ARISTON_DHW_TIME_PROG_ECONOMY]
+                    dhw_temp[PARAM_DHW_ECONOMY_TEMPERATURE] = param_item["value"]
+                    dhw_temp_time[PARAM_DHW_ECONOMY_TEMPERATURE] = self._get_time_end[REQUEST_GET_OTHER]
 
-                if PARAM_INTERNET_WEATHER in self._set_param:
-                    try:
-                        for param_item in self._ariston_other_data_actual:
-                            if param_item["id"] == ARISTON_INTERNET_WEATHER:
-                                if param_item["value"] == self._set_param[PARAM_INTERNET_WEATHER]:
-                                    if self._set_time_start[_set_request_for_parameter(PARAM_INTERNET_WEATHER)] < \
-                                            self._get_time_end[_get_request_for_parameter(PARAM_INTERNET_WEATHER)]:
-                                        # value should be up to date and match to remove from setting
-                                        del self._set_param[PARAM_INTERNET_WEATHER]
-                                    else:
-                                        # assume data was not yet changed
-                                        param_data = {
-                                            "id": ARISTON_INTERNET_WEATHER,
-                                            "newValue": self._set_param[PARAM_INTERNET_WEATHER],
-                                            "oldValue": param_item["value"]}
-                                        set_param_data.append(param_data)
-                                        changed_parameter[_set_request_for_parameter(PARAM_INTERNET_WEATHER)][
-                                            _get_request_for_parameter(PARAM_INTERNET_WEATHER)] = True
-                                    break
-                                else:
-                                    param_data = {
-                                        "id": ARISTON_INTERNET_WEATHER,
-                                        "newValue": self._set_param[PARAM_INTERNET_WEATHER],
-                                        "oldValue": param_item["value"]}
-                                    set_param_data.append(param_data)
-                                    changed_parameter[_set_request_for_parameter(PARAM_INTERNET_WEATHER)][
-                                        _get_request_for_parameter(PARAM_INTERNET_WEATHER)] = True
-                                    break
-                    except:
-                        changed_parameter[_set_request_for_parameter(PARAM_INTERNET_WEATHER)][
-                            _get_request_for_parameter(PARAM_INTERNET_WEATHER)] = True
-                        pass
+        except:
+            dhw_temp[PARAM_DHW_COMFORT_TEMPERATURE] = UNKNOWN_TEMP
+            dhw_temp[PARAM_DHW_ECONOMY_TEMPERATURE] = UNKNOWN_TEMP
+            dhw_temp_time[PARAM_DHW_COMFORT_TEMPERATURE] = 0
+            dhw_temp_time[PARAM_DHW_ECONOMY_TEMPERATURE] = 0
+            pass
 
-                if PARAM_THERMAL_CLEANSE_CYCLE in self._set_param:
-                    try:
-                        for param_item in self._ariston_other_data_actual:
-                            if param_item["id"] == ARISTON_THERMAL_CLEANSE_CYCLE:
-                                if param_item["value"] == self._set_param[PARAM_THERMAL_CLEANSE_CYCLE]:
-                                    if self._set_time_start[_set_request_for_parameter(PARAM_THERMAL_CLEANSE_CYCLE)] < \
-                                            self._get_time_end[
-                                                _get_request_for_parameter(PARAM_THERMAL_CLEANSE_CYCLE)]:
-                                        # value should be up to date and match to remove from setting
-                                        del self._set_param[PARAM_THERMAL_CLEANSE_CYCLE]
-                                    else:
-                                        # assume data was not yet changed
-                                        param_data = {
-                                            "id": ARISTON_THERMAL_CLEANSE_CYCLE,
-                                            "newValue": self._set_param[PARAM_THERMAL_CLEANSE_CYCLE],
-                                            "oldValue": param_item["value"]}
-                                        set_param_data.append(param_data)
-                                        changed_parameter[_set_request_for_parameter(PARAM_THERMAL_CLEANSE_CYCLE)][
-                                            _get_request_for_parameter(PARAM_THERMAL_CLEANSE_CYCLE)] = True
-                                    break
-                                else:
-                                    param_data = {
-                                        "id": ARISTON_THERMAL_CLEANSE_CYCLE,
-                                        "newValue": self._set_param[PARAM_THERMAL_CLEANSE_CYCLE],
-                                        "oldValue": param_item["value"]}
-                                    set_param_data.append(param_data)
-                                    changed_parameter[_set_request_for_parameter(PARAM_THERMAL_CLEANSE_CYCLE)][
-                                        _get_request_for_parameter(PARAM_THERMAL_CLEANSE_CYCLE)] = True
-                                    break
-                    except:
-                        changed_parameter[_set_request_for_parameter(PARAM_THERMAL_CLEANSE_CYCLE)][
-                            _get_request_for_parameter(PARAM_THERMAL_CLEANSE_CYCLE)] = True
-                        pass
+        # prepare setting of parameter data dictionary
+        set_param_data = []
 
-                if PARAM_THERMAL_CLEANSE_FUNCTION in self._set_param:
-                    try:
-                        for param_item in self._ariston_other_data_actual:
-                            if param_item["id"] == ARISTON_THERMAL_CLEANSE_FUNCTION:
-                                if param_item["value"] == self._set_param[PARAM_THERMAL_CLEANSE_FUNCTION]:
-                                    if self._set_time_start[
-                                        _set_request_for_parameter(PARAM_THERMAL_CLEANSE_FUNCTION)] < \
-                                            self._get_time_end[
-                                                _get_request_for_parameter(PARAM_THERMAL_CLEANSE_FUNCTION)]:
-                                        # value should be up to date and match to remove from setting
-                                        del self._set_param[PARAM_THERMAL_CLEANSE_FUNCTION]
-                                    else:
-                                        # assume data was not yet changed
-                                        param_data = {
-                                            "id": ARISTON_THERMAL_CLEANSE_FUNCTION,
-                                            "newValue": self._set_param[PARAM_THERMAL_CLEANSE_FUNCTION],
-                                            "oldValue": param_item["value"]}
-                                        set_param_data.append(param_data)
-                                        changed_parameter[_set_request_for_parameter(PARAM_THERMAL_CLEANSE_FUNCTION)][
-                                            _get_request_for_parameter(PARAM_THERMAL_CLEANSE_FUNCTION)] = True
-                                    break
-                                else:
-                                    param_data = {
-                                        "id": ARISTON_THERMAL_CLEANSE_FUNCTION,
-                                        "newValue": self._set_param[PARAM_THERMAL_CLEANSE_FUNCTION],
-                                        "oldValue": param_item["value"]}
-                                    set_param_data.append(param_data)
-                                    changed_parameter[_set_request_for_parameter(PARAM_THERMAL_CLEANSE_FUNCTION)][
-                                        _get_request_for_parameter(PARAM_THERMAL_CLEANSE_FUNCTION)] = True
-                                    break
-                    except:
-                        changed_parameter[_set_request_for_parameter(PARAM_THERMAL_CLEANSE_FUNCTION)][
-                            _get_request_for_parameter(PARAM_THERMAL_CLEANSE_FUNCTION)] = True
-                        pass
+        # values being replaced are taken from payloads being built, parameters from their index by id
+        set_payload = {
+            REQUEST_GET_MAIN: set_data["NewValue"],
+            REQUEST_GET_OTHER: self._ariston_other_param_actual,
+            REQUEST_GET_UNITS: set_units_data
+        }
+        for parameter, wanted in list(self._set_param.items()):
+            request_group, path, set_request, param_id = SET_PARAM_MAPPING[parameter]
+            try:
+                fetched = set_payload[request_group]
+                for key in path:
+                    fetched = fetched[key]
+            except:
+                # parameter is not supported by fetched data
+                continue
+            if parameter in dhw_temp:
+                # value is taken from main data or parameters depending on which was fetched later
+                current = dhw_temp[parameter]
+                fetched_time = dhw_temp_time[parameter]
+            else:
+                current = fetched
+                fetched_time = self._get_time_end[request_group]
+                if self._get_zero_temperature.get(parameter, 0) != 0:
+                    # tolerated zero value was replaced by the last known one
+                    fetched_time = 0
+            if current == wanted and self._set_time_start[set_request] < fetched_time:
+                # value should be up to date and match to remove from setting
+                del self._set_param[parameter]
+                continue
+            # either value differs or data was not yet changed
+            changed_parameter[set_request][request_group] = True
+            if set_request == REQUEST_SET_OTHER:
+                set_param_data.append({
+                    "id": param_id,
+                    "newValue": wanted,
+                    "oldValue": fetched})
+            elif current != wanted:
+                set_payload[request_group] = _copy_on_write(set_payload[request_group], path, wanted)
+        set_data["NewValue"] = set_payload[REQUEST_GET_MAIN]
+        set_units_data = set_payload[REQUEST_GET_UNITS]
+        return changed_parameter, set_data, set_param_data, set_units_data
+
+    async def _async_preparing_setting_http_data(self, dummy=None):
+        """Preparing and setting http data"""
+        try:
+            await self._async_login_session()
+        except AristonError:
+            # not logged in, retry is scheduled below
+            pass
+        set_requests = []
+        if not self._set_new_data_pending:
+            # initiated from schedule, no longer scheduled
+            self._set_scheduled = False
+        else:
+            # initiated from set_http_data, no longer pending, new changes start new coalescing window
+            self._set_new_data_pending = False
+            self._set_coalescing = False
+            for request_item in self._set_retry:
+                self._set_retry[request_item] = 0
+            if self._set_scheduled:
+                # we wait for another attempt after timeout, data will be set then
+                return
+        if self._login and self.available and self._plant_id != "" and self._breaker.closed:
 
-                if PARAM_CH_AUTO_FUNCTION in self._set_param:
-                    try:
-                        for param_item in self._ariston_other_data_actual:
-                            if param_item["id"] == ARISTON_CH_AUTO_FUNCTION:
-                                if param_item["value"] == self._set_param[PARAM_CH_AUTO_FUNCTION]:
-                                    if self._set_time_start[_set_request_for_parameter(PARAM_CH_AUTO_FUNCTION)] < \
-                                            self._get_time_end[_get_request_for_parameter(PARAM_CH_AUTO_FUNCTION)]:
-                                        # value should be up to date and match to remove from setting
-                                        del self._set_param[PARAM_CH_AUTO_FUNCTION]
-                                    else:
-                                        # assume data was not yet changed
-                                        param_data = {
-                                            "id": ARISTON_CH_AUTO_FUNCTION,
-                                            "newValue": self._set_param[PARAM_CH_AUTO_FUNCTION],
-                                            "oldValue": param_item["value"]}
-                                        set_param_data.append(param_data)
-                                        changed_parameter[_set_request_for_parameter(PARAM_CH_AUTO_FUNCTION)][
-                                            _get_request_for_parameter(PARAM_CH_AUTO_FUNCTION)] = True
-                                    break
-                                else:
-                                    param_data = {
-                                        "id": ARISTON_CH_AUTO_FUNCTION,
-                                        "newValue": self._set_param[PARAM_CH_AUTO_FUNCTION],
-                                        "oldValue": param_item["value"]}
-                                    set_param_data.append(param_data)
-                                    changed_parameter[_set_request_for_parameter(PARAM_CH_AUTO_FUNCTION)][
-                                        _get_request_for_parameter(PARAM_CH_AUTO_FUNCTION)] = True
-                                    break
-                    except:
-                        changed_parameter[_set_request_for_parameter(PARAM_CH_AUTO_FUNCTION)][
-                            _get_request_for_parameter(PARAM_CH_AUTO_FUNCTION)] = True
-                        pass
+            changed_parameter, set_data, set_param_data, set_units_data = self._prepare_set_data()
 
-                if PARAM_CH_SET_TEMPERATURE in self._set_param:
-                    if set_data["NewValue"]["zone"]["comfortTemp"]["value"] == self._set_param[
-                        PARAM_CH_SET_TEMPERATURE]:
-                        if self._set_time_start[_set_request_for_parameter(PARAM_CH_SET_TEMPERATURE)] < \
-                                self._get_time_end[_get_request_for_parameter(PARAM_CH_SET_TEMPERATURE)] and \
-                                self._get_zero_temperature[PARAM_CH_SET_TEMPERATURE] == 0:
-                            # value should be up to date and match to remove from setting
-                            del self._set_param[PARAM_CH_SET_TEMPERATURE]
-                        else:
-                            # assume data was not yet changed
-                            changed_parameter[_set_request_for_parameter(PARAM_CH_SET_TEMPERATURE)][
-                                _get_request_for_parameter(PARAM_CH_SET_TEMPERATURE)] = True
-                    else:
-                        set_data["NewValue"]["zone"]["comfortTemp"]["value"] = self._set_param[PARAM_CH_SET_TEMPERATURE]
-                        changed_parameter[_set_request_for_parameter(PARAM_CH_SET_TEMPERATURE)][
-                            _get_request_for_parameter(PARAM_CH_SET_TEMPERATURE)] = True
+            for request_item in self._set_param_group:
+                self._set_param_group[request_item] = False
 
-                if PARAM_CH_COMFORT_TEMPERATURE in self._set_param:
-                    try:
-                        for param_item in self._ariston_other_data_actual:
-                            if param_item["id"] == ARISTON_CH_COMFORT_TEMP:
-                                if param_item["value"] == self._set_param[PARAM_CH_COMFORT_TEMPERATURE]:
-                                    if self._set_time_start[_set_request_for_parameter(PARAM_CH_COMFORT_TEMPERATURE)] < \
-                                            self._get_time_end[
-                                                _get_request_for_parameter(PARAM_CH_COMFORT_TEMPERATURE)]:
-                                        # value should be up to date and match to remove from setting
-                                        del self._set_param[PARAM_CH_COMFORT_TEMPERATURE]
-                                    else:
-                                        # assume data was not yet changed
-                                        param_data = {
-                                            "id": ARISTON_CH_COMFORT_TEMP,
-                                            "newValue": self._set_param[PARAM_CH_COMFORT_TEMPERATURE],
-                                            "oldValue": param_item["value"]}
-                                        set_param_data.append(param_data)
-                                        changed_parameter[_set_request_for_parameter(PARAM_CH_COMFORT_TEMPERATURE)][
-                                            _get_request_for_parameter(PARAM_CH_COMFORT_TEMPERATURE)] = True
-                                    break
-                                else:
-                                    param_data = {
-                                        "id": ARISTON_CH_COMFORT_TEMP,
-                                        "newValue": self._set_param[PARAM_CH_COMFORT_TEMPERATURE],
-                                        "oldValue": param_item["value"]}
-                                    set_param_data.append(param_data)
-                                    changed_parameter[_set_request_for_parameter(PARAM_CH_COMFORT_TEMPERATURE)][
-                                        _get_request_for_parameter(PARAM_CH_COMFORT_TEMPERATURE)] = True
-                                    break
-                    except:
-                        changed_parameter[_set_request_for_parameter(PARAM_CH_COMFORT_TEMPERATURE)][
-                            _get_request_for_parameter(PARAM_CH_COMFORT_TEMPERATURE)] = True
-                        pass
+            for key, value in changed_parameter.items():
+                if value != {} and self._set_retry[key] < self._set_max_retries:
+                    if not self._set_scheduled:
+                        # retry again after enough time
+                        retry_in = timedelta(seconds=self._timer_between_param_delay + HTTP_TIMER_SET_WAIT)
+                        async_track_point_in_time(self._hass, self._async_preparing_setting_http_data,
+                                                  dt_util.now() + retry_in)
+                        self._set_retry[key] += 1
+                        self._set_scheduled = True
+                elif value != {} and self._set_retry[key] == self._set_max_retries:
+                    # last retry, we keep changed parameter but do not schedule anything
+                    self._set_retry[key] += 1
+                else:
+                    changed_parameter[key] = {}
 
-                if PARAM_CH_ECONOMY_TEMPERATURE in self._set_param:
-                    try:
-                        for param_item in self._ariston_other_data_actual:
-                            if param_item["id"] == ARISTON_CH_ECONOMY_TEMP:
-                                if param_item["value"] == self._set_param[PARAM_CH_ECONOMY_TEMPERATURE]:
-                                    if self._set_time_start[_set_request_for_parameter(PARAM_CH_ECONOMY_TEMPERATURE)] < \
-                                            self._get_time_end[
-                                                _get_request_for_parameter(PARAM_CH_ECONOMY_TEMPERATURE)]:
-                                        # value should be up to date and match to remove from setting
-                                        del self._set_param[PARAM_CH_ECONOMY_TEMPERATURE]
-                                    else:
-                                        # assume data was not yet changed
-                                        param_data = {
-                                            "id": ARISTON_CH_ECONOMY_TEMP,
-                                            "newValue": self._set_param[PARAM_CH_ECONOMY_TEMPERATURE],
-                                            "oldValue": param_item["value"]}
-                                        set_param_data.append(param_data)
-                                        changed_parameter[_set_request_for_parameter(PARAM_CH_ECONOMY_TEMPERATURE)][
-                                            _get_request_for_parameter(PARAM_CH_ECONOMY_TEMPERATURE)] = True
-                                    break
-                                else:
-                                    param_data = {
-                                        "id": ARISTON_CH_ECONOMY_TEMP,
-                                        "newValue": self._set_param[PARAM_CH_ECONOMY_TEMPERATURE],
-                                        "oldValue": param_item["value"]}
-                                    set_param_data.append(param_data)
-                                    changed_parameter[_set_request_for_parameter(PARAM_CH_ECONOMY_TEMPERATURE)][
-                                        _get_request_for_parameter(PARAM_CH_ECONOMY_TEMPERATURE)] = True
-                                    break
-                    except:
-                        changed_parameter[_set_request_for_parameter(PARAM_CH_ECONOMY_TEMPERATURE)][
-                            _get_request_for_parameter(PARAM_CH_ECONOMY_TEMPERATURE)] = True
-                        pass
+            try:
+                for parameter, value in self._set_param.items():
+                    if get_request_for_parameter(parameter) not in changed_parameter[
+                        _set_request_for_parameter(parameter)]:
+                        del self._set_param[parameter]
+            except:
+                pass
 
-                if PARAM_CH_MODE in self._set_param:
-                    if set_data["NewValue"]["zone"]["mode"]["value"] == self._set_param[PARAM_CH_MODE]:
-                        if self._set_time_start[_set_request_for_parameter(PARAM_CH_MODE)] < self._get_time_end[
-                            _get_request_for_parameter(PARAM_CH_MODE)]:
-                            # value should be up to date and match to remove from setting
-                            del self._set_param[PARAM_CH_MODE]
-                        else:
-                            # assume data was not yet changed
-                            changed_parameter[_set_request_for_parameter(PARAM_CH_MODE)][
-                                _get_request_for_parameter(PARAM_CH_MODE)] = True
-                    else:
-                        set_data["NewValue"]["zone"]["mode"]["value"] = self._set_param[PARAM_CH_MODE]
-                        changed_parameter[_set_request_for_parameter(PARAM_CH_MODE)][
-                            _get_request_for_parameter(PARAM_CH_MODE)] = True
-
-                if PARAM_DHW_MODE in self._set_param:
-                    if set_data["NewValue"]["dhwMode"] == self._set_param[PARAM_DHW_MODE]:
-                        if self._set_time_start[_set_request_for_parameter(PARAM_DHW_MODE)] < self._get_time_end[
-                            _get_request_for_parameter(PARAM_DHW_MODE)]:
-                            # value should be up to date and match to remove from setting
-                            del self._set_param[PARAM_DHW_MODE]
-                        else:
-                            # assume data was not yet changed
-                            changed_parameter[_set_request_for_parameter(PARAM_DHW_MODE)][
-                                _get_request_for_parameter(PARAM_DHW_MODE)] = True
-                    else:
-                        set_data["NewValue"]["dhwMode"] = self._set_param[PARAM_DHW_MODE]
-                        changed_parameter[_set_request_for_parameter(PARAM_DHW_MODE)][
-                            _get_request_for_parameter(PARAM_DHW_MODE)] = True
-
-                if PARAM_UNITS in self._set_param:
-                    if set_units_data["measurementSystem"] == self._set_param[PARAM_UNITS]:
-                        if self._set_time_start[_set_request_for_parameter(PARAM_UNITS)] < self._get_time_end[
-                            _get_request_for_parameter(PARAM_UNITS)]:
-                            # value should be up to date and match to remove from setting
-                            del self._set_param[PARAM_UNITS]
-                        else:
-                            # assume data was not yet changed
-                            changed_parameter[_set_request_for_parameter(PARAM_UNITS)][
-                                _get_request_for_parameter(PARAM_UNITS)] = True
-                    else:
-                        set_units_data["measurementSystem"] = self._set_param[PARAM_UNITS]
-                        changed_parameter[_set_request_for_parameter(PARAM_UNITS)][
-                            _get_request_for_parameter(PARAM_UNITS)] = True
+            # show data as changed in case we were able to read data in between requests
+            self._set_visible_data()
 
-                for request_item in self._set_param_group:
-                    self._set_param_group[request_item] = False
+            # all changed groups are set within the same attempt
+            if changed_parameter[REQUEST_SET_MAIN] != {}:
+                set_requests.append((set_data, REQUEST_SET_MAIN))
 
-                for key, value in changed_parameter.items():
-                    if value != {} and self._set_retry[key] < self._set_max_retries:
-                        if not self._set_scheduled:
-                            # retry again after enough time
-                            if self._timer_between_set == VAL_NORMAL:
-                                retry_in = timedelta(seconds=self._timer_between_param_delay + HTTP_TIMER_SET_WAIT)
-                            else:
-                                retry_in = timedelta(
-                                    seconds=self._timer_between_param_delay * HTTP_DELAY_MULTIPLY + HTTP_TIMER_SET_WAIT)
-                            track_point_in_time(self._hass, self._preparing_setting_http_data,
-                                                dt_util.now() + retry_in)
-                            self._set_retry[key] += 1
-                            self._set_scheduled = True
-                    elif value != {} and self._set_retry[key] == self._set_max_retries:
-                        # last retry, we keep changed parameter but do not schedule anything
-                        self._set_retry[key] += 1
-                    else:
-                        changed_parameter[key] = {}
+            if changed_parameter[REQUEST_SET_OTHER] != {}:
 
-                try:
-                    for parameter, value in self._set_param.items():
-                        if _get_request_for_parameter(parameter) not in changed_parameter[
-                            _set_request_for_parameter(parameter)]:
-                            del self._set_param[parameter]
-                except:
-                    pass
+                if set_param_data != []:
+                    set_requests.append((set_param_data, REQUEST_SET_OTHER))
+                else:
+                    _LOGGER.warning('%s No valid data to set parameters', self)
 
-                # show data as changed in case we were able to read data in between requests
-                self._set_visible_data()
+            if changed_parameter[REQUEST_SET_UNITS] != {}:
+                set_requests.append((set_units_data, REQUEST_SET_UNITS))
 
-                if changed_parameter[REQUEST_SET_MAIN] != {}:
-                    try:
-                        self._setting_http_data(set_data, REQUEST_SET_MAIN)
-                    except:
-                        pass
+            if set_requests == []:
+                _LOGGER.debug('%s Same data was used', self)
 
-                elif changed_parameter[REQUEST_SET_OTHER] != {}:
+            for key, value in changed_parameter.items():
+                if value != {}:
+                    for request_item in value:
+                        self._set_param_group[request_item] = True
 
-                    try:
-                        if set_param_data != []:
-                            self._setting_http_data(set_param_data, REQUEST_SET_OTHER)
-                        else:
-                            _LOGGER.warning('%s No valid data to set parameters', self)
-                            raise CommError(error)
-                    except:
-                        pass
+            if not self._set_scheduled:
+                # no more retries or no changes, no need to keep any changed data
+                self._set_param = {}
 
-                elif changed_parameter[REQUEST_SET_UNITS] != {}:
-                    try:
-                        self._setting_http_data(set_units_data, REQUEST_SET_UNITS)
-                    except:
-                        pass
+            if self._store_file:
+                self._store_files({'_all_set_get.json': self._set_param_group, '_all_set.json': self._set_param})
 
+        else:
+            # api is down or requests are paused
+            if not self._set_scheduled:
+                if self._set_retry[REQUEST_SET_MAIN] < self._set_max_retries:
+                    if self._breaker.closed:
+                        # retry again after enough time to fetch data twice
+                        retry_in = timedelta(seconds=self._timer_between_param_delay + HTTP_TIMER_SET_WAIT)
+                    else:
+                        # nothing is sent until the probe, so retry when it is due
+                        retry_in = timedelta(seconds=self._breaker.time_to_probe())
+                    async_track_point_in_time(self._hass, self._async_preparing_setting_http_data,
+                                              dt_util.now() + retry_in)
+                    self._set_retry[REQUEST_SET_MAIN] += 1
+                    self._set_scheduled = True
                 else:
-                    _LOGGER.debug('%s Same data was used', self)
-
-                for key, value in changed_parameter.items():
-                    if value != {}:
-                        for request_item in value:
-                            self._set_param_group[request_item] = True
-
-                if not self._set_scheduled:
-                    # no more retries or no changes, no need to keep any changed data
+                    # no more retries, no need to keep changed data
                     self._set_param = {}
 
-                if self._store_file:
-                    with open('/config/data_' + self._name + '_all_set_get.json', 'w') as ariston_fetched:
-                        json.dump(self._set_param_group, ariston_fetched)
-                    with open('/config/data_' + self._name + '_all_set.json', 'w') as ariston_fetched:
-                        json.dump(self._set_param, ariston_fetched)
+                    # clear temporary set data
+                    self._ariston_data = self._ariston_data_actual
+                    self._ariston_other_data = self._ariston_other_data_actual
+                    self._ariston_other_param = self._ariston_other_param_actual
+                    self._ariston_units = self._ariston_units_actual
+
+                    for request_item in self._set_param_group:
+                        self._set_param_group[request_item] = False
+
+                    if self._store_file:
+                        self._store_files({
+                            '_temp_main.json': self._ariston_data,
+                            '_temp_param.json': self._ariston_other_data,
+                            '_temp_units.json': self._ariston_units,
+                            '_all_set_get.json': self._set_param_group,
+                            '_all_set.json': self._set_param,
+                        })
+
+                    self._send_update_signal(self._set_param_group.keys())
+                    _LOGGER.warning("%s No stable connection to set the data", self)
+                    return
 
-            else:
-                # api is down
-                if not self._set_scheduled:
-                    if self._set_retry[REQUEST_SET_MAIN] < self._set_max_retries:
-                        # retry again after enough time to fetch data twice
-                        if self._timer_between_set == VAL_NORMAL:
-                            retry_in = timedelta(
-                                seconds=self._timer_between_param_delay + HTTP_TIMER_SET_WAIT)
-                        else:
-                            retry_in = timedelta(
-                                seconds=self._timer_between_param_delay * HTTP_DELAY_MULTIPLY + HTTP_TIMER_SET_WAIT)
-                        track_point_in_time(self._hass, self._preparing_setting_http_data,
-                                            dt_util.now() + retry_in)
-                        self._set_retry[REQUEST_SET_MAIN] += 1
-                        self._set_scheduled = True
-                    else:
-                        # no more retries, no need to keep changed data
-                        self._set_param = {}
-
-                        try:
-                            # clear temporary set data
-                            self._ariston_data = copy.deepcopy(self._ariston_data_actual)
-                            self._ariston_other_data = copy.deepcopy(self._ariston_other_data_actual)
-                            self._ariston_units = copy.deepcopy(self._ariston_units_actual)
-                        except:
-                            pass
-
-                        for request_item in self._set_param_group:
-                            self._set_param_group[request_item] = False
-
-                        if self._store_file:
-                            with open('/config/data_' + self._name + '_temp_main.json', 'w') as ariston_fetched:
-                                json.dump(self._ariston_data, ariston_fetched)
-                            with open('/config/data_' + self._name + '_temp_param.json', 'w') as ariston_fetched:
-                                json.dump(self._ariston_other_data, ariston_fetched)
-                            with open('/config/data_' + self._name + '_temp_units.json', 'w') as ariston_fetched:
-                                json.dump(self._ariston_units, ariston_fetched)
-                            with open('/config/data_' + self._name + '_all_set_get.json', 'w') as ariston_fetched:
-                                json.dump(self._set_param_group, ariston_fetched)
-                            with open('/config/data_' + self._name + '_all_set.json', 'w') as ariston_fetched:
-                                json.dump(self._set_param, ariston_fetched)
-
-                        _LOGGER.warning("%s No stable connection to set the data", self)
-                        raise CommError
+        # visible data or data being changed might have been updated
+        self._send_update_signal(self._set_param_group.keys())
+
+        # requests to different endpoints do not depend on each other, so they are sent concurrently
+        await asyncio.gather(*[self._async_send_set_request(request_data, request_type)
+                               for request_data, request_type in set_requests])
+
+        if set_requests != []:
+            # confirm changes soon instead of waiting for the retry
+            confirm_ongoing = self._set_confirm_delay is not None
+            self._set_confirm_delay = HTTP_SET_CONFIRM_DELAY
+            if not confirm_ongoing:
+                async_track_point_in_time(self._hass, self._async_confirm_set_data,
+                                          dt_util.now() + timedelta(seconds=self._set_confirm_delay))
+
+    def _confirm_set_param(self):
+        """Remove set parameters which are confirmed by data fetched after the set"""
+        fetched_data = {
+            REQUEST_GET_MAIN: self._ariston_data_actual,
+            REQUEST_GET_OTHER: self._ariston_other_param_actual,
+            REQUEST_GET_UNITS: self._ariston_units_actual
+        }
+        for parameter in list(self._set_param):
+            try:
+                request_group, path, _, _ = SET_PARAM_MAPPING[parameter]
+                if self._set_time_start[_set_request_for_parameter(parameter)] >= self._get_time_end[request_group]:
+                    continue
+                if parameter in self._get_zero_temperature and self._get_zero_temperature[parameter] != 0:
+                    # tolerated zero value was replaced by the last known one
+                    continue
+                value = fetched_data[request_group]
+                for key in path:
+                    value = value[key]
+                if value == self._set_param[parameter]:
+                    del self._set_param[parameter]
+            except:
+                continue
+
+    async def _async_confirm_set_data(self, dummy=None):
+        """Read data being changed until set values are confirmed, delay between reads grows exponentially"""
+        request_list = [request for request, changing in self._set_param_group.items() if changing]
+        if self._set_param == {} or request_list == []:
+            self._set_confirm_delay = None
+            return
+        await asyncio.gather(*[self._async_fetch_data(request_type, confirm=True) for request_type in request_list])
+        self._confirm_set_param()
+        if self._set_param == {}:
+            _LOGGER.info('%s Changes are confirmed', self)
+            for request_item in self._set_param_group:
+                self._set_param_group[request_item] = False
+            self._set_visible_data()
+            self._set_confirm_delay = None
+        else:
+            self._set_confirm_delay *= HTTP_SET_CONFIRM_BACKOFF
+            if self._set_confirm_delay > HTTP_SET_CONFIRM_MAX:
+                # changes are checked again by scheduled retry
+                self._set_confirm_delay = None
+        self._send_update_signal(self._set_param_group.keys())
+        if self._set_confirm_delay is not None:
+            async_track_point_in_time(self._hass, self._async_confirm_set_data,
+                                      dt_util.now() + timedelta(seconds=self._set_confirm_delay))
+
+    async def _async_send_set_request(self, set_data, request_type):
+        """Send one set request, requests are still limited together with reading of data"""
+        await self._limiter.async_acquire(REQUEST_PRIORITY[request_type])
+        queue_start = time.monotonic()
+        async with self._request_semaphore:
+            self._request_metrics.observe_queue_wait(request_type, time.monotonic() - queue_start)
+            try:
+                await self._async_setting_http_data(set_data, request_type)
+            except:
+                pass
 
     def set_http_data(self, parameter_list={}):
-        """Set Ariston data over http after data verification"""
+        """Set Ariston data over http after data verification, must be called from worker thread"""
         if self._ariston_data_actual != {}:
-            with self._data_lock:
+            # values are verified against data snapshots, changes are applied within event loop
+            set_param = {}
 
-                # check mode and set it
-                if PARAM_MODE in parameter_list:
-                    wanted_mode = str(parameter_list[PARAM_MODE]).lower()
-                    try:
-                        if wanted_mode in MODE_TO_VALUE and MODE_TO_VALUE[wanted_mode] in self._ariston_data_actual[
-                            "allowedModes"]:
-                            self._set_param[PARAM_MODE] = MODE_TO_VALUE[wanted_mode]
-                            _LOGGER.info('%s New mode %s', self, wanted_mode)
-                        else:
-                            _LOGGER.warning('%s Unknown or unsupported mode: %s', self, wanted_mode)
-                    except:
-                        _LOGGER.warning('%s Unknown or unsupported mode or key error: %s', self, wanted_mode)
-                        pass
+            # check mode and set it
+            if PARAM_MODE in parameter_list:
+                wanted_mode = str(parameter_list[PARAM_MODE]).lower()
+                try:
+                    if wanted_mode in MODE_TO_VALUE and MODE_TO_VALUE[wanted_mode] in self._ariston_data_actual[
+                        "allowedModes"]:
+                        set_param[PARAM_MODE] = MODE_TO_VALUE[wanted_mode]
+                        _LOGGER.info('%s New mode %s', self, wanted_mode)
+                    else:
+                        _LOGGER.warning('%s Unknown or unsupported mode: %s', self, wanted_mode)
+                except:
+                    _LOGGER.warning('%s Unknown or unsupported mode or key error: %s', self, wanted_mode)
+                    pass
 
-                # check dhw temperature
-                if PARAM_DHW_SET_TEMPERATURE in parameter_list:
-                    wanted_dhw_temperature = str(parameter_list[PARAM_DHW_SET_TEMPERATURE]).lower()
-                    try:
-                        # round to nearest 1
-                        temperature = round(float(wanted_dhw_temperature))
-                        dhw_temp_min = self._ariston_data_actual["dhwTimeProgEconomyTemp"]["min"]
-                        dhw_temp_max = self._ariston_data_actual["dhwTimeProgEconomyTemp"]["max"]
-                        if temperature >= dhw_temp_min and temperature <= dhw_temp_max:
-                            self._set_param[PARAM_DHW_SET_TEMPERATURE] = temperature
-                            _LOGGER.info('%s New DHW temperature %s', self, temperature)
-                        else:
-                            _LOGGER.warning('%s Not supported DHW temperature value: %s', self, wanted_dhw_temperature)
-                    except:
+            # check dhw temperature
+            if PARAM_DHW_SET_TEMPERATURE in parameter_list:
+                wanted_dhw_temperature = str(parameter_list[PARAM_DHW_SET_TEMPERATURE]).lower()
+                try:
+                    # round to nearest 1
+                    temperature = round(float(wanted_dhw_temperature))
+                    dhw_temp_min = self._ariston_data_actual["dhwTimeProgEconomyTemp"]["min"]
+                    dhw_temp_max = self._ariston_data_actual["dhwTimeProgEconomyTemp"]["max"]
+                    if temperature >= dhw_temp_min and temperature <= dhw_temp_max:
+                        set_param[PARAM_DHW_SET_TEMPERATURE] = temperature
+                        _LOGGER.info('%s New DHW temperature %s', self, temperature)
+                    else:
                         _LOGGER.warning('%s Not supported DHW temperature value: %s', self, wanted_dhw_temperature)
-                        pass
+                except:
+                    _LOGGER.warning('%s Not supported DHW temperature value: %s', self, wanted_dhw_temperature)
+                    pass
 
-                # check dhw comfort temperature
-                if PARAM_DHW_COMFORT_TEMPERATURE in parameter_list:
-                    wanted_dhw_temperature = str(parameter_list[PARAM_DHW_COMFORT_TEMPERATURE]).lower()
-                    try:
-                        # round to nearest 1
-                        temperature = round(float(wanted_dhw_temperature))
-                        dhw_temp_min = max(self._ariston_data_actual["dhwTemp"]["min"],
-                                           self._ariston_data_actual["dhwTimeProgComfortTemp"]["min"])
-                        dhw_temp_max = max(self._ariston_data_actual["dhwTemp"]["max"],
-                                           self._ariston_data_actual["dhwTimeProgComfortTemp"]["max"])
-                        if temperature >= dhw_temp_min and temperature <= dhw_temp_max:
-                            self._set_param[PARAM_DHW_COMFORT_TEMPERATURE] = temperature
-                            _LOGGER.info('%s New DHW scheduled comfort temperature %s', self, temperature)
-                        else:
-                            _LOGGER.warning('%s Not supported DHW scheduled comfort temperature value: %s', self,
-                                            wanted_dhw_temperature)
-                    except:
+            # check dhw comfort temperature
+            if PARAM_DHW_COMFORT_TEMPERATURE in parameter_list:
+                wanted_dhw_temperature = str(parameter_list[PARAM_DHW_COMFORT_TEMPERATURE]).lower()
+                try:
+                    # round to nearest 1
+                    temperature = round(float(wanted_dhw_temperature))
+                    dhw_temp_min = max(self._ariston_data_actual["dhwTemp"]["min"],
+                                       self._ariston_data_actual["dhwTimeProgComfortTemp"]["min"])
+                    dhw_temp_max = max(self._ariston_data_actual["dhwTemp"]["max"],
+                                       self._ariston_data_actual["dhwTimeProgComfortTemp"]["max"])
+                    if temperature >= dhw_temp_min and temperature <= dhw_temp_max:
+                        set_param[PARAM_DHW_COMFORT_TEMPERATURE] = temperature
+                        _LOGGER.info('%s New DHW scheduled comfort temperature %s', self, temperature)
+                    else:
                         _LOGGER.warning('%s Not supported DHW scheduled comfort temperature value: %s', self,
                                         wanted_dhw_temperature)
-                        pass
+                except:
+                    _LOGGER.warning('%s Not supported DHW scheduled comfort temperature value: %s', self,
+                                    wanted_dhw_temperature)
+                    pass
 
-                # check dhw economy temperature
-                if PARAM_DHW_ECONOMY_TEMPERATURE in parameter_list:
-                    wanted_dhw_temperature = str(parameter_list[PARAM_DHW_ECONOMY_TEMPERATURE]).lower()
-                    try:
-                        # round to nearest 1
-                        temperature = round(float(wanted_dhw_temperature))
-                        if temperature >= self._ariston_data_actual["dhwTemp"]["min"] and temperature <= \
-                                self._ariston_data_actual["dhwTemp"]["max"]:
-                            self._set_param[PARAM_DHW_ECONOMY_TEMPERATURE] = temperature
-                            _LOGGER.info('%s New DHW scheduled economy temperature %s', self, temperature)
-                        else:
-                            _LOGGER.warning('%s Not supported DHW scheduled economy temperature value: %s', self,
-                                            wanted_dhw_temperature)
-                    except:
+            # check dhw economy temperature
+            if PARAM_DHW_ECONOMY_TEMPERATURE in parameter_list:
+                wanted_dhw_temperature = str(parameter_list[PARAM_DHW_ECONOMY_TEMPERATURE]).lower()
+                try:
+                    # round to nearest 1
+                    temperature = round(float(wanted_dhw_temperature))
+                    if temperature >= self._ariston_data_actual["dhwTemp"]["min"] and temperature <= \
+                            self._ariston_data_actual["dhwTemp"]["max"]:
+                        set_param[PARAM_DHW_ECONOMY_TEMPERATURE] = temperature
+                        _LOGGER.info('%s New DHW scheduled economy temperature %s', self, temperature)
+                    else:
                         _LOGGER.warning('%s Not supported DHW scheduled economy temperature value: %s', self,
                                         wanted_dhw_temperature)
-                        pass
+                except:
+                    _LOGGER.warning('%s Not supported DHW scheduled economy temperature value: %s', self,
+                                    wanted_dhw_temperature)
+                    pass
 
-                # check CH temperature
-                if PARAM_CH_SET_TEMPERATURE in parameter_list:
-                    wanted_ch_temperature = str(parameter_list[PARAM_CH_SET_TEMPERATURE]).lower()
-                    try:
-                        # round to nearest 0.5
-                        temperature = round(float(wanted_ch_temperature) * 2.0) / 2.0
-                        if temperature >= self._ariston_data_actual["zone"]["comfortTemp"]["min"] and temperature <= \
-                                self._ariston_data_actual["zone"]["comfortTemp"]["max"]:
-                            self._set_param[PARAM_CH_SET_TEMPERATURE] = temperature
-                            _LOGGER.info('%s New CH temperature %s', self, temperature)
-                        else:
-                            _LOGGER.warning('%s Not supported CH temperature value: %s', self, wanted_ch_temperature)
-                    except:
+            # check CH temperature
+            if PARAM_CH_SET_TEMPERATURE in parameter_list:
+                wanted_ch_temperature = str(parameter_list[PARAM_CH_SET_TEMPERATURE]).lower()
+                try:
+                    # round to nearest 0.5
+                    temperature = round(float(wanted_ch_temperature) * 2.0) / 2.0
+                    if temperature >= self._ariston_data_actual["zone"]["comfortTemp"]["min"] and temperature <= \
+                            self._ariston_data_actual["zone"]["comfortTemp"]["max"]:
+                        set_param[PARAM_CH_SET_TEMPERATURE] = temperature
+                        _LOGGER.info('%s New CH temperature %s', self, temperature)
+                    else:
                         _LOGGER.warning('%s Not supported CH temperature value: %s', self, wanted_ch_temperature)
-                        pass
+                except:
+                    _LOGGER.warning('%s Not supported CH temperature value: %s', self, wanted_ch_temperature)
+                    pass
 
-                # check CH comfort scheduled temperature
-                if PARAM_CH_COMFORT_TEMPERATURE in parameter_list:
-                    wanted_ch_temperature = str(parameter_list[PARAM_CH_COMFORT_TEMPERATURE]).lower()
-                    try:
-                        # round to nearest 0.5
-                        temperature = round(float(wanted_ch_temperature) * 2.0) / 2.0
-                        if temperature >= self._ariston_data_actual["zone"]["comfortTemp"]["min"] and temperature <= \
-                                self._ariston_data_actual["zone"]["comfortTemp"]["max"]:
-                            self._set_param[PARAM_CH_COMFORT_TEMPERATURE] = temperature
-                            _LOGGER.info('%s New CH temperature %s', self, temperature)
-                        else:
-                            _LOGGER.warning('%s Not supported CH comfort scheduled temperature value: %s', self,
-                                            wanted_ch_temperature)
-                    except:
+            # check CH comfort scheduled temperature
+            if PARAM_CH_COMFORT_TEMPERATURE in parameter_list:
+                wanted_ch_temperature = str(parameter_list[PARAM_CH_COMFORT_TEMPERATURE]).lower()
+                try:
+                    # round to nearest 0.5
+                    temperature = round(float(wanted_ch_temperature) * 2.0) / 2.0
+                    if temperature >= self._ariston_data_actual["zone"]["comfortTemp"]["min"] and temperature <= \
+                            self._ariston_data_actual["zone"]["comfortTemp"]["max"]:
+                        set_param[PARAM_CH_COMFORT_TEMPERATURE] = temperature
+                        _LOGGER.info('%s New CH temperature %s', self, temperature)
+                    else:
                         _LOGGER.warning('%s Not supported CH comfort scheduled temperature value: %s', self,
                                         wanted_ch_temperature)
-                        pass
+                except:
+                    _LOGGER.warning('%s Not supported CH comfort scheduled temperature value: %s', self,
+                                    wanted_ch_temperature)
+                    pass
 
-                # check CH economy scheduled temperature
-                if PARAM_CH_ECONOMY_TEMPERATURE in parameter_list:
-                    wanted_ch_temperature = str(parameter_list[PARAM_CH_ECONOMY_TEMPERATURE]).lower()
-                    try:
-                        # round to nearest 0.5
-                        temperature = round(float(wanted_ch_temperature) * 2.0) / 2.0
-                        if temperature >= self._ariston_data_actual["zone"]["comfortTemp"]["min"] and temperature <= \
-                                self._ariston_data_actual["zone"]["comfortTemp"]["max"]:
-                            self._set_param[PARAM_CH_ECONOMY_TEMPERATURE] = temperature
-                            _LOGGER.info('%s New CH temperature %s', self, temperature)
-                        else:
-                            _LOGGER.warning('%s Not supported CH economy scheduled temperature value: %s', self,
-                                            wanted_ch_temperature)
-                    except:
+            # check CH economy scheduled temperature
+            if PARAM_CH_ECONOMY_TEMPERATURE in parameter_list:
+                wanted_ch_temperature = str(parameter_list[PARAM_CH_ECONOMY_TEMPERATURE]).lower()
+                try:
+                    # round to nearest 0.5
+                    temperature = round(float(wanted_ch_temperature) * 2.0) / 2.0
+                    if temperature >= self._ariston_data_actual["zone"]["comfortTemp"]["min"] and temperature <= \
+                            self._ariston_data_actual["zone"]["comfortTemp"]["max"]:
+                        set_param[PARAM_CH_ECONOMY_TEMPERATURE] = temperature
+                        _LOGGER.info('%s New CH temperature %s', self, temperature)
+                    else:
                         _LOGGER.warning('%s Not supported CH economy scheduled temperature value: %s', self,
                                         wanted_ch_temperature)
-                        pass
+                except:
+                    _LOGGER.warning('%s Not supported CH economy scheduled temperature value: %s', self,
+                                    wanted_ch_temperature)
+                    pass
 
-                # check CH mode
-                if PARAM_CH_MODE in parameter_list:
-                    wanted_ch_mode = str(parameter_list[PARAM_CH_MODE]).lower()
-                    try:
-                        if wanted_ch_mode in CH_MODE_TO_VALUE and CH_MODE_TO_VALUE[wanted_ch_mode] in \
-                                self._ariston_data_actual["zone"]["mode"]["allowedOptions"]:
-                            self._set_param[PARAM_CH_MODE] = CH_MODE_TO_VALUE[wanted_ch_mode]
-                            _LOGGER.info('%s New CH mode %s', self, wanted_ch_mode)
-                        else:
-                            _LOGGER.warning('%s Unknown or unsupported CH mode: %s', self, wanted_ch_mode)
-                    except:
-                        _LOGGER.warning('%s Unknown or unsupported CH mode or key error: %s', self, wanted_ch_mode)
-                        pass
+            # check CH mode
+            if PARAM_CH_MODE in parameter_list:
+                wanted_ch_mode = str(parameter_list[PARAM_CH_MODE]).lower()
+                try:
+                    if wanted_ch_mode in CH_MODE_TO_VALUE and CH_MODE_TO_VALUE[wanted_ch_mode] in \
+                            self._ariston_data_actual["zone"]["mode"]["allowedOptions"]:
+                        set_param[PARAM_CH_MODE] = CH_MODE_TO_VALUE[wanted_ch_mode]
+                        _LOGGER.info('%s New CH mode %s', self, wanted_ch_mode)
+                    else:
+                        _LOGGER.warning('%s Unknown or unsupported CH mode: %s', self, wanted_ch_mode)
+                except:
+                    _LOGGER.warning('%s Unknown or unsupported CH mode or key error: %s', self, wanted_ch_mode)
+                    pass
 
-                # check DHW mode
-                if PARAM_DHW_MODE in parameter_list:
-                    wanted_dhw_mode = str(parameter_list[PARAM_DHW_MODE]).lower()
-                    try:
-                        if wanted_dhw_mode in DHW_MODE_TO_VALUE:
-                            self._set_param[PARAM_DHW_MODE] = DHW_MODE_TO_VALUE[wanted_dhw_mode]
-                            _LOGGER.info('%s New DHW mode %s', self, wanted_dhw_mode)
-                        else:
-                            _LOGGER.warning('%s Unknown or unsupported DHW mode: %s', self, wanted_dhw_mode)
-                    except:
-                        _LOGGER.warning('%s Unknown or unsupported DHW mode or key error: %s', self, wanted_dhw_mode)
-                        pass
+            # check DHW mode
+            if PARAM_DHW_MODE in parameter_list:
+                wanted_dhw_mode = str(parameter_list[PARAM_DHW_MODE]).lower()
+                try:
+                    if wanted_dhw_mode in DHW_MODE_TO_VALUE:
+                        set_param[PARAM_DHW_MODE] = DHW_MODE_TO_VALUE[wanted_dhw_mode]
+                        _LOGGER.info('%s New DHW mode %s', self, wanted_dhw_mode)
+                    else:
+                        _LOGGER.warning('%s Unknown or unsupported DHW mode: %s', self, wanted_dhw_mode)
+                except:
+                    _LOGGER.warning('%s Unknown or unsupported DHW mode or key error: %s', self, wanted_dhw_mode)
+                    pass
 
-                # check DHW Comfort mode
-                if PARAM_DHW_COMFORT_FUNCTION in parameter_list:
-                    wanted_dhw_function = str(parameter_list[PARAM_DHW_COMFORT_FUNCTION]).lower()
-                    try:
-                        if wanted_dhw_function in DHW_COMFORT_FUNCT_TO_VALUE:
-                            self._set_param[PARAM_DHW_COMFORT_FUNCTION] = DHW_COMFORT_FUNCT_TO_VALUE[
-                                wanted_dhw_function]
-                            _LOGGER.info('%s New DHW Comfort function %s', self, wanted_dhw_function)
-                        else:
-                            _LOGGER.warning('%s Unknown or unsupported DHW Comfort function: %s', self,
-                                            wanted_dhw_function)
-                    except:
-                        _LOGGER.warning('%s Unknown or unsupported DHW Comfort function or key error: %s', self,
+            # check DHW Comfort mode
+            if PARAM_DHW_COMFORT_FUNCTION in parameter_list:
+                wanted_dhw_function = str(parameter_list[PARAM_DHW_COMFORT_FUNCTION]).lower()
+                try:
+                    if wanted_dhw_function in DHW_COMFORT_FUNCT_TO_VALUE:
+                        set_param[PARAM_DHW_COMFORT_FUNCTION] = DHW_COMFORT_FUNCT_TO_VALUE[
+                            wanted_dhw_function]
+                        _LOGGER.info('%s New DHW Comfort function %s', self, wanted_dhw_function)
+                    else:
+                        _LOGGER.warning('%s Unknown or unsupported DHW Comfort function: %s', self,
                                         wanted_dhw_function)
-                        pass
+                except:
+                    _LOGGER.warning('%s Unknown or unsupported DHW Comfort function or key error: %s', self,
+                                    wanted_dhw_function)
+                    pass
 
-                # check internet time
-                if PARAM_INTERNET_TIME in parameter_list:
-                    wanted_internet_time = str(parameter_list[PARAM_INTERNET_TIME]).lower()
-                    try:
-                        if wanted_internet_time in PARAM_STRING_TO_VALUE:
-                            self._set_param[PARAM_INTERNET_TIME] = PARAM_STRING_TO_VALUE[wanted_internet_time]
-                            _LOGGER.info('%s New Internet time is %s', self, wanted_internet_time)
-                        else:
-                            _LOGGER.warning('%s Unknown or unsupported Internet time: %s', self, wanted_internet_time)
-                    except:
-                        _LOGGER.warning('%s Unknown or unsupported Internet time or key error: %s', self,
-                                        wanted_internet_time)
-                        pass
+            # check internet time
+            if PARAM_INTERNET_TIME in parameter_list:
+                wanted_internet_time = str(parameter_list[PARAM_INTERNET_TIME]).lower()
+                try:
+                    if wanted_internet_time in PARAM_STRING_TO_VALUE:
+                        set_param[PARAM_INTERNET_TIME] = PARAM_STRING_TO_VALUE[wanted_internet_time]
+                        _LOGGER.info('%s New Internet time is %s', self, wanted_internet_time)
+                    else:
+                        _LOGGER.warning('%s Unknown or unsupported Internet time: %s', self, wanted_internet_time)
+                except:
+                    _LOGGER.warning('%s Unknown or unsupported Internet time or key error: %s', self,
+                                    wanted_internet_time)
+                    pass
 
-                # check internet time
-                if PARAM_INTERNET_WEATHER in parameter_list:
-                    wanted_internet_weather = str(parameter_list[PARAM_INTERNET_WEATHER]).lower()
-                    try:
-                        if wanted_internet_weather in PARAM_STRING_TO_VALUE:
-                            self._set_param[PARAM_INTERNET_WEATHER] = PARAM_STRING_TO_VALUE[wanted_internet_weather]
-                            _LOGGER.info('%s New Internet weather is %s', self, wanted_internet_weather)
-                        else:
-                            _LOGGER.warning('%s Unknown or unsupported Internet weather: %s', self,
-                                            wanted_internet_weather)
-                    except:
-                        _LOGGER.warning('%s Unknown or unsupported Internet weather or key error: %s', self,
+            # check internet time
+            if PARAM_INTERNET_WEATHER in parameter_list:
+                wanted_internet_weather = str(parameter_list[PARAM_INTERNET_WEATHER]).lower()
+                try:
+                    if wanted_internet_weather in PARAM_STRING_TO_VALUE:
+                        set_param[PARAM_INTERNET_WEATHER] = PARAM_STRING_TO_VALUE[wanted_internet_weather]
+                        _LOGGER.info('%s New Internet weather is %s', self, wanted_internet_weather)
+                    else:
+                        _LOGGER.warning('%s Unknown or unsupported Internet weather: %s', self,
                                         wanted_internet_weather)
-                        pass
+                except:
+                    _LOGGER.warning('%s Unknown or unsupported Internet weather or key error: %s', self,
+                                    wanted_internet_weather)
+                    pass
 
-                # check cleanse cycle
-                if PARAM_THERMAL_CLEANSE_CYCLE in parameter_list:
-                    wanted_cleanse_cycle = str(parameter_list[PARAM_THERMAL_CLEANSE_CYCLE]).lower()
-                    try:
-                        item_present = False
-                        for param_item in self._ariston_other_data_actual:
-                            if param_item["id"] == ARISTON_THERMAL_CLEANSE_CYCLE:
-                                cycle_min = param_item["min"]
-                                cycle_max = param_item["max"]
-                                if wanted_cleanse_cycle <= cycle_max and wanted_cleanse_cycle >= cycle_min:
-                                    self._set_param[PARAM_THERMAL_CLEANSE_CYCLE] = wanted_cleanse_cycle
-                                    item_present = True
-                                    _LOGGER.info('%s New Thermal Cleanse Cycle is %s', self, wanted_cleanse_cycle)
-                                else:
-                                    _LOGGER.warning('%s Unknown or unsupported Thermal Cleanse Cycle: %s', self,
-                                                    wanted_cleanse_cycle)
-                                break
-                        if not item_present:
-                            _LOGGER.warning('%s Can not set Thermal Cleanse Cycle: %s', self, wanted_cleanse_cycle)
-                    except:
-                        _LOGGER.warning('%s Unknown or unsupported Thermal Cleanse Cycle or key error: %s', self,
-                                        wanted_cleanse_cycle)
-                        pass
+            # check cleanse cycle
+            if PARAM_THERMAL_CLEANSE_CYCLE in parameter_list:
+                wanted_cleanse_cycle = str(parameter_list[PARAM_THERMAL_CLEANSE_CYCLE]).lower()
+                try:
+                    item_present = False
+                    if ARISTON_THERMAL_CLEANSE_CYCLE in self._ariston_other_param_actual:
+                        param_item = self._ariston_other_param_actual[ARISTON_THERMAL_CLEANSE_CYCLE]
+                        cycle_min = param_item["min"]
+                        cycle_max = param_item["max"]
+                        if wanted_cleanse_cycle <= cycle_max and wanted_cleanse_cycle >= cycle_min:
+                            set_param[PARAM_THERMAL_CLEANSE_CYCLE] = wanted_cleanse_cycle
+                            item_present = True
+                            _LOGGER.info('%s New Thermal Cleanse Cycle is %s', self, wanted_cleanse_cycle)
+                        else:
+                            _LOGGER.warning('%s Unknown or unsupported Thermal Cleanse Cycle: %s', self,
+                                            wanted_cleanse_cycle)
+                    if not item_present:
+                        _LOGGER.warning('%s Can not set Thermal Cleanse Cycle: %s', self, wanted_cleanse_cycle)
+                except:
+                    _LOGGER.warning('%s Unknown or unsupported Thermal Cleanse Cycle or key error: %s', self,
+                                    wanted_cleanse_cycle)
+                    pass
 
-                # check cleanse function
-                if PARAM_THERMAL_CLEANSE_FUNCTION in parameter_list:
-                    wanted_cleanse_function = str(parameter_list[PARAM_THERMAL_CLEANSE_FUNCTION]).lower()
-                    try:
-                        item_present = False
-                        for param_item in self._ariston_other_data_actual:
-                            if param_item["id"] == ARISTON_THERMAL_CLEANSE_FUNCTION:
-                                if wanted_cleanse_function in PARAM_STRING_TO_VALUE:
-                                    self._set_param[PARAM_THERMAL_CLEANSE_FUNCTION] = PARAM_STRING_TO_VALUE[
-                                        wanted_cleanse_function]
-                                    item_present = True
-                                    _LOGGER.info('%s New Thermal Cleanse Function is %s', self, wanted_cleanse_function)
-                                else:
-                                    _LOGGER.warning('%s Unknown or unsupported Thermal Cleanse Function: %s', self,
-                                                    wanted_cleanse_function)
-                                break
-                        if not item_present:
-                            _LOGGER.warning('%s Can not set Thermal Cleanse Function: %s', self,
+            # check cleanse function
+            if PARAM_THERMAL_CLEANSE_FUNCTION in parameter_list:
+                wanted_cleanse_function = str(parameter_list[PARAM_THERMAL_CLEANSE_FUNCTION]).lower()
+                try:
+                    item_present = False
+                    if ARISTON_THERMAL_CLEANSE_FUNCTION in self._ariston_other_param_actual:
+                        if wanted_cleanse_function in PARAM_STRING_TO_VALUE:
+                            set_param[PARAM_THERMAL_CLEANSE_FUNCTION] = PARAM_STRING_TO_VALUE[
+                                wanted_cleanse_function]
+                            item_present = True
+                            _LOGGER.info('%s New Thermal Cleanse Function is %s', self, wanted_cleanse_function)
+                        else:
+                            _LOGGER.warning('%s Unknown or unsupported Thermal Cleanse Function: %s', self,
                                             wanted_cleanse_function)
-                    except:
-                        _LOGGER.warning('%s Unknown or unsupported Thermal Cleanse Function or key error: %s', self,
+                    if not item_present:
+                        _LOGGER.warning('%s Can not set Thermal Cleanse Function: %s', self,
                                         wanted_cleanse_function)
-                        pass
+                except:
+                    _LOGGER.warning('%s Unknown or unsupported Thermal Cleanse Function or key error: %s', self,
+                                    wanted_cleanse_function)
+                    pass
 
-                # check CH auto function
-                if PARAM_CH_AUTO_FUNCTION in parameter_list:
-                    wanted_ch_auto = str(parameter_list[PARAM_CH_AUTO_FUNCTION]).lower()
-                    try:
-                        if wanted_ch_auto in PARAM_STRING_TO_VALUE:
-                            self._set_param[PARAM_CH_AUTO_FUNCTION] = PARAM_STRING_TO_VALUE[wanted_ch_auto]
-                            _LOGGER.info('%s New Internet weather is %s', self, wanted_ch_auto)
-                        else:
-                            _LOGGER.warning('%s Unknown or unsupported Internet weather: %s', self,
-                                            wanted_ch_auto)
-                    except:
-                        _LOGGER.warning('%s Unknown or unsupported Internet weather or key error: %s', self,
+            # check CH auto function
+            if PARAM_CH_AUTO_FUNCTION in parameter_list:
+                wanted_ch_auto = str(parameter_list[PARAM_CH_AUTO_FUNCTION]).lower()
+                try:
+                    if wanted_ch_auto in PARAM_STRING_TO_VALUE:
+                        set_param[PARAM_CH_AUTO_FUNCTION] = PARAM_STRING_TO_VALUE[wanted_ch_auto]
+                        _LOGGER.info('%s New Internet weather is %s', self, wanted_ch_auto)
+                    else:
+                        _LOGGER.warning('%s Unknown or unsupported Internet weather: %s', self,
                                         wanted_ch_auto)
-                        pass
-
-                # check units of measurement
-                if PARAM_UNITS in parameter_list:
-                    wanted_units = str(parameter_list[PARAM_UNITS]).lower()
-                    try:
-                        if wanted_units in UNIT_TO_VALUE:
-                            self._set_param[PARAM_UNITS] = UNIT_TO_VALUE[wanted_units]
-                            _LOGGER.info('%s New units of measurement is %s', self, wanted_units)
-                        else:
-                            _LOGGER.warning('%s Unknown or unsupported units of measurement: %s', self, wanted_units)
-                    except:
-                        _LOGGER.warning('%s Unknown or unsupported units of measurement or key error: %s', self,
-                                        wanted_units)
-                        pass
+                except:
+                    _LOGGER.warning('%s Unknown or unsupported Internet weather or key error: %s', self,
+                                    wanted_ch_auto)
+                    pass
 
-                # show data as changed
-                self._set_visible_data()
+            # check units of measurement
+            if PARAM_UNITS in parameter_list:
+                wanted_units = str(parameter_list[PARAM_UNITS]).lower()
+                try:
+                    if wanted_units in UNIT_TO_VALUE:
+                        set_param[PARAM_UNITS] = UNIT_TO_VALUE[wanted_units]
+                        _LOGGER.info('%s New units of measurement is %s', self, wanted_units)
+                    else:
+                        _LOGGER.warning('%s Unknown or unsupported units of measurement: %s', self, wanted_units)
+                except:
+                    _LOGGER.warning('%s Unknown or unsupported units of measurement or key error: %s', self,
+                                    wanted_units)
+                    pass
 
-                self._set_new_data_pending = True
-                # set after short delay to not affect switch or climate or water_heater
-                retry_time = dt_util.now() + timedelta(seconds=1)
-                track_point_in_time(self._hass, self._preparing_setting_http_data, retry_time)
+            run_callback_threadsafe(self._hass.loop, self._async_add_set_param, set_param).result()
 
         else:
             _LOGGER.warning("%s No valid data fetched from server to set changes", self)
             raise CommError
 
+    @callback
+    def _async_add_set_param(self, set_param):
+        """Add verified changes to be set and schedule setting unless it is already scheduled"""
+        self._set_param.update(set_param)
+        # show data as changed
+        self._set_visible_data()
+
+        self._set_new_data_pending = True
+        self._send_update_signal(self._set_param_group.keys())
+
+        if not self._set_coalescing:
+            # changes made within coalescing window are set together by already scheduled attempt
+            self._set_coalescing = True
+            # set after short delay to not affect switch or climate or water_heater
+            async_track_point_in_time(self._hass, self._async_preparing_setting_http_data,
+                                      dt_util.now() + timedelta(seconds=HTTP_SET_COALESCE_WINDOW))
+
+
+async def _async_init_device(api):
+    """Make full init of device by fetching main data"""
+    try:
+        await api._async_control_availability_state(REQUEST_GET_MAIN)
+    except LoginError as ex:
+        _LOGGER.error("Login error for %s: %s", api._name, ex)
+        pass
+    except AristonError as ex:
+        _LOGGER.error("Communication error for %s: %s", api._name, ex)
+        pass
+    except:
+        _LOGGER.error("Unexpected error for %s:", api._name)
+        pass
+
+
+async def _async_init_devices(api_list):
+    """Init devices concurrently, devices not initialized within deadline continue in the background"""
+    init_tasks = {asyncio.ensure_future(_async_init_device(api)): api for api in api_list}
+    _, pending = await asyncio.wait(init_tasks.keys(), timeout=HTTP_INIT_DEADLINE)
+    for init_task in pending:
+        _LOGGER.warning("%s Initial data not fetched within %s seconds, fetching continues in the background",
+                        init_tasks[init_task], HTTP_INIT_DEADLINE)
+
 
 def setup(hass, config):
     """Set up the Ariston component."""
     hass.data.setdefault(DATA_ARISTON, {DEVICES: {}, CLIMATES: [], WATER_HEATERS: []})
     api_list = []
+    api_init_list = []
     for device in config[DOMAIN]:
         name = device[CONF_NAME]
         username = device[CONF_USERNAME]
@@ -2162,27 +2363,31 @@ def setup(hass, config):
                                  binary_sensors=binary_sensors, switches=switches)
             api_list.append(api)
             # start api execution by logging in
-            if init_during_start:
+            if init_during_start and REQUEST_GET_MAIN not in api._stale_groups:
                 # queue data fetching in next round (between parameters)
-                track_point_in_time(api._hass, api._queue_get_data,
+                track_point_in_time(api._hass, api._async_queue_get_data,
                                     dt_util.now() + timedelta(seconds=api._timer_between_param_delay))
                 # make full init by fetching whole data set, ignore item 0 from high prio queue as a result
                 api._get_request_number_high_prio = 1
-                api._get_main_data()
+                api_init_list.append(api)
             else:
-                # queue data fetching in 1 second
-                track_point_in_time(api._hass, api._queue_get_data,
+                # queue data fetching in 1 second, last known data is shown meanwhile if cached
+                track_point_in_time(api._hass, api._async_queue_get_data,
                                     dt_util.now() + timedelta(seconds=1))
-        except LoginError as ex:
-            _LOGGER.error("Login error for %s: %s", name, ex)
-            pass
-        except AristonError as ex:
-            _LOGGER.error("Communication error for %s: %s", name, ex)
-            pass
         except:
             _LOGGER.error("Unexpected error for %s:", name)
             pass
 
+    if api_init_list:
+        # start time is defined by the slowest device instead of sum of all devices
+        asyncio.run_coroutine_threadsafe(_async_init_devices(api_init_list), hass.loop).result()
+
+    for api in api_list:
+        name = api._name
+        switches = api._device.get(CONF_SWITCHES)
+        binary_sensors = api._device.get(CONF_BINARY_SENSORS)
+        sensors = api._device.get(CONF_SENSORS)
+
         # load all devices
         hass.data[DATA_ARISTON][DEVICES][name] = AristonDevice(api)
         discovery.load_platform(
@@ -2239,72 +2444,71 @@ def setup(hass, config):
         for api in api_list:
             if api._name.lower() == device.lower():
                 try:
-                    with api._data_lock:
-                        parameter_list = {}
+                    parameter_list = {}
 
-                        data = call.data.get(PARAM_MODE, "")
-                        if data != "":
-                            parameter_list[PARAM_MODE] = data
+                    data = call.data.get(PARAM_MODE, "")
+                    if data != "":
+                        parameter_list[PARAM_MODE] = data
 
-                        data = call.data.get(PARAM_CH_MODE, "")
-                        if data != "":
-                            parameter_list[PARAM_CH_MODE] = data
+                    data = call.data.get(PARAM_CH_MODE, "")
+                    if data != "":
+                        parameter_list[PARAM_CH_MODE] = data
 
-                        data = call.data.get(PARAM_CH_SET_TEMPERATURE, "")
-                        if data != "":
-                            parameter_list[PARAM_CH_SET_TEMPERATURE] = data
+                    data = call.data.get(PARAM_CH_SET_TEMPERATURE, "")
+                    if data != "":
+                        parameter_list[PARAM_CH_SET_TEMPERATURE] = data
 
-                        data = call.data.get(PARAM_CH_COMFORT_TEMPERATURE, "")
-                        if data != "":
-                            parameter_list[PARAM_CH_COMFORT_TEMPERATURE] = data
+                    data = call.data.get(PARAM_CH_COMFORT_TEMPERATURE, "")
+                    if data != "":
+                        parameter_list[PARAM_CH_COMFORT_TEMPERATURE] = data
 
-                        data = call.data.get(PARAM_CH_ECONOMY_TEMPERATURE, "")
-                        if data != "":
-                            parameter_list[PARAM_CH_ECONOMY_TEMPERATURE] = data
+                    data = call.data.get(PARAM_CH_ECONOMY_TEMPERATURE, "")
+                    if data != "":
+                        parameter_list[PARAM_CH_ECONOMY_TEMPERATURE] = data
 
-                        data = call.data.get(PARAM_DHW_SET_TEMPERATURE, "")
-                        if data != "":
-                            parameter_list[PARAM_DHW_SET_TEMPERATURE] = data
+                    data = call.data.get(PARAM_DHW_SET_TEMPERATURE, "")
+                    if data != "":
+                        parameter_list[PARAM_DHW_SET_TEMPERATURE] = data
 
-                        data = call.data.get(PARAM_DHW_COMFORT_TEMPERATURE, "")
-                        if data != "":
-                            parameter_list[PARAM_DHW_COMFORT_TEMPERATURE] = data
+                    data = call.data.get(PARAM_DHW_COMFORT_TEMPERATURE, "")
+                    if data != "":
+                        parameter_list[PARAM_DHW_COMFORT_TEMPERATURE] = data
 
-                        data = call.data.get(PARAM_DHW_ECONOMY_TEMPERATURE, "")
-                        if data != "":
-                            parameter_list[PARAM_DHW_ECONOMY_TEMPERATURE] = data
+                    data = call.data.get(PARAM_DHW_ECONOMY_TEMPERATURE, "")
+                    if data != "":
+                        parameter_list[PARAM_DHW_ECONOMY_TEMPERATURE] = data
 
-                        data = call.data.get(PARAM_DHW_MODE, "")
-                        if data != "":
-                            parameter_list[PARAM_DHW_MODE] = data
+                    data = call.data.get(PARAM_DHW_MODE, "")
+                    if data != "":
+                        parameter_list[PARAM_DHW_MODE] = data
 
-                        data = call.data.get(PARAM_DHW_COMFORT_FUNCTION, "")
-                        if data != "":
-                            parameter_list[PARAM_DHW_COMFORT_FUNCTION] = data
+                    data = call.data.get(PARAM_DHW_COMFORT_FUNCTION, "")
+                    if data != "":
+                        parameter_list[PARAM_DHW_COMFORT_FUNCTION] = data
 
-                        data = call.data.get(PARAM_INTERNET_TIME, "")
-                        if data != "":
-                            parameter_list[PARAM_INTERNET_TIME] = data
+                    data = call.data.get(PARAM_INTERNET_TIME, "")
+                    if data != "":
+                        parameter_list[PARAM_INTERNET_TIME] = data
 
-                        data = call.data.get(PARAM_INTERNET_WEATHER, "")
-                        if data != "":
-                            parameter_list[PARAM_INTERNET_WEATHER] = data
+                    data = call.data.get(PARAM_INTERNET_WEATHER, "")
+                    if data != "":
+                        parameter_list[PARAM_INTERNET_WEATHER] = data
 
-                        data = call.data.get(PARAM_CH_AUTO_FUNCTION, "")
-                        if data != "":
-                            parameter_list[PARAM_CH_AUTO_FUNCTION] = data
+                    data = call.data.get(PARAM_CH_AUTO_FUNCTION, "")
+                    if data != "":
+                        parameter_list[PARAM_CH_AUTO_FUNCTION] = data
 
-                        data = call.data.get(PARAM_UNITS, "")
-                        if data != "":
-                            parameter_list[PARAM_UNITS] = data
+                    data = call.data.get(PARAM_UNITS, "")
+                    if data != "":
+                        parameter_list[PARAM_UNITS] = data
 
-                        data = call.data.get(PARAM_THERMAL_CLEANSE_CYCLE, "")
-                        if data != "":
-                            parameter_list[PARAM_THERMAL_CLEANSE_CYCLE] = data
+                    data = call.data.get(PARAM_THERMAL_CLEANSE_CYCLE, "")
+                    if data != "":
+                        parameter_list[PARAM_THERMAL_CLEANSE_CYCLE] = data
 
-                        data = call.data.get(PARAM_THERMAL_CLEANSE_FUNCTION, "")
-                        if data != "":
-                            parameter_list[PARAM_THERMAL_CLEANSE_FUNCTION] = data
+                    data = call.data.get(PARAM_THERMAL_CLEANSE_FUNCTION, "")
+                    if data != "":
+                        parameter_list[PARAM_THERMAL_CLEANSE_FUNCTION] = data
 
                     _LOGGER.debug("device found, data to check and send")
 
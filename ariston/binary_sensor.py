@@ -11,6 +11,9 @@ from homeassistant.const import CONF_BINARY_SENSORS, CONF_NAME
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 
 from .const import (
+    ATTR_STALE,
+    CONF_PUSH_UPDATES,
+    REQUEST_GET_MAIN,
     ARISTON_INTERNET_TIME,
     ARISTON_INTERNET_WEATHER,
     ARISTON_CH_AUTO_FUNCTION,
@@ -55,7 +58,7 @@ from .const import (
     INVALID_STORAGE_TEMP,
 )
 from .exceptions import AristonError
-from .helpers import log_update_error, service_signal
+from .helpers import get_request_for_parameter, log_update_error, service_signal
 
 """BINARY_SENSOR_SCAN_INTERVAL_SECS is used to scan changes in JSON data as command in '__init__' is not for checking and updating sensors"""
 BINARY_SENSOR_SCAN_INTERVAL_SECS = 2
@@ -111,17 +114,20 @@ class AristonBinarySensor(BinarySensorEntity):
         self._sensor_type = sensor_type
         self._signal_name = name
         self._state = None
-        self._unsub_dispatcher = None
+        self._request_groups = [get_request_for_parameter(sensor_type)]
+        self._unsub_dispatcher = []
 
     @property
     def device_state_attributes(self):
         """Return the state attributes."""
+        if self._request_groups[0] in self._api._stale_groups:
+            return {**self._attrs, ATTR_STALE: True}
         return self._attrs
 
     @property
     def should_poll(self):
         """Return True if entity has to be polled for state."""
-        return self._sensor_type != PARAM_ONLINE
+        return self._sensor_type != PARAM_ONLINE and not self._api._device[CONF_PUSH_UPDATES]
 
     @property
     def name(self):
@@ -144,7 +150,7 @@ class AristonBinarySensor(BinarySensorEntity):
         if self._sensor_type == PARAM_ONLINE:
             return True
         elif self._sensor_type in GET_REQUEST_PARAM:
-            return self._api.available and self._api._ariston_other_data != {}
+            return self._api.available and self._api._ariston_other_param != {}
         elif self._sensor_type in GET_REQUEST_VERSION:
             return self._api._version != ""
         else:
@@ -175,7 +181,8 @@ class AristonBinarySensor(BinarySensorEntity):
                     pass
 
             elif self._sensor_type == PARAM_ONLINE:
-                self._state = self._api.available
+                # last known data shown after restart does not mean that connection is established
+                self._state = self._api.available and REQUEST_GET_MAIN not in self._api._stale_groups
 
             elif self._sensor_type == PARAM_FLAME:
                 try:
@@ -207,44 +214,40 @@ class AristonBinarySensor(BinarySensorEntity):
             elif self._sensor_type == PARAM_INTERNET_TIME:
                 self._state = False
                 try:
-                    for param_item in self._api._ariston_other_data:
-                        if param_item["id"] == ARISTON_INTERNET_TIME:
-                            if param_item["value"] == 1:
-                                self._state = True
-                                break
+                    if ARISTON_INTERNET_TIME in self._api._ariston_other_param:
+                        param_item = self._api._ariston_other_param[ARISTON_INTERNET_TIME]
+                        if param_item["value"] == 1:
+                            self._state = True
                 except:
                     pass
 
             elif self._sensor_type == PARAM_INTERNET_WEATHER:
                 self._state = False
                 try:
-                    for param_item in self._api._ariston_other_data:
-                        if param_item["id"] == ARISTON_INTERNET_WEATHER:
-                            if param_item["value"] == 1:
-                                self._state = True
-                                break
+                    if ARISTON_INTERNET_WEATHER in self._api._ariston_other_param:
+                        param_item = self._api._ariston_other_param[ARISTON_INTERNET_WEATHER]
+                        if param_item["value"] == 1:
+                            self._state = True
                 except:
                     pass
 
             elif self._sensor_type == PARAM_CH_AUTO_FUNCTION:
                 self._state = False
                 try:
-                    for param_item in self._api._ariston_other_data:
-                        if param_item["id"] == ARISTON_CH_AUTO_FUNCTION:
-                            if param_item["value"] == 1:
-                                self._state = True
-                                break
+                    if ARISTON_CH_AUTO_FUNCTION in self._api._ariston_other_param:
+                        param_item = self._api._ariston_other_param[ARISTON_CH_AUTO_FUNCTION]
+                        if param_item["value"] == 1:
+                            self._state = True
                 except:
                     pass
 
             elif self._sensor_type == PARAM_THERMAL_CLEANSE_FUNCTION:
                 self._state = False
                 try:
-                    for param_item in self._api._ariston_other_data:
-                        if param_item["id"] == ARISTON_THERMAL_CLEANSE_FUNCTION:
-                            if param_item["value"] == 1:
-                                self._state = True
-                                break
+                    if ARISTON_THERMAL_CLEANSE_FUNCTION in self._api._ariston_other_param:
+                        param_item = self._api._ariston_other_param[ARISTON_THERMAL_CLEANSE_FUNCTION]
+                        if param_item["value"] == 1:
+                            self._state = True
                 except:
                     pass
 
@@ -311,13 +314,17 @@ class AristonBinarySensor(BinarySensorEntity):
         self.async_schedule_update_ha_state(True)
 
     async def async_added_to_hass(self):
-        """Subscribe to update signal."""
-        self._unsub_dispatcher = async_dispatcher_connect(
-            self.hass,
-            service_signal(SERVICE_UPDATE, self._signal_name),
-            self.async_on_demand_update,
-        )
+        """Subscribe to availability signal and to signals of used request groups."""
+        self._unsub_dispatcher = [
+            async_dispatcher_connect(
+                self.hass,
+                service_signal(SERVICE_UPDATE, self._signal_name, request_group),
+                self.async_on_demand_update,
+            )
+            for request_group in [None] + self._request_groups
+        ]
 
     async def async_will_remove_from_hass(self):
-        """Disconnect from update signal."""
-        self._unsub_dispatcher()
+        """Disconnect from update signals."""
+        for unsub_dispatcher in self._unsub_dispatcher:
+            unsub_dispatcher()
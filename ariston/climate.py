@@ -23,11 +23,14 @@ from homeassistant.const import (
     TEMP_CELSIUS,
     TEMP_FAHRENHEIT,
 )
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 
 from .const import (
     ARISTON_CH_COMFORT_TEMP,
     ARISTON_CH_ECONOMY_TEMP,
     CONF_HVAC_OFF,
+    ATTR_STALE,
+    CONF_PUSH_UPDATES,
     CONF_HVAC_OFF_PRESENT,
     CONF_LOCALIZATION,
     CONF_DHW_AND_CH,
@@ -54,7 +57,11 @@ from .const import (
     VAL_IMPERIAL,
     VALUE_TO_MODE,
     VALUE_TO_CH_MODE,
+    REQUEST_GET_MAIN,
+    REQUEST_GET_UNITS,
+    SERVICE_UPDATE,
 )
+from .helpers import service_signal
 
 DEFAULT_MIN = 10.0
 DEFAULT_MAX = 30.0
@@ -95,6 +102,9 @@ class AristonThermostat(ClimateEntity):
         """Initialize the thermostat."""
         self._name = name
         self._api = device.api
+        self._signal_name = name
+        self._request_groups = [REQUEST_GET_MAIN, REQUEST_GET_UNITS]
+        self._unsub_dispatcher = []
         try:
             lang = self._api._device[CONF_LOCALIZATION]
             with open(LANG_LOCATION + 'backend.' + lang + '.json') as translation_file:
@@ -136,8 +146,15 @@ class AristonThermostat(ClimateEntity):
 
     @property
     def should_poll(self):
-        """Polling is required."""
-        return True
+        """Polling is required unless updates are pushed."""
+        return not self._api._device[CONF_PUSH_UPDATES]
+
+    @property
+    def device_state_attributes(self):
+        """Return the state attributes."""
+        if REQUEST_GET_MAIN in self._api._stale_groups:
+            return {ATTR_STALE: True}
+        return {}
 
     @property
     def min_temp(self):
@@ -320,16 +337,16 @@ class AristonThermostat(ClimateEntity):
         if new_temperature is not None:
             try:
                 if VALUE_TO_CH_MODE[self._api._ariston_data["zone"]["mode"]["value"]] == VAL_PROGRAM:
-                    if self._api._ariston_other_data != {}:
-                        for param_item in self._api._ariston_other_data:
-                            if param_item["id"] == ARISTON_CH_COMFORT_TEMP:
-                                if self._api._ariston_data["zone"]["comfortTemp"]["value"] == param_item["value"]:
-                                    self._api.set_http_data({PARAM_CH_COMFORT_TEMPERATURE: new_temperature})
-                                    return
-                            elif param_item["id"] == ARISTON_CH_ECONOMY_TEMP:
-                                if self._api._ariston_data["zone"]["comfortTemp"]["value"] == param_item["value"]:
-                                    self._api.set_http_data({PARAM_CH_ECONOMY_TEMPERATURE: new_temperature})
-                                    return
+                    if ARISTON_CH_COMFORT_TEMP in self._api._ariston_other_param:
+                        param_item = self._api._ariston_other_param[ARISTON_CH_COMFORT_TEMP]
+                        if self._api._ariston_data["zone"]["comfortTemp"]["value"] == param_item["value"]:
+                            self._api.set_http_data({PARAM_CH_COMFORT_TEMPERATURE: new_temperature})
+                            return
+                    if ARISTON_CH_ECONOMY_TEMP in self._api._ariston_other_param:
+                        param_item = self._api._ariston_other_param[ARISTON_CH_ECONOMY_TEMP]
+                        if self._api._ariston_data["zone"]["comfortTemp"]["value"] == param_item["value"]:
+                            self._api.set_http_data({PARAM_CH_ECONOMY_TEMPERATURE: new_temperature})
+                            return
             except:
                 pass
             self._api.set_http_data({PARAM_CH_SET_TEMPERATURE: new_temperature})
@@ -337,3 +354,23 @@ class AristonThermostat(ClimateEntity):
     def update(self):
         """Update all Node data from Hive."""
         return
+
+    async def async_on_demand_update(self):
+        """Update state."""
+        self.async_schedule_update_ha_state(True)
+
+    async def async_added_to_hass(self):
+        """Subscribe to availability signal and to signals of used request groups."""
+        self._unsub_dispatcher = [
+            async_dispatcher_connect(
+                self.hass,
+                service_signal(SERVICE_UPDATE, self._signal_name, request_group),
+                self.async_on_demand_update,
+            )
+            for request_group in [None] + self._request_groups
+        ]
+
+    async def async_will_remove_from_hass(self):
+        """Disconnect from update signals."""
+        for unsub_dispatcher in self._unsub_dispatcher:
+            unsub_dispatcher()
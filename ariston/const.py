@@ -38,6 +38,9 @@ SENSOR_THERMAL_CLEANSE_CYCLE = "Thermal Cleanse Cycle"
 SENSOR_GAS_TYPE = "Gas Type"
 SENSOR_GAS_COST = "Gas Cost"
 SENSOR_ELECTRICITY_COST = "Electricity Cost"
+SENSOR_REQUEST_LATENCY = "Request Latency"
+SENSOR_REQUEST_FAILURES = "Request Failures"
+SENSOR_DATA_AGE = "Data Age"
 
 BINARY_SENSOR_CH_FLAME = "CH Flame"
 BINARY_SENSOR_DHW_FLAME = "DHW Flame"
@@ -95,6 +98,21 @@ SERVICE_SET_DATA = "set_data"
 SERVICE_UPDATE = "update"
 CLIMATES = "climates"
 WATER_HEATERS = "water_heaters"
+RATE_LIMITERS = "rate_limiters"
+SESSIONS = "sessions"
+
+# request groups of data fetched from the server
+REQUEST_GET_MAIN = "_get_main"
+REQUEST_GET_CH = "_get_ch"
+REQUEST_GET_DHW = "_get_dhw"
+REQUEST_GET_ERROR = "_get_error"
+REQUEST_GET_GAS = "_get_gas"
+REQUEST_GET_OTHER = "_get_param"
+REQUEST_GET_UNITS = "_get_units"
+REQUEST_GET_CURRENCY = "_get_currency"
+REQUEST_GET_VERSION = "_get_version"
+# metrics collected locally by the integration
+REQUEST_DIAGNOSTICS = "_diagnostics"
 
 # sensors
 PARAM_ACCOUNT_CH_GAS = "account_ch_gas"
@@ -132,6 +150,9 @@ PARAM_THERMAL_CLEANSE_CYCLE = "dhw_thermal_cleanse_cycle"
 PARAM_GAS_TYPE = "gas_type"
 PARAM_GAS_COST = "gas_cost"
 PARAM_ELECTRICITY_COST = "electricity_cost"
+PARAM_REQUEST_LATENCY = "request_latency"
+PARAM_REQUEST_FAILURES = "request_failures"
+PARAM_DATA_AGE = "data_age"
 
 # binary sensors
 PARAM_CH_AUTO_FUNCTION = "ch_auto_function"
@@ -160,6 +181,11 @@ GET_REQUEST_CURRENCY = [
     PARAM_GAS_COST,
     PARAM_ELECTRICITY_COST
 ]
+GET_REQUEST_DIAGNOSTICS = [
+    PARAM_REQUEST_LATENCY,
+    PARAM_REQUEST_FAILURES,
+    PARAM_DATA_AGE
+]
 GET_REQUEST_DHW_PROGRAM = [
     PARAM_DHW_PROGRAM
 ]
@@ -310,6 +336,21 @@ CONF_POLLING_RATE = "polling_rate"
 CONF_INIT_AT_START = "init_during_start"
 CONF_DHW_FLAME_UNKNOWN_ON = "dhw_flame_unknown_as_on"
 CONF_DHW_AND_CH = "dhw_and_ch_simultaneously"
+CONF_PARALLEL_CYCLE = "parallel_cycle"
+CONF_PARALLEL_REQUESTS = "parallel_requests"
+CONF_ADAPTIVE_POLLING = "adaptive_polling"
+CONF_ADAPTIVE_POLLING_MIN = "adaptive_polling_min"
+CONF_ADAPTIVE_POLLING_MAX = "adaptive_polling_max"
+CONF_PUSH_UPDATES = "push_updates"
+CONF_STATE_CACHE = "state_cache"
+CONF_HTTP_POOL_SIZE = "http_pool_size"
+CONF_HTTP_KEEP_ALIVE = "http_keep_alive"
+CONF_HTTP_RETRIES = "http_retries"
+CONF_RATE_LIMIT = "rate_limit"
+CONF_RATE_LIMIT_BURST = "rate_limit_burst"
+CONF_SERVER_URL = "server_url"
+
+ATTR_STALE = "stale"
 
 MODE_TO_VALUE = {VAL_WINTER: 1, VAL_SUMMER: 0, VAL_OFF: 5, VAL_HEATING_ONLY: 2}
 VALUE_TO_MODE = {1: VAL_WINTER, 0: VAL_SUMMER, 5: VAL_OFF, 2: VAL_HEATING_ONLY}
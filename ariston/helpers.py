@@ -1,15 +1,61 @@
 """Helpers for amcrest component."""
-from .const import DOMAIN
+from .const import (
+    DOMAIN,
+    GET_REQUEST_CH_PROGRAM,
+    GET_REQUEST_CURRENCY,
+    GET_REQUEST_DIAGNOSTICS,
+    GET_REQUEST_DHW_PROGRAM,
+    GET_REQUEST_ERRORS,
+    GET_REQUEST_GAS,
+    GET_REQUEST_PARAM,
+    GET_REQUEST_UNITS,
+    GET_REQUEST_VERSION,
+    REQUEST_GET_MAIN,
+    REQUEST_GET_CH,
+    REQUEST_GET_DHW,
+    REQUEST_GET_ERROR,
+    REQUEST_GET_GAS,
+    REQUEST_GET_OTHER,
+    REQUEST_GET_UNITS,
+    REQUEST_GET_CURRENCY,
+    REQUEST_GET_VERSION,
+    REQUEST_DIAGNOSTICS,
+)
 
 
-def service_signal(service, ident=None):
-    """Encode service and identifier into signal."""
+def service_signal(service, ident=None, request_group=None):
+    """Encode service, identifier and optional request group into signal."""
     signal = f"{DOMAIN}_{service}"
     if ident:
         signal += "_{}".format(ident.replace(".", "_"))
+    if request_group:
+        signal += "_{}".format(request_group.strip("_"))
     return signal
 
 
+def get_request_for_parameter(data):
+    """Return request group used to fetch the parameter."""
+    if data in GET_REQUEST_CH_PROGRAM:
+        return REQUEST_GET_CH
+    elif data in GET_REQUEST_CURRENCY:
+        return REQUEST_GET_CURRENCY
+    elif data in GET_REQUEST_DHW_PROGRAM:
+        return REQUEST_GET_DHW
+    elif data in GET_REQUEST_ERRORS:
+        return REQUEST_GET_ERROR
+    elif data in GET_REQUEST_GAS:
+        return REQUEST_GET_GAS
+    elif data in GET_REQUEST_PARAM:
+        return REQUEST_GET_OTHER
+    elif data in GET_REQUEST_UNITS:
+        return REQUEST_GET_UNITS
+    elif data in GET_REQUEST_VERSION:
+        return REQUEST_GET_VERSION
+    elif data in GET_REQUEST_DIAGNOSTICS:
+        return REQUEST_DIAGNOSTICS
+    return REQUEST_GET_MAIN
+
+
 def log_update_error(logger, action, name, entity_type, error):
     """Log an update error."""
     logger.error(
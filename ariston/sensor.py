@@ -8,6 +8,8 @@ from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity import Entity
 
 from .const import (
+    ATTR_STALE,
+    CONF_PUSH_UPDATES,
     ARISTON_DHW_COMFORT_FUNCTION,
     ARISTON_SIGNAL_STRENGHT,
     ARISTON_CH_COMFORT_TEMP,
@@ -16,6 +18,15 @@ from .const import (
     DATA_ARISTON,
     DAYS_OF_WEEK,
     DEVICES,
+    REQUEST_GET_CH,
+    REQUEST_GET_CURRENCY,
+    REQUEST_GET_DHW,
+    REQUEST_GET_ERROR,
+    REQUEST_GET_GAS,
+    REQUEST_GET_MAIN,
+    REQUEST_GET_OTHER,
+    REQUEST_GET_UNITS,
+    REQUEST_DIAGNOSTICS,
     SERVICE_UPDATE,
     DHW_COMFORT_VALUE_TO_FUNCT,
     PARAM_ACCOUNT_CH_GAS,
@@ -53,6 +64,9 @@ from .const import (
     PARAM_GAS_TYPE,
     PARAM_GAS_COST,
     PARAM_ELECTRICITY_COST,
+    PARAM_REQUEST_LATENCY,
+    PARAM_REQUEST_FAILURES,
+    PARAM_DATA_AGE,
     VAL_WINTER,
     VAL_SUMMER,
     VAL_OFF,
@@ -107,18 +121,12 @@ from .const import (
     SENSOR_GAS_TYPE,
     SENSOR_GAS_COST,
     SENSOR_ELECTRICITY_COST,
-    GET_REQUEST_CH_PROGRAM,
-    GET_REQUEST_CURRENCY,
-    GET_REQUEST_DHW_PROGRAM,
-    GET_REQUEST_ERRORS,
-    GET_REQUEST_GAS,
-    GET_REQUEST_MAIN,
-    GET_REQUEST_PARAM,
-    GET_REQUEST_UNITS,
-    GET_REQUEST_VERSION,
+    SENSOR_REQUEST_LATENCY,
+    SENSOR_REQUEST_FAILURES,
+    SENSOR_DATA_AGE,
 )
-from .exceptions import AristonError
-from .helpers import log_update_error, service_signal
+from .helpers import get_request_for_parameter, service_signal
+from .transport import OUTCOME_OK, OUTCOME_ZERO_TEMPERATURE
 
 DEFAULT_ICON = "default_icon"
 DEFAULT_UNIT = 0
@@ -210,6 +218,171 @@ SENSORS = {
     PARAM_GAS_TYPE: [SENSOR_GAS_TYPE, None, {DEFAULT_ICON: "mdi:gas-cylinder"}],
     PARAM_GAS_COST: [SENSOR_GAS_COST, None, {DEFAULT_ICON: "mdi:cash"}],
     PARAM_ELECTRICITY_COST: [SENSOR_ELECTRICITY_COST, None, {DEFAULT_ICON: "mdi:cash"}],
+    PARAM_REQUEST_LATENCY: [SENSOR_REQUEST_LATENCY, 's', {DEFAULT_ICON: "mdi:timer-outline"}],
+    PARAM_REQUEST_FAILURES: [SENSOR_REQUEST_FAILURES, None, {DEFAULT_ICON: "mdi:alert-circle-outline"}],
+    PARAM_DATA_AGE: [SENSOR_DATA_AGE, 's', {DEFAULT_ICON: "mdi:clock-outline"}],
+}
+
+# Visible data of request groups used by sensors
+REQUEST_GROUP_DATA = {
+    REQUEST_GET_MAIN: "_ariston_data",
+    REQUEST_GET_CH: "_ariston_ch_data",
+    REQUEST_GET_DHW: "_ariston_dhw_data",
+    REQUEST_GET_ERROR: "_ariston_error_data",
+    REQUEST_GET_GAS: "_ariston_gas_data",
+    REQUEST_GET_OTHER: "_ariston_other_param",
+    REQUEST_GET_UNITS: "_ariston_units",
+    REQUEST_GET_CURRENCY: "_ariston_currency",
+    # diagnostics are not fetched data, they are collected when sensor is updated
+    REQUEST_DIAGNOSTICS: None,
+}
+
+
+# Extractors get visible data of sensor request group and return state, attributes and units (None to keep units)
+def _value(*path, convert=None):
+    """Extractor of value located by path of keys"""
+    def extract(data):
+        for key in path:
+            data = data[key]
+        if convert is not None:
+            data = convert[data]
+        return data, {}, None
+    return extract
+
+
+def _param_value(param_id, convert=None):
+    """Extractor of parameter value"""
+    return _value(param_id, "value", convert=convert)
+
+
+def _set_temperature(*path):
+    """Extractor of set temperature with its limits"""
+    def extract(data):
+        try:
+            for key in path:
+                data = data[key]
+            return data["value"], {"Min": "{} °C".format(data["min"]), "Max": "{} °C".format(data["max"])}, None
+        except KeyError:
+            return VAL_UNKNOWN, {"Min": "{} °C".format(""), "Max": "{} °C".format("")}, None
+    return extract
+
+
+def _energy_use(period, key):
+    """Extractor of energy use summed over periods"""
+    def extract(data):
+        values = [item[key] for item in data[period]["data"]]
+        attrs = {"Period" + str(iteration): value for iteration, value in enumerate(values, 1)}
+        return round(sum(values), 3), attrs, None
+    return extract
+
+
+def _cost(key):
+    """Extractor of energy cost in selected currency"""
+    def extract(data):
+        currency_symbol = next((item for item in data["currencySymbols"] if item["Key"] == data["currency"]), {})
+        currency_description = next((item for item in data["currencyOptions"] if
+                                     item["value"] == data["currency"]), {})
+        state = VAL_UNKNOWN if data[key] is None else str(data[key])
+        return state, {"currency": currency_description["text"]}, currency_symbol["Value"]
+    return extract
+
+
+def _errors(data):
+    """Extractor of errors count"""
+    return data["count"], {valid_error: "" for valid_error in data["result"]}, None
+
+
+def _gas_type(data):
+    """Extractor of gas type"""
+    type_fetch = next((item for item in data["gasTypeOptions"] if item["value"] == data["gasType"]), {})
+    currency_fetch = next((item for item in data["gasEnergyUnitOptions"] if
+                           item["value"] == data["gasEnergyUnit"]), {})
+    return type_fetch["text"], {}, currency_fetch["text"]
+
+
+def _time_program(data):
+    """Extractor of time program slices"""
+    attrs = {}
+    for day_of_week in DAYS_OF_WEEK:
+        if day_of_week in data:
+            for day_slices in data[day_of_week]["slices"]:
+                attribute_name = day_of_week + '_' + day_slices["from"] + '_' + day_slices["to"]
+                attrs[attribute_name] = "Comfort" if day_slices["temperatureId"] == 1 else "Economy"
+    return VAL_AVAILABLE, attrs, None
+
+
+def _request_latency(data):
+    """Extractor of average latency of main data requests with latency and queue wait of each request"""
+    attrs = {}
+    for request_type, metrics in sorted(data["requests"].items()):
+        if "latency" in metrics:
+            attrs[request_type.strip("_") + "_avg"] = metrics["latency"]["avg"]
+            attrs[request_type.strip("_") + "_max"] = metrics["latency"]["max"]
+        if "queue_wait" in metrics:
+            attrs[request_type.strip("_") + "_queue_wait_avg"] = metrics["queue_wait"]["avg"]
+    state = attrs.get(REQUEST_GET_MAIN.strip("_") + "_avg", VAL_UNKNOWN)
+    return state, attrs, None
+
+
+def _request_failures(data):
+    """Extractor of number of failed requests with counts of every outcome of each request"""
+    attrs = {}
+    failures = 0
+    for request_type, metrics in sorted(data["requests"].items()):
+        for outcome, count in sorted(metrics["outcomes"].items()):
+            attrs[request_type.strip("_") + "_" + outcome] = count
+            if outcome not in [OUTCOME_OK, OUTCOME_ZERO_TEMPERATURE]:
+                failures += count
+    return failures, attrs, None
+
+
+def _data_age(data):
+    """Extractor of age of main data with age of other data and tolerated zero temperatures"""
+    attrs = {request_type.strip("_"): age for request_type, age in data["data_age"].items()}
+    attrs.update({"zero_" + parameter: count for parameter, count in data["zero_temperature"].items()})
+    state = data["data_age"].get(REQUEST_GET_MAIN)
+    return VAL_UNKNOWN if state is None else state, attrs, None
+
+
+SENSOR_EXTRACTORS = {
+    PARAM_ACCOUNT_CH_GAS: _value("account", "gasHeat"),
+    PARAM_ACCOUNT_DHW_GAS: _value("account", "gasDhw"),
+    PARAM_ACCOUNT_CH_ELECTRICITY: _value("account", "elecHeat"),
+    PARAM_ACCOUNT_DHW_ELECTRICITY: _value("account", "elecDhw"),
+    PARAM_CH_ANTIFREEZE_TEMPERATURE: _value("zone", "antiFreezeTemp"),
+    PARAM_CH_DETECTED_TEMPERATURE: _value("zone", "roomTemp"),
+    PARAM_CH_MODE: _value("zone", "mode", "value", convert=VALUE_TO_CH_MODE),
+    PARAM_CH_SET_TEMPERATURE: _set_temperature("zone", "comfortTemp"),
+    PARAM_CH_PROGRAM: _time_program,
+    PARAM_CH_COMFORT_TEMPERATURE: _param_value(ARISTON_CH_COMFORT_TEMP),
+    PARAM_CH_ECONOMY_TEMPERATURE: _param_value(ARISTON_CH_ECONOMY_TEMP),
+    PARAM_DHW_PROGRAM: _time_program,
+    PARAM_DHW_COMFORT_FUNCTION: _param_value(ARISTON_DHW_COMFORT_FUNCTION, convert=DHW_COMFORT_VALUE_TO_FUNCT),
+    PARAM_DHW_SET_TEMPERATURE: _set_temperature("dhwTemp"),
+    PARAM_DHW_STORAGE_TEMPERATURE: _value("dhwStorageTemp"),
+    PARAM_DHW_COMFORT_TEMPERATURE: _value("dhwTimeProgComfortTemp", "value"),
+    PARAM_DHW_ECONOMY_TEMPERATURE: _value("dhwTimeProgEconomyTemp", "value"),
+    PARAM_DHW_MODE: _value("dhwMode", convert=VALUE_TO_DHW_MODE),
+    PARAM_ERRORS: _errors,
+    PARAM_HEATING_LAST_24H: _energy_use("daily", "y2"),
+    PARAM_HEATING_LAST_7d: _energy_use("weekly", "y2"),
+    PARAM_HEATING_LAST_30d: _energy_use("monthly", "y2"),
+    PARAM_HEATING_LAST_365d: _energy_use("yearly", "y2"),
+    PARAM_MODE: _value("mode", convert=VALUE_TO_MODE),
+    PARAM_OUTSIDE_TEMPERATURE: _value("outsideTemp"),
+    PARAM_SIGNAL_STRENGTH: _param_value(ARISTON_SIGNAL_STRENGHT),
+    PARAM_WATER_LAST_24H: _energy_use("daily", "y"),
+    PARAM_WATER_LAST_7D: _energy_use("weekly", "y"),
+    PARAM_WATER_LAST_30D: _energy_use("monthly", "y"),
+    PARAM_WATER_LAST_365D: _energy_use("yearly", "y"),
+    PARAM_UNITS: _value("measurementSystem", convert=VALUE_TO_UNIT),
+    PARAM_THERMAL_CLEANSE_CYCLE: _param_value(ARISTON_THERMAL_CLEANSE_CYCLE),
+    PARAM_GAS_TYPE: _gas_type,
+    PARAM_GAS_COST: _cost("gasCost"),
+    PARAM_ELECTRICITY_COST: _cost("electricityCost"),
+    PARAM_REQUEST_LATENCY: _request_latency,
+    PARAM_REQUEST_FAILURES: _request_failures,
+    PARAM_DATA_AGE: _data_age,
 }
 
 
@@ -242,7 +415,20 @@ class AristonSensor(Entity):
         self._attrs = {}
         self._unit_of_measurement = SENSORS[sensor_type][1]
         self._icon = SENSORS[sensor_type][2]
-        self._unsub_dispatcher = None
+        self._request_group = get_request_for_parameter(sensor_type)
+        self._data_attr = REQUEST_GROUP_DATA[self._request_group]
+        self._extractor = SENSOR_EXTRACTORS[sensor_type]
+        self._data_version = None
+        self._request_groups = [self._request_group]
+        if isinstance(self._unit_of_measurement, dict) and REQUEST_GET_UNITS not in self._request_groups:
+            # units might be selected automatically
+            self._request_groups.append(REQUEST_GET_UNITS)
+        self._unsub_dispatcher = []
+
+    @property
+    def should_poll(self):
+        """Return True if entity has to be polled for state."""
+        return not self._api._device[CONF_PUSH_UPDATES]
 
     @property
     def name(self):
@@ -257,6 +443,8 @@ class AristonSensor(Entity):
     @property
     def device_state_attributes(self):
         """Return the state attributes."""
+        if self._request_group in self._api._stale_groups:
+            return {**self._attrs, ATTR_STALE: True}
         return self._attrs
 
     @property
@@ -303,397 +491,51 @@ class AristonSensor(Entity):
     @property
     def available(self):
         """Return True if entity is available."""
-        if self._sensor_type in GET_REQUEST_ERRORS:
-            return self._api.available and self._api._ariston_error_data != {}
-        elif self._sensor_type in GET_REQUEST_CH_PROGRAM:
-            return self._api.available and self._api._ariston_ch_data != {}
-        elif self._sensor_type in GET_REQUEST_GAS:
-            return self._api.available and self._api._ariston_gas_data != {}
-        elif self._sensor_type in GET_REQUEST_PARAM:
-            return self._api.available and self._api._ariston_other_data != {}
-        elif self._sensor_type in GET_REQUEST_UNITS:
-            return self._api.available and self._api._ariston_units != {}
-        elif self._sensor_type in GET_REQUEST_CURRENCY:
-            return self._api.available and self._api._ariston_currency != {}
-        elif self._sensor_type in GET_REQUEST_DHW_PROGRAM:
-            return self._api.available and self._api._ariston_dhw_data != {}
-        else:
-            return self._api.available and self._api._ariston_data != {}
+        if self._data_attr is None:
+            # diagnostics are most useful while the server is not available
+            return True
+        return self._api.available and getattr(self._api, self._data_attr) != {}
 
     def update(self):
         """Get the latest data and updates the state."""
         if not self.available:
             return
+        # fetched data is never modified in place, so same version means same state and attributes
+        data_version = self._api._data_version[self._request_group]
+        if data_version == self._data_version and self._data_attr is not None:
+            return
+        self._data_version = data_version
         _LOGGER.debug("Updating %s sensor", self._name)
 
         try:
-            if self._sensor_type == PARAM_CH_DETECTED_TEMPERATURE:
-                try:
-                    self._state = self._api._ariston_data["zone"]["roomTemp"]
-                except KeyError:
-                    self._state = VAL_UNKNOWN
-                    pass
-
-            elif self._sensor_type == PARAM_CH_COMFORT_TEMPERATURE:
-                self._state = VAL_UNKNOWN
-                try:
-                    for param_item in self._api._ariston_other_data:
-                        if param_item["id"] == ARISTON_CH_COMFORT_TEMP:
-                            self._state = param_item["value"]
-                            break
-                except:
-                    pass
-
-            elif self._sensor_type == PARAM_CH_ECONOMY_TEMPERATURE:
-                self._state = VAL_UNKNOWN
-                try:
-                    for param_item in self._api._ariston_other_data:
-                        if param_item["id"] == ARISTON_CH_ECONOMY_TEMP:
-                            self._state = param_item["value"]
-                            break
-                except:
-                    pass
-
-            elif self._sensor_type == PARAM_CH_ANTIFREEZE_TEMPERATURE:
-                try:
-                    self._state = self._api._ariston_data["zone"]["antiFreezeTemp"]
-                except KeyError:
-                    self._state = VAL_UNKNOWN
-                    pass
-
-            elif self._sensor_type == PARAM_CH_MODE:
-                try:
-                    self._state = VALUE_TO_CH_MODE[self._api._ariston_data["zone"]["mode"]["value"]]
-                except KeyError:
-                    self._state = VAL_UNKNOWN
-                    pass
-
-            elif self._sensor_type == PARAM_CH_SET_TEMPERATURE:
-                try:
-                    self._state = self._api._ariston_data["zone"]["comfortTemp"]["value"]
-                    self._attrs["Min"] = "{} °C".format(self._api._ariston_data["zone"]["comfortTemp"]["min"])
-                    self._attrs["Max"] = "{} °C".format(self._api._ariston_data["zone"]["comfortTemp"]["max"])
-                except KeyError:
-                    self._state = VAL_UNKNOWN
-                    self._attrs["Min"] = "{} °C".format("")
-                    self._attrs["Max"] = "{} °C".format("")
-                    pass
-
-            elif self._sensor_type == PARAM_DHW_SET_TEMPERATURE:
-                try:
-                    self._state = self._api._ariston_data["dhwTemp"]["value"]
-                    self._attrs["Min"] = "{} °C".format(self._api._ariston_data["dhwTemp"]["min"])
-                    self._attrs["Max"] = "{} °C".format(self._api._ariston_data["dhwTemp"]["max"])
-                except KeyError:
-                    self._state = VAL_UNKNOWN
-                    self._attrs["Min"] = "{} °C".format("")
-                    self._attrs["Max"] = "{} °C".format("")
-                    pass
-
-            elif self._sensor_type == PARAM_MODE:
-                try:
-                    self._state = VALUE_TO_MODE[self._api._ariston_data["mode"]]
-                except KeyError:
-                    self._state = VAL_UNKNOWN
-                    pass
-
-            elif self._sensor_type == PARAM_DHW_STORAGE_TEMPERATURE:
-                try:
-                    self._state = self._api._ariston_data["dhwStorageTemp"]
-                except KeyError:
-                    self._state = VAL_UNKNOWN
-                    pass
-
-            elif self._sensor_type == PARAM_OUTSIDE_TEMPERATURE:
-                try:
-                    self._state = self._api._ariston_data["outsideTemp"]
-                except KeyError:
-                    self._state = VAL_UNKNOWN
-                    pass
-
-            elif self._sensor_type == PARAM_DHW_COMFORT_TEMPERATURE:
-                try:
-                    self._state = self._api._ariston_data["dhwTimeProgComfortTemp"]["value"]
-                except KeyError:
-                    self._state = VAL_UNKNOWN
-                    pass
-
-            elif self._sensor_type == PARAM_DHW_ECONOMY_TEMPERATURE:
-                try:
-                    self._state = self._api._ariston_data["dhwTimeProgEconomyTemp"]["value"]
-                except KeyError:
-                    self._state = VAL_UNKNOWN
-                    pass
-
-            elif self._sensor_type == PARAM_DHW_MODE:
-                try:
-                    self._state = VALUE_TO_DHW_MODE[self._api._ariston_data["dhwMode"]]
-                except KeyError:
-                    self._state = VAL_UNKNOWN
-                    pass
-
-            elif self._sensor_type == PARAM_ACCOUNT_CH_GAS:
-                try:
-                    self._state = self._api._ariston_gas_data["account"]["gasHeat"]
-                except KeyError:
-                    self._state = VAL_UNKNOWN
-                    pass
-
-            elif self._sensor_type == PARAM_ACCOUNT_DHW_GAS:
-                try:
-                    self._state = self._api._ariston_gas_data["account"]["gasDhw"]
-                except KeyError:
-                    self._state = VAL_UNKNOWN
-                    pass
-
-            elif self._sensor_type == PARAM_ACCOUNT_CH_ELECTRICITY:
-                try:
-                    self._state = self._api._ariston_gas_data["account"]["elecHeat"]
-                except KeyError:
-                    self._state = VAL_UNKNOWN
-                    pass
-
-            elif self._sensor_type == PARAM_ACCOUNT_DHW_ELECTRICITY:
-                try:
-                    self._state = self._api._ariston_gas_data["account"]["elecDhw"]
-                except KeyError:
-                    self._state = VAL_UNKNOWN
-                    pass
-
-            elif self._sensor_type == PARAM_ERRORS:
-                self._state = VAL_UNKNOWN
-                try:
-                    self._attrs = {}
-                    self._state = self._api._ariston_error_data["count"]
-                    for valid_error in self._api._ariston_error_data["result"]:
-                        self._attrs[valid_error] = ""
-                except KeyError:
-                    pass
-
-            elif self._sensor_type == PARAM_HEATING_LAST_24H:
-                try:
-                    sum = 0
-                    for iteration, item in enumerate(self._api._ariston_gas_data["daily"]["data"], 1):
-                        self._attrs["Period" + str(iteration)] = item["y2"]
-                        sum = sum + item["y2"]
-                    self._state = round(sum, 3)
-                except KeyError:
-                    self._state = VAL_UNKNOWN
-                    pass
-
-            elif self._sensor_type == PARAM_WATER_LAST_24H:
-                try:
-                    sum = 0
-                    for iteration, item in enumerate(self._api._ariston_gas_data["daily"]["data"], 1):
-                        self._attrs["Period" + str(iteration)] = item["y"]
-                        sum = sum + item["y"]
-                    self._state = round(sum, 3)
-                except KeyError:
-                    self._state = VAL_UNKNOWN
-                    pass
-
-            elif self._sensor_type == PARAM_HEATING_LAST_7d:
-                try:
-                    sum = 0
-                    for iteration, item in enumerate(self._api._ariston_gas_data["weekly"]["data"], 1):
-                        self._attrs["Period" + str(iteration)] = item["y2"]
-                        sum = sum + item["y2"]
-                    self._state = round(sum, 3)
-                except KeyError:
-                    self._state = VAL_UNKNOWN
-                    pass
-
-            elif self._sensor_type == PARAM_WATER_LAST_7D:
-                try:
-                    sum = 0
-                    for iteration, item in enumerate(self._api._ariston_gas_data["weekly"]["data"], 1):
-                        self._attrs["Period" + str(iteration)] = item["y"]
-                        sum = sum + item["y"]
-                    self._state = round(sum, 3)
-                except KeyError:
-                    self._state = VAL_UNKNOWN
-                    pass
-
-            elif self._sensor_type == PARAM_HEATING_LAST_30d:
-                try:
-                    sum = 0
-                    for iteration, item in enumerate(self._api._ariston_gas_data["monthly"]["data"], 1):
-                        self._attrs["Period" + str(iteration)] = item["y2"]
-                        sum = sum + item["y2"]
-                    self._state = round(sum, 3)
-                except KeyError:
-                    self._state = VAL_UNKNOWN
-                    pass
-
-            elif self._sensor_type == PARAM_WATER_LAST_30D:
-                try:
-                    sum = 0
-                    for iteration, item in enumerate(self._api._ariston_gas_data["monthly"]["data"], 1):
-                        self._attrs["Period" + str(iteration)] = item["y"]
-                        sum = sum + item["y"]
-                    self._state = round(sum, 3)
-                except KeyError:
-                    self._state = VAL_UNKNOWN
-                    pass
-
-            elif self._sensor_type == PARAM_HEATING_LAST_365d:
-                try:
-                    sum = 0
-                    for iteration, item in enumerate(self._api._ariston_gas_data["yearly"]["data"], 1):
-                        self._attrs["Period" + str(iteration)] = item["y2"]
-                        sum = sum + item["y2"]
-                    self._state = round(sum, 3)
-                except KeyError:
-                    self._state = VAL_UNKNOWN
-                    pass
-
-            elif self._sensor_type == PARAM_WATER_LAST_365D:
-                try:
-                    sum = 0
-                    for iteration, item in enumerate(self._api._ariston_gas_data["yearly"]["data"], 1):
-                        self._attrs["Period" + str(iteration)] = item["y"]
-                        sum = sum + item["y"]
-                    self._state = round(sum, 3)
-                except KeyError:
-                    self._state = VAL_UNKNOWN
-                    pass
-
-            elif self._sensor_type == PARAM_CH_PROGRAM:
-                try:
-                    if self._api._ariston_ch_data != {}:
-                        self._state = VAL_AVAILABLE
-                        for day_of_week in DAYS_OF_WEEK:
-                            if day_of_week in self._api._ariston_ch_data:
-                                for day_slices in self._api._ariston_ch_data[day_of_week]["slices"]:
-                                    attribute_name = day_of_week + '_' + day_slices["from"] + '_' + day_slices["to"]
-                                    if day_slices["temperatureId"] == 1:
-                                        attribute_value = "Comfort"
-                                    else:
-                                        attribute_value = "Economy"
-                                    self._attrs[attribute_name] = attribute_value
-                    else:
-                        self._state = VAL_UNKNOWN
-                except:
-                    self._state = VAL_UNKNOWN
-                    pass
-
-            elif self._sensor_type == PARAM_DHW_PROGRAM:
-                try:
-                    if self._api._ariston_dhw_data != {}:
-                        self._state = VAL_AVAILABLE
-                        for day_of_week in DAYS_OF_WEEK:
-                            if day_of_week in self._api._ariston_dhw_data:
-                                for day_slices in self._api._ariston_dhw_data[day_of_week]["slices"]:
-                                    attribute_name = day_of_week + '_' + day_slices["from"] + '_' + day_slices["to"]
-                                    if day_slices["temperatureId"] == 1:
-                                        attribute_value = "Comfort"
-                                    else:
-                                        attribute_value = "Economy"
-                                    self._attrs[attribute_name] = attribute_value
-                    else:
-                        self._state = VAL_UNKNOWN
-                except:
-                    self._state = VAL_UNKNOWN
-                    pass
-
-            elif self._sensor_type == PARAM_DHW_COMFORT_FUNCTION:
-                self._state = VAL_UNKNOWN
-                try:
-                    for param_item in self._api._ariston_other_data:
-                        if param_item["id"] == ARISTON_DHW_COMFORT_FUNCTION:
-                            self._state = DHW_COMFORT_VALUE_TO_FUNCT[param_item["value"]]
-                            break
-                except:
-                    pass
-
-            elif self._sensor_type == PARAM_SIGNAL_STRENGTH:
-                self._state = VAL_UNKNOWN
-                try:
-                    for param_item in self._api._ariston_other_data:
-                        if param_item["id"] == ARISTON_SIGNAL_STRENGHT:
-                            self._state = param_item["value"]
-                            break
-                except:
-                    pass
-
-            elif self._sensor_type == PARAM_THERMAL_CLEANSE_CYCLE:
-                self._state = VAL_UNKNOWN
-                try:
-                    for param_item in self._api._ariston_other_data:
-                        if param_item["id"] == ARISTON_THERMAL_CLEANSE_CYCLE:
-                            self._state = param_item["value"]
-                            break
-                except:
-                    pass
-
-            elif self._sensor_type == PARAM_UNITS:
-                try:
-                    self._state = VALUE_TO_UNIT[self._api._ariston_units["measurementSystem"]]
-                except:
-                    self._state = VAL_UNKNOWN
-                    pass
-
-            elif self._sensor_type == PARAM_GAS_TYPE:
-                try:
-                    type_fetch = next((item for item in self._api._ariston_currency["gasTypeOptions"] if
-                                       item["value"] == self._api._ariston_currency["gasType"]), {})
-                    currency_fetch = next((item for item in self._api._ariston_currency["gasEnergyUnitOptions"] if
-                                       item["value"] == self._api._ariston_currency["gasEnergyUnit"]), {})
-                    self._state = type_fetch["text"]
-                    self._unit_of_measurement = currency_fetch["text"]
-                except:
-                    self._state = VAL_UNKNOWN
-                    pass
-
-            elif self._sensor_type == PARAM_GAS_COST:
-                self._attrs = {}
-                try:
-                    currency_symbol = next((item for item in self._api._ariston_currency["currencySymbols"] if
-                                           item["Key"] == self._api._ariston_currency["currency"]), {})
-                    currency_description = next((item for item in self._api._ariston_currency["currencyOptions"] if
-                                            item["value"] == self._api._ariston_currency["currency"]), {})
-                    if self._api._ariston_currency["gasCost"] == None:
-                        self._state = VAL_UNKNOWN
-                    else:
-                        self._state = str(self._api._ariston_currency["gasCost"])
-                    self._unit_of_measurement = currency_symbol["Value"]
-                    self._attrs["currency"] = currency_description["text"]
-                except:
-                    self._state = VAL_UNKNOWN
-                    pass
-
-            elif self._sensor_type == PARAM_ELECTRICITY_COST:
-                self._attrs = {}
-                try:
-                    currency_symbol = next((item for item in self._api._ariston_currency["currencySymbols"] if
-                                           item["Key"] == self._api._ariston_currency["currency"]), {})
-                    currency_description = next((item for item in self._api._ariston_currency["currencyOptions"] if
-                                            item["value"] == self._api._ariston_currency["currency"]), {})
-                    if self._api._ariston_currency["gasCost"] == None:
-                        self._state = VAL_UNKNOWN
-                    else:
-                        self._state = str(self._api._ariston_currency["electricityCost"])
-                    self._unit_of_measurement = currency_symbol["Value"]
-                    self._attrs["currency"] = currency_description["text"]
-                except:
-                    self._state = VAL_UNKNOWN
-                    pass
-
-        except AristonError as error:
-            log_update_error(_LOGGER, "update", self.name, "sensor", error)
+            if self._data_attr is None:
+                data = self._api.diagnostics()
+            else:
+                data = getattr(self._api, self._data_attr)
+            state, attrs, unit = self._extractor(data)
+        except:
+            state, attrs, unit = VAL_UNKNOWN, {}, None
+        self._state = state
+        self._attrs = attrs
+        if unit is not None:
+            self._unit_of_measurement = unit
 
     async def async_on_demand_update(self):
         """Update state."""
         self.async_schedule_update_ha_state(True)
 
     async def async_added_to_hass(self):
-        """Subscribe to update signal."""
-        self._unsub_dispatcher = async_dispatcher_connect(
-            self.hass,
-            service_signal(SERVICE_UPDATE, self._signal_name),
-            self.async_on_demand_update,
-        )
+        """Subscribe to availability signal and to signals of used request groups."""
+        self._unsub_dispatcher = [
+            async_dispatcher_connect(
+                self.hass,
+                service_signal(SERVICE_UPDATE, self._signal_name, request_group),
+                self.async_on_demand_update,
+            )
+            for request_group in [None] + self._request_groups
+        ]
 
     async def async_will_remove_from_hass(self):
-        """Disconnect from update signal."""
-        self._unsub_dispatcher()
+        """Disconnect from update signals."""
+        for unsub_dispatcher in self._unsub_dispatcher:
+            unsub_dispatcher()
@@ -3,6 +3,7 @@ from datetime import timedelta
 
 from homeassistant.components.switch import SwitchEntity
 from homeassistant.const import CONF_SWITCHES, CONF_NAME
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 
 from .const import (
     ARISTON_INTERNET_TIME,
@@ -10,6 +11,8 @@ from .const import (
     ARISTON_CH_AUTO_FUNCTION,
     ARISTON_THERMAL_CLEANSE_FUNCTION,
     CONF_POWER_ON,
+    ATTR_STALE,
+    CONF_PUSH_UPDATES,
     DATA_ARISTON,
     DEVICES,
     PARAM_MODE,
@@ -34,7 +37,9 @@ from .const import (
     GET_REQUEST_PARAM,
     GET_REQUEST_UNITS,
     GET_REQUEST_VERSION,
+    SERVICE_UPDATE,
 )
+from .helpers import get_request_for_parameter, service_signal
 
 STATE_SCAN_INTERVAL_SECS = 2
 
@@ -76,12 +81,13 @@ class AristonSwitch(SwitchEntity):
         self._switch_type = switch_type
         self._signal_name = name
         self._state = None
-        self._unsub_dispatcher = None
+        self._request_groups = [get_request_for_parameter(switch_type)]
+        self._unsub_dispatcher = []
 
     @property
     def should_poll(self):
         """Return True if entity has to be polled for state."""
-        return True
+        return not self._api._device[CONF_PUSH_UPDATES]
 
     @property
     def name(self):
@@ -93,11 +99,18 @@ class AristonSwitch(SwitchEntity):
         """Return the state attributes."""
         return self._icon
 
+    @property
+    def device_state_attributes(self):
+        """Return the state attributes."""
+        if self._request_groups[0] in self._api._stale_groups:
+            return {ATTR_STALE: True}
+        return {}
+
     @property
     def available(self):
         """Return True if entity is available."""
         if self._switch_type in GET_REQUEST_PARAM:
-            return self._api.available and self._api._ariston_other_data != {}
+            return self._api.available and self._api._ariston_other_param != {}
         else:
             return self._api.available and self._api._ariston_data != {}
 
@@ -113,29 +126,25 @@ class AristonSwitch(SwitchEntity):
                 else:
                     status_on = True
             elif self._switch_type == PARAM_INTERNET_TIME:
-                for param_item in self._api._ariston_other_data:
-                    if param_item["id"] == ARISTON_INTERNET_TIME:
-                        if param_item["value"] == 1:
-                            status_on = True
-                            break
+                if ARISTON_INTERNET_TIME in self._api._ariston_other_param:
+                    param_item = self._api._ariston_other_param[ARISTON_INTERNET_TIME]
+                    if param_item["value"] == 1:
+                        status_on = True
             elif self._switch_type == PARAM_INTERNET_WEATHER:
-                for param_item in self._api._ariston_other_data:
-                    if param_item["id"] == ARISTON_INTERNET_WEATHER:
-                        if param_item["value"] == 1:
-                            status_on = True
-                            break
+                if ARISTON_INTERNET_WEATHER in self._api._ariston_other_param:
+                    param_item = self._api._ariston_other_param[ARISTON_INTERNET_WEATHER]
+                    if param_item["value"] == 1:
+                        status_on = True
             elif self._switch_type == PARAM_CH_AUTO_FUNCTION:
-                for param_item in self._api._ariston_other_data:
-                    if param_item["id"] == ARISTON_CH_AUTO_FUNCTION:
-                        if param_item["value"] == 1:
-                            status_on = True
-                            break
+                if ARISTON_CH_AUTO_FUNCTION in self._api._ariston_other_param:
+                    param_item = self._api._ariston_other_param[ARISTON_CH_AUTO_FUNCTION]
+                    if param_item["value"] == 1:
+                        status_on = True
             elif self._switch_type == PARAM_THERMAL_CLEANSE_FUNCTION:
-                for param_item in self._api._ariston_other_data:
-                    if param_item["id"] == ARISTON_THERMAL_CLEANSE_FUNCTION:
-                        if param_item["value"] == 1:
-                            status_on = True
-                            break
+                if ARISTON_THERMAL_CLEANSE_FUNCTION in self._api._ariston_other_param:
+                    param_item = self._api._ariston_other_param[ARISTON_THERMAL_CLEANSE_FUNCTION]
+                    if param_item["value"] == 1:
+                        status_on = True
         except:
             status_on = False
             pass
@@ -166,3 +175,23 @@ class AristonSwitch(SwitchEntity):
     def update(self):
         """Update data"""
         return
+
+    async def async_on_demand_update(self):
+        """Update state."""
+        self.async_schedule_update_ha_state(True)
+
+    async def async_added_to_hass(self):
+        """Subscribe to availability signal and to signals of used request groups."""
+        self._unsub_dispatcher = [
+            async_dispatcher_connect(
+                self.hass,
+                service_signal(SERVICE_UPDATE, self._signal_name, request_group),
+                self.async_on_demand_update,
+            )
+            for request_group in [None] + self._request_groups
+        ]
+
+    async def async_will_remove_from_hass(self):
+        """Disconnect from update signals."""
+        for unsub_dispatcher in self._unsub_dispatcher:
+            unsub_dispatcher()
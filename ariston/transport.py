@@ -0,0 +1,399 @@
+"""HTTP transport for Ariston component."""
+import asyncio
+import heapq
+import json
+import time
+
+import aiohttp
+
+try:
+    # faster decoder is used when available, e.g. installed with Home Assistant
+    import orjson
+
+    json_loads = orjson.loads
+    JSON_BACKEND = "orjson"
+except ImportError:
+    json_loads = json.loads
+    JSON_BACKEND = "json"
+
+
+class AristonResponse:
+    """Reply of the server with body already read from the connection"""
+
+    def __init__(self, status_code, url, content):
+        """Initialize."""
+        self.status_code = status_code
+        self.url = url
+        self.content = content
+
+    @property
+    def text(self):
+        """Return body as text"""
+        return self.content.decode("utf-8", "replace")
+
+    def json(self):
+        """Return body decoded from JSON, decoding errors are raised as ValueError"""
+        return json_loads(self.content)
+
+
+async def async_http_request(session, method, url, timeout, json_data=None):
+    """Send request and read whole reply so that connection is returned to the pool"""
+    async with session.request(
+            method,
+            url,
+            json=json_data,
+            timeout=aiohttp.ClientTimeout(total=timeout)) as resp:
+        content = await resp.read()
+        return AristonResponse(resp.status, str(resp.url), content)
+
+
+class TransportMetrics:
+    """Counters of connection reuse and transferred bytes of one http session"""
+
+    def __init__(self):
+        """Initialize."""
+        self.connections_new = 0
+        self.connections_reused = 0
+        # time to establish new connections including TCP and TLS handshakes
+        self.connect_time = 0.0
+        self.connect_time_max = 0.0
+        self.retries = 0
+        self.requests = {}
+        self.bytes_sent = {}
+        self.bytes_received = {}
+
+    def trace_config(self):
+        """Return trace configuration of http session to count connections"""
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_connection_create_start.append(self._on_connection_create_start)
+        trace_config.on_connection_create_end.append(self._on_connection_create_end)
+        trace_config.on_connection_reuseconn.append(self._on_connection_reuseconn)
+        return trace_config
+
+    async def _on_connection_create_start(self, session, trace_config_ctx, params):
+        """Remember start of new connection"""
+        trace_config_ctx.connect_start = time.monotonic()
+
+    async def _on_connection_create_end(self, session, trace_config_ctx, params):
+        """Count new connection and time to establish it"""
+        connect_time = time.monotonic() - trace_config_ctx.connect_start
+        self.connections_new += 1
+        self.connect_time += connect_time
+        self.connect_time_max = max(self.connect_time_max, connect_time)
+
+    async def _on_connection_reuseconn(self, session, trace_config_ctx, params):
+        """Count reused connection"""
+        self.connections_reused += 1
+
+    def count_request(self, request_type, bytes_sent, bytes_received):
+        """Count request and its transferred body bytes"""
+        self.requests[request_type] = self.requests.get(request_type, 0) + 1
+        self.bytes_sent[request_type] = self.bytes_sent.get(request_type, 0) + bytes_sent
+        self.bytes_received[request_type] = self.bytes_received.get(request_type, 0) + bytes_received
+
+    def as_dict(self):
+        """Return counters as dictionary"""
+        connections = self.connections_new + self.connections_reused
+        return {
+            "connections_new": self.connections_new,
+            "connections_reused": self.connections_reused,
+            "connections_reuse_ratio": round(self.connections_reused / connections, 3) if connections else 0.0,
+            "connect_time_avg": round(self.connect_time / self.connections_new, 3) if self.connections_new else 0.0,
+            "connect_time_max": round(self.connect_time_max, 3),
+            "retries": self.retries,
+            "requests": dict(self.requests),
+            "bytes_sent": dict(self.bytes_sent),
+            "bytes_received": dict(self.bytes_received),
+        }
+
+
+# upper bounds of latency histogram buckets in seconds, last bucket counts slower requests
+LATENCY_BUCKETS = [0.5, 1, 2, 4, 8, 16, 32]
+OUTCOME_OK = "ok"
+OUTCOME_TIMEOUT = "timeout"
+OUTCOME_HTTP_ERROR = "http_error"
+OUTCOME_INVALID_JSON = "invalid_json"
+OUTCOME_ERROR = "error"
+OUTCOME_ZERO_TEMPERATURE = "zero_temperature"
+
+
+class RequestMetrics:
+    """Latency, queue wait and outcomes of requests of one device per request type"""
+
+    def __init__(self):
+        """Initialize."""
+        self._latency = {}
+        self._queue_wait = {}
+        self._outcomes = {}
+        self._joined = {}
+
+    def observe_latency(self, request_type, latency):
+        """Add request duration to histogram"""
+        stats = self._latency.setdefault(
+            request_type, {"count": 0, "sum": 0.0, "max": 0.0, "buckets": [0] * (len(LATENCY_BUCKETS) + 1)})
+        stats["count"] += 1
+        stats["sum"] += latency
+        stats["max"] = max(stats["max"], latency)
+        for bucket, bound in enumerate(LATENCY_BUCKETS):
+            if latency <= bound:
+                break
+        else:
+            bucket = len(LATENCY_BUCKETS)
+        stats["buckets"][bucket] += 1
+
+    def observe_queue_wait(self, request_type, wait):
+        """Add time request waited for free slot of parallel requests"""
+        stats = self._queue_wait.setdefault(request_type, {"count": 0, "sum": 0.0, "max": 0.0})
+        stats["count"] += 1
+        stats["sum"] += wait
+        stats["max"] = max(stats["max"], wait)
+
+    def count_outcome(self, request_type, outcome):
+        """Count outcome of request"""
+        outcomes = self._outcomes.setdefault(request_type, {})
+        outcomes[outcome] = outcomes.get(outcome, 0) + 1
+
+    def count_joined(self, request_type):
+        """Count request which was not sent as the same request was already in progress"""
+        self._joined[request_type] = self._joined.get(request_type, 0) + 1
+
+    def as_dict(self):
+        """Return metrics as dictionary"""
+        result = {}
+        for request_type in set(self._latency) | set(self._queue_wait) | set(self._outcomes) | set(self._joined):
+            item = {"outcomes": dict(self._outcomes.get(request_type, {})), "joined": self._joined.get(request_type, 0)}
+            if request_type in self._latency:
+                stats = self._latency[request_type]
+                item["latency"] = {
+                    "count": stats["count"],
+                    "avg": round(stats["sum"] / stats["count"], 3),
+                    "max": round(stats["max"], 3),
+                    "buckets": {("<=" + str(bound)): count for bound, count in
+                                zip(LATENCY_BUCKETS, stats["buckets"])},
+                }
+                item["latency"]["buckets"][">" + str(LATENCY_BUCKETS[-1])] = stats["buckets"][-1]
+            if request_type in self._queue_wait:
+                stats = self._queue_wait[request_type]
+                item["queue_wait"] = {
+                    "count": stats["count"],
+                    "avg": round(stats["sum"] / stats["count"], 3),
+                    "max": round(stats["max"], 3),
+                }
+            result[request_type] = item
+        return result
+
+
+BREAKER_CLOSED = "closed"
+BREAKER_OPEN = "open"
+BREAKER_HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Stops requests of one plant after consecutive failures, recovery is tested with single probe request"""
+
+    def __init__(self, threshold, open_time, open_time_max):
+        """Initialize."""
+        self._threshold = threshold
+        self._open_time = open_time
+        self._open_time_max = open_time_max
+        self._open_for = open_time
+        self._open_until = 0.0
+        self.state = BREAKER_CLOSED
+        self.failures = 0
+        self.opened_count = 0
+
+    @property
+    def closed(self):
+        """Return if requests are sent as usual"""
+        return self.state == BREAKER_CLOSED
+
+    @property
+    def tripped(self):
+        """Return if circuit is open and failed again since opening, e.g. probe failed"""
+        return not self.closed and self.failures > self._threshold
+
+    def _open(self):
+        """Stop requests until open time passes"""
+        self.state = BREAKER_OPEN
+        self._open_until = time.monotonic() + self._open_for
+        self.opened_count += 1
+
+    def record_failure(self):
+        """Count failed request, return True if circuit has just been opened"""
+        self.failures += 1
+        if self.state == BREAKER_HALF_OPEN:
+            # server is still failing, wait longer before next probe
+            self._open_for = min(self._open_for * 2, self._open_time_max)
+            self._open()
+            return True
+        if self.state == BREAKER_CLOSED and self.failures >= self._threshold:
+            self._open()
+            return True
+        return False
+
+    def record_success(self):
+        """Reset failures, return True if circuit has just been closed"""
+        recovered = not self.closed
+        self.failures = 0
+        self._open_for = self._open_time
+        self.state = BREAKER_CLOSED
+        return recovered
+
+    def try_probe(self):
+        """Return True if single probe request may be sent, circuit becomes half open until its result"""
+        now = time.monotonic()
+        if self.state != BREAKER_CLOSED and now >= self._open_until:
+            # another probe is allowed after open time in case result of previous one was never recorded
+            self.state = BREAKER_HALF_OPEN
+            self._open_until = now + self._open_for
+            return True
+        return False
+
+    def time_to_probe(self):
+        """Return seconds until next probe request, zero when circuit is closed"""
+        if self.state == BREAKER_CLOSED:
+            return 0.0
+        return max(self._open_until - time.monotonic(), 0.0)
+
+    def as_dict(self):
+        """Return state as dictionary"""
+        return {
+            "state": self.state,
+            "failures": self.failures,
+            "opened_count": self.opened_count,
+            "time_to_probe": round(self.time_to_probe(), 1),
+        }
+
+
+class AristonSession:
+    """Http session with own connection pool and login state shared by devices of one account"""
+
+    def __init__(self, pool_size, keep_alive, retries, ssl_context=None, user_agent=None):
+        """Initialize, must be called from event loop."""
+        self.metrics = TransportMetrics()
+        connector = aiohttp.TCPConnector(limit_per_host=pool_size, keepalive_timeout=keep_alive, ssl=ssl_context)
+        headers = {aiohttp.hdrs.USER_AGENT: user_agent} if user_agent else None
+        self.session = aiohttp.ClientSession(
+            connector=connector, headers=headers, trace_configs=[self.metrics.trace_config()])
+        self.retries = retries
+        self.login_lock = asyncio.Lock()
+        # plant ID is known only while account is logged in
+        self.plant_id = ""
+        self.login_count = 0
+        self.login_time = 0.0
+
+    async def async_request(self, method, url, timeout, json_data=None, request_type="", limiter=None, priority=None):
+        """Send request, reading is repeated if connection breaks before reply, e.g. keep-alive closed by server"""
+        attempt = 0
+        while True:
+            try:
+                resp = await async_http_request(self.session, method, url, timeout, json_data)
+                break
+            except aiohttp.ClientConnectionError:
+                if method != "get" or attempt >= self.retries:
+                    raise
+                attempt += 1
+                self.metrics.retries += 1
+                if limiter is not None:
+                    # repeated reading is another request towards rate limit of the account
+                    await limiter.async_acquire(priority)
+        bytes_sent = len(json.dumps(json_data)) if json_data is not None else 0
+        self.metrics.count_request(request_type, bytes_sent, len(resp.content))
+        return resp
+
+    async def async_close(self, event=None):
+        """Close http session and its connections"""
+        await self.session.close()
+
+
+# priority classes of rate limiter, waiting requests of lower value are sent first
+PRIORITY_SET = 0
+PRIORITY_MAIN = 1
+PRIORITY_PARAM = 2
+PRIORITY_LOW = 3
+PRIORITY_NAMES = {PRIORITY_SET: "set", PRIORITY_MAIN: "main", PRIORITY_PARAM: "param", PRIORITY_LOW: "low"}
+
+
+class RateLimiter:
+    """Token bucket of requests shared by devices of one account, waiting requests are served by priority"""
+
+    def __init__(self, max_requests, window, burst):
+        """Initialize, must be called from event loop."""
+        self._rate = max_requests / window
+        self._burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._waiters = []
+        self._order = 0
+        self._wake_handle = None
+        self._queued_max = 0
+        self._stats = {
+            priority: {"acquired": 0, "delayed": 0, "dropped": 0, "wait": 0.0, "wait_max": 0.0}
+            for priority in PRIORITY_NAMES
+        }
+
+    def _refill(self):
+        """Add tokens for time passed since last refill"""
+        now = time.monotonic()
+        self._tokens = min(self._tokens + (now - self._updated) * self._rate, self._burst)
+        self._updated = now
+
+    def _dispatch(self):
+        """Release waiting requests while tokens are available, wake up again when next token is added"""
+        self._wake_handle = None
+        self._refill()
+        while self._waiters and self._tokens >= 1:
+            _, _, waiter = heapq.heappop(self._waiters)
+            if waiter.done():
+                # waiting was cancelled or timed out
+                continue
+            self._tokens -= 1
+            waiter.set_result(True)
+        if self._waiters:
+            self._wake_handle = asyncio.get_event_loop().call_later(
+                (1 - self._tokens) / self._rate, self._dispatch)
+
+    async def async_acquire(self, priority, max_wait=None):
+        """Wait for free token, return False if it was not available within max_wait seconds"""
+        stats = self._stats[priority]
+        self._refill()
+        if not self._waiters and self._tokens >= 1:
+            self._tokens -= 1
+            stats["acquired"] += 1
+            return True
+        wait_start = time.monotonic()
+        waiter = asyncio.get_event_loop().create_future()
+        self._order += 1
+        heapq.heappush(self._waiters, (priority, self._order, waiter))
+        self._queued_max = max(self._queued_max, len(self._waiters))
+        if self._wake_handle is None:
+            self._dispatch()
+        try:
+            await asyncio.wait_for(waiter, max_wait)
+        except asyncio.TimeoutError:
+            stats["dropped"] += 1
+            return False
+        wait = time.monotonic() - wait_start
+        stats["acquired"] += 1
+        stats["delayed"] += 1
+        stats["wait"] += wait
+        stats["wait_max"] = max(stats["wait_max"], wait)
+        return True
+
+    def as_dict(self):
+        """Return state and counters per priority class as dictionary"""
+        self._refill()
+        result = {
+            "tokens": round(self._tokens, 2),
+            "queued": sum(1 for _, _, waiter in self._waiters if not waiter.done()),
+            "queued_max": self._queued_max,
+        }
+        for priority, stats in self._stats.items():
+            result[PRIORITY_NAMES[priority]] = {
+                "acquired": stats["acquired"],
+                "delayed": stats["delayed"],
+                "dropped": stats["dropped"],
+                "wait_avg": round(stats["wait"] / stats["delayed"], 3) if stats["delayed"] else 0.0,
+                "wait_max": round(stats["wait_max"], 3),
+            }
+        return result
@@ -15,11 +15,14 @@ from homeassistant.const import (
     TEMP_CELSIUS,
     TEMP_FAHRENHEIT,
 )
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 
 from .const import (
     DATA_ARISTON,
     DEVICES,
     CONF_CONTROL_FROM_WATER_HEATER,
+    ATTR_STALE,
+    CONF_PUSH_UPDATES,
     CONF_LOCALIZATION,
     CONF_DHW_FLAME_UNKNOWN_ON,
     LANG_LOCATION,
@@ -46,7 +49,11 @@ from .const import (
     VALUE_TO_DHW_MODE,
     UNKNOWN_TEMP,
     INVALID_STORAGE_TEMP,
+    REQUEST_GET_MAIN,
+    REQUEST_GET_UNITS,
+    SERVICE_UPDATE,
 )
+from .helpers import service_signal
 
 """STATE_SCAN_INTERVAL_SECS is used to scan changes in JSON data as command in '__init__' is not for checking and updating sensors"""
 DEFAULT_MIN = 36.0
@@ -107,6 +114,9 @@ class AristonWaterHeater(WaterHeaterEntity):
         """Initialize the thermostat."""
         self._name = name
         self._api = device.api
+        self._signal_name = name
+        self._request_groups = [REQUEST_GET_MAIN, REQUEST_GET_UNITS]
+        self._unsub_dispatcher = []
         try:
             lang = self._api._device[CONF_LOCALIZATION]
             with open(LANG_LOCATION + 'backend.' + lang + '.json') as translation_file:
@@ -154,8 +164,8 @@ class AristonWaterHeater(WaterHeaterEntity):
 
     @property
     def should_poll(self):
-        """Polling is required."""
-        return True
+        """Polling is required unless updates are pushed."""
+        return not self._api._device[CONF_PUSH_UPDATES]
 
     @property
     def available(self):
@@ -250,6 +260,8 @@ class AristonWaterHeater(WaterHeaterEntity):
         except:
             pass
         data = {"target_temp_step": 1.0, "hvac_action": action}
+        if REQUEST_GET_MAIN in self._api._stale_groups:
+            data[ATTR_STALE] = True
         return data
 
     @property
@@ -335,3 +347,23 @@ class AristonWaterHeater(WaterHeaterEntity):
     def update(self):
         """Update all Node data from Hive."""
         return
+
+    async def async_on_demand_update(self):
+        """Update state."""
+        self.async_schedule_update_ha_state(True)
+
+    async def async_added_to_hass(self):
+        """Subscribe to availability signal and to signals of used request groups."""
+        self._unsub_dispatcher = [
+            async_dispatcher_connect(
+                self.hass,
+                service_signal(SERVICE_UPDATE, self._signal_name, request_group),
+                self.async_on_demand_update,
+            )
+            for request_group in [None] + self._request_groups
+        ]
+
+    async def async_will_remove_from_hass(self):
+        """Disconnect from update signals."""
+        for unsub_dispatcher in self._unsub_dispatcher:
+            unsub_dispatcher()
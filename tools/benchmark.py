@@ -0,0 +1,273 @@
+"""Benchmark of polling, parsing and entity refresh of Ariston component.
+
+Measures CPU time and allocations of decoding and processing of replies of each request group, preparation of
+set requests with different numbers of pending parameters, overlay of set values on fetched data and
+update of every entity against replies in tools/fixtures (or recorded with `store_config_files`).
+Results are written as JSON, comparison with previous results fails when any case becomes slower.
+
+Usage:
+    python tools/benchmark.py --output bench.json
+    python tools/benchmark.py --compare bench.json --threshold 1.25
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from homeassistant.const import (
+    CONF_BINARY_SENSORS,
+    CONF_NAME,
+    CONF_PASSWORD,
+    CONF_SENSORS,
+    CONF_SWITCHES,
+    CONF_USERNAME,
+)
+
+from ariston import ARISTON_SCHEMA, SET_PARAM_MAPPING, AristonChecker, AristonDevice
+from ariston.binary_sensor import BINARY_SENSORS, AristonBinarySensor
+from ariston.climate import AristonThermostat
+from ariston.const import (
+    CONF_MAX_RETRIES,
+    CONF_POLLING_RATE,
+    CONF_UNITS,
+    REQUEST_GET_CH,
+    REQUEST_GET_CURRENCY,
+    REQUEST_GET_DHW,
+    REQUEST_GET_ERROR,
+    REQUEST_GET_GAS,
+    REQUEST_GET_MAIN,
+    REQUEST_GET_OTHER,
+    REQUEST_GET_UNITS,
+    REQUEST_GET_VERSION,
+)
+from ariston.sensor import SENSORS, AristonSensor
+from ariston.switch import SWITCHES, AristonSwitch
+from ariston.transport import JSON_BACKEND, AristonResponse, json_loads
+from ariston.water_heater import AristonWaterHeater
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+DEFAULT_PREFIX = "data_ariston"
+NAME = "benchmark"
+# main data is processed first as other groups depend on it
+REQUEST_GET_ORDER = [REQUEST_GET_MAIN, REQUEST_GET_OTHER, REQUEST_GET_UNITS, REQUEST_GET_CH, REQUEST_GET_DHW,
+                     REQUEST_GET_ERROR, REQUEST_GET_GAS, REQUEST_GET_CURRENCY, REQUEST_GET_VERSION]
+VERSION_REPLY = b'{"tag_name": "v1.0.0"}'
+
+
+class _BenchmarkLoop:
+    """Event loop replacement which drops dispatcher signals, entities are updated by the benchmark itself"""
+
+    def call_soon_threadsafe(self, callback, *args):
+        """Ignore callback"""
+        return None
+
+
+class _BenchmarkHass:
+    """Minimal Home Assistant replacement needed to process data outside of running instance"""
+
+    def __init__(self):
+        """Initialize."""
+        self.data = {}
+        self.loop = _BenchmarkLoop()
+
+    def async_add_executor_job(self, target, *args):
+        """Run job at once"""
+        return target(*args)
+
+
+def _load_replies(fixtures, prefix):
+    """Return replies of the server per request group"""
+    replies = {REQUEST_GET_VERSION: AristonResponse(200, "", VERSION_REPLY)}
+    for request_type in REQUEST_GET_ORDER:
+        file_name = os.path.join(fixtures, prefix + request_type + ".json")
+        if os.path.isfile(file_name):
+            with open(file_name, "rb") as fixture:
+                replies[request_type] = AristonResponse(200, file_name, fixture.read())
+    return replies
+
+
+def _create_api(replies):
+    """Return checker with all entities enabled and data of replies processed"""
+    device = ARISTON_SCHEMA({
+        CONF_USERNAME: "benchmark@example.com",
+        CONF_PASSWORD: "benchmark",
+        CONF_NAME: NAME,
+        CONF_SENSORS: list(SENSORS),
+        CONF_BINARY_SENSORS: list(BINARY_SENSORS),
+        CONF_SWITCHES: list(SWITCHES),
+    })
+    api = AristonChecker(_BenchmarkHass(), device=device, name=NAME, username=device[CONF_USERNAME],
+                         password=device[CONF_PASSWORD], retries=device[CONF_MAX_RETRIES], store_file=False,
+                         units=device[CONF_UNITS], polling=device[CONF_POLLING_RATE], sensors=device[CONF_SENSORS],
+                         binary_sensors=device[CONF_BINARY_SENSORS], switches=device[CONF_SWITCHES])
+    api._login = True
+    api._plant_id = NAME
+    for request_type in REQUEST_GET_ORDER:
+        if request_type in replies:
+            api._store_data(replies[request_type], request_type)
+    return api
+
+
+def _create_entities(api):
+    """Return all entities of the checker"""
+    device = AristonDevice(api)
+    entities = [AristonThermostat(NAME, device), AristonWaterHeater(NAME, device)]
+    entities.extend(AristonSensor(NAME, device, sensor_type) for sensor_type in SENSORS)
+    entities.extend(AristonBinarySensor(NAME, device, sensor_type) for sensor_type in BINARY_SENSORS)
+    entities.extend(AristonSwitch(NAME, device, switch_type) for switch_type in SWITCHES)
+    return entities
+
+
+def _pending_parameters(api):
+    """Return values of all set parameters which differ from fetched data"""
+    fetched_data = {
+        REQUEST_GET_MAIN: api._ariston_data_actual,
+        REQUEST_GET_OTHER: api._ariston_other_param_actual,
+        REQUEST_GET_UNITS: api._ariston_units_actual
+    }
+    pending = {}
+    for parameter, (request_group, path, _, _) in SET_PARAM_MAPPING.items():
+        try:
+            value = fetched_data[request_group]
+            for key in path:
+                value = value[key]
+            pending[parameter] = 1 - value if value in [0, 1] else value + 1
+        except (KeyError, TypeError):
+            continue
+    return pending
+
+
+def _measure(func, iterations, setup=None):
+    """Return CPU time per call and allocations of one call, setup is not measured"""
+    cpu_time = 0.0
+    wall_time = 0.0
+    for _ in range(iterations):
+        if setup is not None:
+            setup()
+        cpu_start = time.process_time()
+        wall_start = time.perf_counter()
+        func()
+        wall_time += time.perf_counter() - wall_start
+        cpu_time += time.process_time() - cpu_start
+    if setup is not None:
+        setup()
+    tracemalloc.start()
+    func()
+    allocated, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "iterations": iterations,
+        "cpu_time_us": round(cpu_time / iterations * 1e6, 2),
+        "wall_time_us": round(wall_time / iterations * 1e6, 2),
+        "alloc_retained_bytes": allocated,
+        "alloc_peak_bytes": peak,
+    }
+
+
+def run(fixtures=FIXTURES, prefix=DEFAULT_PREFIX, iterations=200):
+    """Return results of all benchmark cases"""
+    replies = _load_replies(fixtures, prefix)
+    api = _create_api(replies)
+    results = {}
+
+    decoders = {"json": json.loads, JSON_BACKEND: json_loads}
+    for request_type in REQUEST_GET_ORDER:
+        if request_type not in replies:
+            continue
+
+        for backend, decoder in decoders.items():
+            def decode(decoder=decoder, content=replies[request_type].content):
+                decoder(content)
+
+            results["json_decode[{}][{}]".format(request_type, backend)] = _measure(decode, iterations)
+
+        def store(request_type=request_type):
+            api._store_data(replies[request_type], request_type)
+
+        def forget_reply(request_type=request_type):
+            api._get_content_hash.pop(request_type, None)
+
+        results["store_data[{}]".format(request_type)] = _measure(store, iterations, forget_reply)
+        results["store_data_unchanged[{}]".format(request_type)] = _measure(store, iterations)
+
+    pending = _pending_parameters(api)
+    for count in sorted({0, 1, 4, len(pending)}):
+        parameters = dict(list(pending.items())[:count])
+
+        def set_pending(parameters=parameters):
+            api._set_param = dict(parameters)
+            for request_type in api._set_time_start:
+                api._set_time_start[request_type] = time.time()
+
+        results["prepare_set_data[{}]".format(count)] = _measure(api._prepare_set_data, iterations, set_pending)
+        results["set_visible_data[{}]".format(count)] = _measure(api._set_visible_data, iterations, set_pending)
+    api._set_param = {}
+    api._set_visible_data()
+
+    def new_data():
+        for request_type in api._data_version:
+            api._data_version[request_type] += 1
+
+    for entity in _create_entities(api):
+        def update(entity=entity):
+            entity.update()
+            return entity.state
+
+        results["update[{}]".format(entity.name)] = _measure(update, iterations, new_data)
+    return results
+
+
+def compare(results, baseline, threshold):
+    """Return cases which became slower than baseline by more than threshold factor"""
+    regressions = {}
+    for case, result in results.items():
+        if case in baseline and baseline[case]["cpu_time_us"] > 0:
+            ratio = result["cpu_time_us"] / baseline[case]["cpu_time_us"]
+            if ratio > threshold:
+                regressions[case] = round(ratio, 2)
+    return regressions
+
+
+def main():
+    """Run benchmark and write or compare results"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--fixtures", default=FIXTURES, help="folder with recorded replies")
+    parser.add_argument("--prefix", default=DEFAULT_PREFIX, help="prefix of recorded files, e.g. data_boiler")
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--output", help="file to write results to, standard output if not set")
+    parser.add_argument("--compare", help="file with previous results")
+    parser.add_argument("--threshold", type=float, default=1.25,
+                        help="allowed slowdown factor against previous results")
+    args = parser.parse_args()
+
+    results = run(args.fixtures, args.prefix, args.iterations)
+    report = {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "iterations": args.iterations,
+        "json_backend": JSON_BACKEND,
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w") as output:
+            json.dump(report, output, indent=2, sort_keys=True)
+    else:
+        json.dump(report, sys.stdout, indent=2, sort_keys=True)
+        sys.stdout.write("\n")
+
+    if args.compare:
+        with open(args.compare) as previous:
+            regressions = compare(results, json.load(previous)["results"], args.threshold)
+        for case, ratio in sorted(regressions.items()):
+            sys.stderr.write("{} is {} times slower\n".format(case, ratio))
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,340 @@
+"""Local stand-in for Ariston NET remotethermo server replaying recorded replies.
+
+Replies are read from files named as files stored by the integration with `store_config_files`
+(for example `data_ariston_get_main.json`), so recordings of real plants can be replayed.
+Latency, server errors, timeouts and zero temperatures can be injected with fixed random seed
+to test polling, set retries and availability without the real server.
+
+Usage:
+    python tools/mock_server.py --port 8080 --latency 0.5 --error-rate 0.1 --zero-rate 0.05
+
+and `server_url: http://localhost:8080` in the integration configuration (use host name rather
+than IP address, cookies of IP addresses are ignored by the http client).
+"""
+import argparse
+import asyncio
+import copy
+import json
+import os
+import random
+import time
+import uuid
+
+from aiohttp import web
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+DEFAULT_PREFIX = "data_ariston"
+DEFAULT_PLANT_ID = "F0AD4E000000"
+SESSION_COOKIE = "ASP.NET_SessionId"
+
+REQUEST_GET_MAIN = "_get_main"
+REQUEST_GET_CH = "_get_ch"
+REQUEST_GET_DHW = "_get_dhw"
+REQUEST_GET_ERROR = "_get_error"
+REQUEST_GET_GAS = "_get_gas"
+REQUEST_GET_OTHER = "_get_param"
+REQUEST_GET_UNITS = "_get_units"
+REQUEST_GET_CURRENCY = "_get_currency"
+REQUEST_SET_MAIN = "_set_main"
+REQUEST_SET_OTHER = "_set_param"
+REQUEST_SET_UNITS = "_set_units"
+REQUEST_LOGIN = "_login"
+
+# parameters of time program which are also part of main data
+PARAM_IN_MAIN = {
+    "U6_9_1_0_0": "dhwTimeProgComfortTemp",
+    "U6_9_1_0_1": "dhwTimeProgEconomyTemp",
+}
+# temperature parameters which are occasionally reported as 0 by the real server
+ZERO_PARAMS = ["U6_3_1_0_0", "U6_3_1_0_1"]
+ZERO_MAIN = [["dhwStorageTemp"], ["dhwTemp", "value"], ["dhwTimeProgComfortTemp", "value"],
+             ["dhwTimeProgEconomyTemp", "value"], ["zone", "roomTemp"], ["zone", "comfortTemp", "value"]]
+ZERO_PROGRAM = [["comfortTemp", "value"], ["economyTemp", "value"]]
+
+
+def _set_path(data, path, value):
+    """Set value located by path of keys if it exists"""
+    for key in path[:-1]:
+        if not isinstance(data, dict) or key not in data:
+            return
+        data = data[key]
+    if isinstance(data, dict) and path[-1] in data:
+        data[path[-1]] = value
+
+
+class MockSettings:
+    """Injected behaviour of the server"""
+
+    def __init__(self, latency=0.0, jitter=0.0, error_rate=0.0, timeout_rate=0.0, timeout=60.0, zero_rate=0.0,
+                 invalid_json_rate=0.0, set_apply_delay=0.0, session_lifetime=0.0, seed=None):
+        """Initialize."""
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.timeout_rate = timeout_rate
+        self.timeout = timeout
+        self.zero_rate = zero_rate
+        self.invalid_json_rate = invalid_json_rate
+        self.set_apply_delay = set_apply_delay
+        self.session_lifetime = session_lifetime
+        self.seed = seed
+
+
+class MockAristonServer:
+    """Ariston server replaying recorded data and applying set requests to it"""
+
+    def __init__(self, settings=None, fixtures=FIXTURES, prefix=DEFAULT_PREFIX, plant_id=DEFAULT_PLANT_ID,
+                 host="localhost", port=0):
+        """Initialize."""
+        self.settings = settings if settings is not None else MockSettings()
+        self.plant_id = plant_id
+        self.host = host
+        self.port = port
+        self._random = random.Random(self.settings.seed)
+        self._sessions = {}
+        self._runner = None
+        self.data = {}
+        for request_type in [REQUEST_GET_MAIN, REQUEST_GET_CH, REQUEST_GET_DHW, REQUEST_GET_ERROR, REQUEST_GET_GAS,
+                             REQUEST_GET_OTHER, REQUEST_GET_UNITS, REQUEST_GET_CURRENCY]:
+            file_name = os.path.join(fixtures, prefix + request_type + ".json")
+            if os.path.isfile(file_name):
+                with open(file_name) as fixture:
+                    self.data[request_type] = json.load(fixture)
+        self.stats = {
+            "requests": {},
+            "errors": 0,
+            "timeouts": 0,
+            "invalid_json": 0,
+            "zero_replies": 0,
+            "expired_sessions": 0,
+        }
+
+    @property
+    def url(self):
+        """Return base url of running server"""
+        return "http://{}:{}".format(self.host, self.port)
+
+    def application(self):
+        """Return web application with routes of the real server"""
+        app = web.Application()
+        app.router.add_post("/Account/Login", self._login)
+        app.router.add_get("/Account/Login", self._login_page)
+        app.router.add_get("/PlantDashboard/Index/{plant}", self._dashboard)
+        app.router.add_get("/PlantDashboard/GetPlantData/{plant}", self._get_main)
+        app.router.add_get("/Menu/User/Refresh/{plant}", self._get_param)
+        app.router.add_get("/PlantPreference/GetData/{plant}", self._get(REQUEST_GET_UNITS))
+        app.router.add_get("/Error/ActiveDataSource/{plant}", self._get(REQUEST_GET_ERROR))
+        app.router.add_get("/Metering/GetData/{plant}", self._get(REQUEST_GET_GAS))
+        app.router.add_get("/Metering/GetCurrencySettings/{plant}", self._get(REQUEST_GET_CURRENCY))
+        app.router.add_get("/TimeProg/GetWeeklyPlan/{plant}", self._get_program)
+        app.router.add_post("/PlantDashboard/SetPlantAndZoneData/{plant}", self._set_main)
+        app.router.add_post("/Menu/User/Submit/{plant}", self._set_param)
+        app.router.add_post("/PlantPreference/SetData/{plant}", self._set_units)
+        app.router.add_get("/_mock/stats", self._get_stats)
+        return app
+
+    async def async_start(self):
+        """Start serving in running event loop"""
+        self._runner = web.AppRunner(self.application())
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, self.port)
+        await site.start()
+        if self.port == 0:
+            self.port = site._server.sockets[0].getsockname()[1]
+
+    async def async_stop(self):
+        """Stop serving"""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    def _count(self, request_type):
+        """Count received request"""
+        self.stats["requests"][request_type] = self.stats["requests"].get(request_type, 0) + 1
+
+    async def _inject(self):
+        """Delay reply and return injected failure reply if any"""
+        settings = self.settings
+        delay = settings.latency + (self._random.uniform(0, settings.jitter) if settings.jitter else 0.0)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        if self._random.random() < settings.timeout_rate:
+            self.stats["timeouts"] += 1
+            await asyncio.sleep(settings.timeout)
+        if self._random.random() < settings.error_rate:
+            self.stats["errors"] += 1
+            return web.Response(status=500, text="Internal Server Error")
+        return None
+
+    def _session_valid(self, request):
+        """Return if request belongs to logged in session"""
+        if self.settings.session_lifetime <= 0:
+            return True
+        started = self._sessions.get(request.cookies.get(SESSION_COOKIE))
+        if started is None or time.monotonic() - started > self.settings.session_lifetime:
+            self.stats["expired_sessions"] += 1
+            return False
+        return True
+
+    def _reply(self, data, zero_paths=None, zero_params=None):
+        """Return JSON reply, possibly with zero temperatures or broken JSON"""
+        if self._random.random() < self.settings.invalid_json_rate:
+            self.stats["invalid_json"] += 1
+            return web.Response(text="<html><body>Service unavailable</body></html>", content_type="text/html")
+        if (zero_paths or zero_params) and self._random.random() < self.settings.zero_rate:
+            self.stats["zero_replies"] += 1
+            data = copy.deepcopy(data)
+            for path in zero_paths or []:
+                _set_path(data, path, 0)
+            for item in data if zero_params else []:
+                if isinstance(item, dict) and item.get("id") in zero_params:
+                    item["value"] = 0
+        return web.json_response(data)
+
+    async def _login(self, request):
+        """Login with any credentials and redirect to plant dashboard"""
+        self._count(REQUEST_LOGIN)
+        failure = await self._inject()
+        if failure is not None:
+            return failure
+        session_id = uuid.uuid4().hex
+        self._sessions[session_id] = time.monotonic()
+        response = web.HTTPFound("/PlantDashboard/Index/" + self.plant_id)
+        response.set_cookie(SESSION_COOKIE, session_id)
+        raise response
+
+    async def _login_page(self, request):
+        """Login page shown after session expiry"""
+        return web.Response(text="<html><body>Login</body></html>", content_type="text/html")
+
+    async def _dashboard(self, request):
+        """Dashboard page shown after login"""
+        return web.Response(text="<html><body>Dashboard</body></html>", content_type="text/html")
+
+    def _get(self, request_type, zero_paths=None):
+        """Return handler replaying data of request type"""
+        async def handler(request):
+            self._count(request_type)
+            failure = await self._inject()
+            if failure is not None:
+                return failure
+            if not self._session_valid(request):
+                raise web.HTTPFound("/Account/Login")
+            if request_type not in self.data:
+                return web.json_response({})
+            return self._reply(self.data[request_type], zero_paths=zero_paths)
+        return handler
+
+    async def _get_main(self, request):
+        """Main data of the plant"""
+        return await self._get(REQUEST_GET_MAIN, ZERO_MAIN)(request)
+
+    async def _get_program(self, request):
+        """Time program of CH or DHW"""
+        if request.query.get("progId") == "Dhw":
+            return await self._get(REQUEST_GET_DHW, ZERO_PROGRAM)(request)
+        return await self._get(REQUEST_GET_CH, ZERO_PROGRAM)(request)
+
+    async def _get_param(self, request):
+        """Requested parameters only, in order of recorded data"""
+        self._count(REQUEST_GET_OTHER)
+        failure = await self._inject()
+        if failure is not None:
+            return failure
+        if not self._session_valid(request):
+            raise web.HTTPFound("/Account/Login")
+        param_ids = request.query.get("paramIds", "").split(",")
+        data = [item for item in self.data.get(REQUEST_GET_OTHER, []) if item["id"] in param_ids]
+        return self._reply(data, zero_params=ZERO_PARAMS)
+
+    async def _get_stats(self, request):
+        """Counters of received requests and injected failures"""
+        return web.json_response(self.stats)
+
+    def _apply(self, change):
+        """Apply change now or after delay as the real server does"""
+        if self.settings.set_apply_delay > 0:
+            asyncio.get_event_loop().call_later(self.settings.set_apply_delay, change)
+        else:
+            change()
+
+    async def _set(self, request, request_type, change):
+        """Common handling of set requests"""
+        self._count(request_type)
+        failure = await self._inject()
+        if failure is not None:
+            return failure
+        if not self._session_valid(request):
+            raise web.HTTPFound("/Account/Login")
+        try:
+            set_data = await request.json()
+        except ValueError:
+            return web.Response(status=400, text="Bad Request")
+        self._apply(lambda: change(set_data))
+        return web.json_response({"ok": True})
+
+    async def _set_main(self, request):
+        """Set main data from new values"""
+        def change(set_data):
+            main = self.data.get(REQUEST_GET_MAIN, {})
+            for key, value in set_data.get("NewValue", {}).items():
+                if key in main:
+                    main[key] = value
+        return await self._set(request, REQUEST_SET_MAIN, change)
+
+    async def _set_param(self, request):
+        """Set values of parameters, time program temperatures are also part of main data"""
+        def change(set_data):
+            params = {item["id"]: item for item in self.data.get(REQUEST_GET_OTHER, [])}
+            for item in set_data:
+                if item["id"] in params:
+                    params[item["id"]]["value"] = item["newValue"]
+                if item["id"] in PARAM_IN_MAIN:
+                    _set_path(self.data.get(REQUEST_GET_MAIN, {}), [PARAM_IN_MAIN[item["id"]], "value"],
+                              item["newValue"])
+        return await self._set(request, REQUEST_SET_OTHER, change)
+
+    async def _set_units(self, request):
+        """Set units"""
+        def change(set_data):
+            self.data.setdefault(REQUEST_GET_UNITS, {}).update(set_data)
+        return await self._set(request, REQUEST_SET_UNITS, change)
+
+
+def main():
+    """Run server until interrupted"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="localhost")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--fixtures", default=FIXTURES, help="folder with recorded replies")
+    parser.add_argument("--prefix", default=DEFAULT_PREFIX, help="prefix of recorded files, e.g. data_boiler")
+    parser.add_argument("--plant-id", default=DEFAULT_PLANT_ID)
+    parser.add_argument("--latency", type=float, default=0.0, help="delay of each reply in seconds")
+    parser.add_argument("--jitter", type=float, default=0.0, help="random extra delay up to given seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="probability of reply code 500")
+    parser.add_argument("--timeout-rate", type=float, default=0.0, help="probability of reply hanging")
+    parser.add_argument("--timeout", type=float, default=60.0, help="seconds of hanging reply")
+    parser.add_argument("--zero-rate", type=float, default=0.0, help="probability of zero temperatures")
+    parser.add_argument("--invalid-json-rate", type=float, default=0.0, help="probability of html instead of JSON")
+    parser.add_argument("--set-apply-delay", type=float, default=0.0, help="seconds until set values are visible")
+    parser.add_argument("--session-lifetime", type=float, default=0.0,
+                        help="seconds until login expires, 0 disables checking of login")
+    parser.add_argument("--seed", type=int, default=None, help="seed of injected failures")
+    args = parser.parse_args()
+    settings = MockSettings(
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        timeout_rate=args.timeout_rate,
+        timeout=args.timeout,
+        zero_rate=args.zero_rate,
+        invalid_json_rate=args.invalid_json_rate,
+        set_apply_delay=args.set_apply_delay,
+        session_lifetime=args.session_lifetime,
+        seed=args.seed)
+    server = MockAristonServer(settings, args.fixtures, args.prefix, args.plant_id, args.host, args.port)
+    web.run_app(server.application(), host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()